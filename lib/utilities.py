@@ -1,10 +1,18 @@
 # lib/utilities.py
 import logging
+import logging.handlers
+import queue
 import sys
 import os
 import re
+import socket
+import time
 import yaml
 import json
+try:
+    import orjson
+except ImportError:
+    orjson = None
 from netmiko import ConnectHandler
 from netmiko.exceptions import (
     NetmikoTimeoutException,
@@ -15,7 +23,13 @@ from parsers.juniper.juniper_mx204 import *
 from parsers.cisco.cisco_asr9910 import *
 from datetime import datetime
 import threading
+import multiprocessing
+import gc
 import traceback as tb
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, CancelledError, TimeoutError as FutureTimeoutError
+from concurrent.futures.process import BrokenProcessPool
+from collections import OrderedDict
+from functools import lru_cache
 from workflow_report_generator import *
 
 MIN_OUTPUT_CHARS = 5
@@ -168,6 +182,26 @@ def init_device_results(device_key: str, host: str, vendor: str, model: str, dev
 # ─────────────────────────────────────────────────────────────────────────────
 # get_show_version
 # ─────────────────────────────────────────────────────────────────────────────
+JUNOS_HOSTNAME_PATTERN = re.compile(r"^Hostname:\s+(\S+)", re.M)
+JUNOS_MODEL_PATTERN    = re.compile(r"^Model:\s+(\S+)", re.M)
+JUNOS_VERSION_PATTERN  = re.compile(r"^Junos:\s+(\S+)", re.M)
+XR_VERSION_PATTERN     = re.compile(r"Cisco IOS XR Software.*?Version\s+(\S+)", re.I)
+XR_HOSTNAME_PATTERN    = re.compile(r"^hostname\s+(\S+)", re.M | re.I)
+
+# vendor -> {field: pattern}; a field without a pattern stays ""
+SHOW_VERSION_PATTERNS = {
+    "juniper": {
+        "hostname": JUNOS_HOSTNAME_PATTERN,
+        "model":    JUNOS_MODEL_PATTERN,
+        "version":  JUNOS_VERSION_PATTERN,
+    },
+    "cisco": {
+        "version":  XR_VERSION_PATTERN,
+        "hostname": XR_HOSTNAME_PATTERN,
+    },
+}
+
+
 def get_show_version(device_key: str, conn, vendor: str, logger) -> bool:
     logger.info(f"[{device_key}] get_show_version — sending 'show version'")
 
@@ -176,31 +210,15 @@ def get_show_version(device_key: str, conn, vendor: str, logger) -> bool:
         if not output or len(output.strip()) <= MIN_OUTPUT_CHARS:
             raise RuntimeError("'show version' returned empty output")
 
-        hostname = ""
-        model    = ""
-        version  = ""
-
-        if vendor == "juniper":
-            m = re.search(r"^Hostname:\s+(\S+)", output, re.M)
-            if m:
-                hostname = m.group(1).strip()
-
-            m = re.search(r"^Model:\s+(\S+)", output, re.M)
+        fields = {"hostname": "", "model": "", "version": ""}
+        for field, pattern in SHOW_VERSION_PATTERNS.get(vendor, {}).items():
+            m = pattern.search(output)
             if m:
-                model = m.group(1).strip()
+                fields[field] = m.group(1).strip()
 
-            m = re.search(r"^Junos:\s+(\S+)", output, re.M)
-            if m:
-                version = m.group(1).strip()
-
-        elif vendor == "cisco":
-            m = re.search(r"Cisco IOS XR Software.*?Version\s+(\S+)", output, re.I)
-            if m:
-                version = m.group(1).strip()
-
-            m = re.search(r"^hostname\s+(\S+)", output, re.M | re.I)
-            if m:
-                hostname = m.group(1).strip()
+        hostname = fields["hostname"]
+        model    = fields["model"]
+        version  = fields["version"]
 
         device_results[device_key]["pre"]["show_version"] = {
             "status":    "ok",
@@ -238,10 +256,14 @@ def get_show_version(device_key: str, conn, vendor: str, logger) -> bool:
 # ─────────────────────────────────────────────────────────────────────────────
 # normalise / registry helpers
 # ─────────────────────────────────────────────────────────────────────────────
+@lru_cache(maxsize=512)
 def normalise(cmd: str) -> str:
-    cmd = re.sub(r'\s+', ' ', cmd.strip())
-    cmd = re.sub(r'\s*\|\s*', ' | ', cmd)
-    return cmd.lower()
+    # Collapse whitespace runs, then pad every pipe with exactly one space;
+    # plain str methods do both without the regex engine. Memoised because
+    # the same few dozen commands come back for every device and phase, so
+    # after the first device each lookup key is a cache hit.
+    cmd = ' '.join(cmd.split())
+    return ' | '.join(part.strip(' ') for part in cmd.split('|')).lower()
 
 
 def build_juniper_registries():
@@ -285,7 +307,7 @@ def build_juniper_registries():
         ("juniper", "show mpls lsp unidirectional | match dn | no-more"):                             parse_show_mpls_lsp_unidirectional_no_more,
     }
     return {
-        (vendor, normalise(cmd)): fn
+        (vendor, sys.intern(normalise(cmd))): fn
         for (vendor, cmd), fn in raw.items()
     }
 
@@ -316,7 +338,7 @@ def build_cisco_registries():
         ("cisco", "show version"):                            show_version,
     }
     return {
-        (vendor, normalise(cmd)): fn
+        (vendor, sys.intern(normalise(cmd))): fn
         for (vendor, cmd), fn in raw.items()
     }
 
@@ -327,45 +349,232 @@ VENDOR_REGISTRY = {
 }
 
 
+# ─────────────────────────────────────────────────────────────────────────────
+# parser process pool
+# Parsers are pure str -> dict functions, so they run in worker processes
+# shared by all device threads instead of competing for the GIL.
+# spawn (not fork) because the device threads hold live SSH sessions.
+# Workers gc.freeze() after import so the modules, compiled patterns and
+# registries are never rescanned by collections triggered while parsing.
+# parse_outputs waits at most PARSER_TIMEOUT_S on each result, so a parser
+# stuck backtracking on odd output fails that one command instead of stalling
+# the device. A stuck worker cannot be interrupted, so reset_parser_pool()
+# kills the whole pool and the next get_parser_pool() starts a fresh one;
+# otherwise shutdown at the end of the run would wait on it forever. Work
+# that was still queued on the killed pool, or lost to a crashed worker,
+# fails (BrokenProcessPool / cancelled) and parse_outputs resubmits it once.
+# ─────────────────────────────────────────────────────────────────────────────
+PARSER_WORKERS    = os.cpu_count() or 1
+PARSER_TIMEOUT_S  = 120
+_parser_pool      = None
+_parser_pool_lock = threading.Lock()
+
+
+def _discard_parser_pool(pool: ProcessPoolExecutor):
+    # shutdown(wait=False) alone leaves a stuck worker running and the exit
+    # hooks joining it, so the processes are terminated as well
+    procs = list((getattr(pool, "_processes", None) or {}).values())
+    pool.shutdown(wait=False, cancel_futures=True)
+    for proc in procs:
+        if proc.is_alive():
+            proc.terminate()
+
+
+def get_parser_pool() -> ProcessPoolExecutor:
+    global _parser_pool
+    with _parser_pool_lock:
+        if _parser_pool is not None and getattr(_parser_pool, "_broken", False):
+            _discard_parser_pool(_parser_pool)
+            _parser_pool = None
+        if _parser_pool is None:
+            _parser_pool = ProcessPoolExecutor(
+                max_workers=PARSER_WORKERS,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=gc.freeze,
+            )
+        return _parser_pool
+
+
+def reset_parser_pool(pool: ProcessPoolExecutor):
+    # Called after a result timed out in pool; a no-op if another thread
+    # already replaced it
+    global _parser_pool
+    with _parser_pool_lock:
+        if _parser_pool is not pool:
+            return
+        _parser_pool = None
+        _discard_parser_pool(pool)
+    drop_unfinished_parses()
+
+
+def shutdown_parser_pool():
+    global _parser_pool
+    with _parser_pool_lock:
+        if _parser_pool is not None:
+            _parser_pool.shutdown()
+            _parser_pool = None
+    clear_parse_caches()
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# parse result cache
+# The same output is often parsed more than once per run (aliased commands
+# such as "show rsvp session | match dn", unchanged pre/post output), and
+# parsers are pure, so repeats reuse the first future instead of another
+# round trip through the pool. The key is the output itself, so identical
+# output from similarly-configured devices is parsed once per run too.
+# Caching here rather than lru_cache on each parser: parsers run in worker
+# processes, where a per-function cache would only hit inside one worker.
+# Results are shared between entries and must be treated as read-only.
+# ─────────────────────────────────────────────────────────────────────────────
+PARSE_CACHE_SIZE  = 256
+_parse_cache      = OrderedDict()
+_parse_cache_lock = threading.Lock()
+
+
+def submit_parse(pool: ProcessPoolExecutor, parser_fn, output: str):
+    key = (parser_fn, output)
+    with _parse_cache_lock:
+        future = _parse_cache.get(key)
+        if future is not None:
+            _parse_cache.move_to_end(key)
+            return future
+        future = pool.submit(parser_fn, output)
+        _parse_cache[key] = future
+        if len(_parse_cache) > PARSE_CACHE_SIZE:
+            _parse_cache.popitem(last=False)
+    return future
+
+
+def forget_parse(parser_fn, output: str):
+    with _parse_cache_lock:
+        _parse_cache.pop((parser_fn, output), None)
+
+
+def drop_unfinished_parses():
+    # Pending futures of a discarded pool will only ever fail; finished
+    # results stay reusable
+    with _parse_cache_lock:
+        for key in [k for k, f in _parse_cache.items() if not f.done()]:
+            del _parse_cache[key]
+
+
+def clear_parse_caches():
+    with _parse_cache_lock:
+        _parse_cache.clear()
+
+
 # ─────────────────────────────────────────────────────────────────────────────
 # collect_outputs / parse_outputs
+# collect_outputs normally sends every command down the one device session.
+# With sessions > 1 and a conn_factory, commands are dealt round-robin across
+# that many sessions (the existing one plus sessions-1 extra logins), each on
+# its own thread since a Netmiko connection must not be shared. Any command
+# whose extra session failed to log in is re-sent on the main session, and
+# entries always come back in command order. Extra sessions are logged out
+# once their share is sent: collection runs once per device per run, so no
+# later call exists that a pooled session could be handed to.
+# Commands are not typed ahead down one channel: the aggregate would have to
+# be cut back apart on echoed prompts, and a large table (inet.0, mpls.0) that
+# happens to contain prompt-like text would corrupt its neighbours' output.
 # ─────────────────────────────────────────────────────────────────────────────
+_EMPTY = {}   # shared default for read-only .get() chains; never mutated
+
+
+def phase_commands(device_key: str, phase_key: str) -> list:
+    # Stored command entries for one phase, or () when the device or phase
+    # has none yet; the shared _EMPTY default avoids a throwaway dict per level.
+    return (
+        device_results
+        .get(device_key, _EMPTY)
+        .get(phase_key, _EMPTY)
+        .get("execute_show_commands", _EMPTY)
+        .get("commands", ())
+    )
+
+
+def send_show_command(device_key: str, conn, cmd: str, log) -> dict:
+    log.debug(f"[{device_key}] Sending: '{cmd}'")
+    exception_str = ""
+    output        = ""
+    try:
+        output = conn.send_command(cmd)
+        log.debug(f"[{device_key}] '{cmd}' — {len(output)} chars received")
+    except Exception:
+        exception_str = tb.format_exc()
+        log.error(f"[{device_key}] '{cmd}' send_command raised:\n{exception_str}")
+
+    stripped  = output.strip() if output else ""
+    collected = len(stripped) > MIN_OUTPUT_CHARS
+    log.info(f"[{device_key}] '{cmd}' collected={collected} ({len(stripped)} chars)")
+    # Plain dict on purpose: entries live in device_results, parse_outputs
+    # fills in "json"/"exception", and the summary JSON and HTML report read
+    # them as mappings
+    return {
+        "cmd":       cmd,
+        "output":    output,
+        "json":      {},
+        "exception": f"send_command failed for '{cmd}'" if exception_str else "",
+    }
+
+
 def collect_outputs(device_key: str, vendor: str, commands: list,
-                    check_type: str, conn, log) -> list:
+                    check_type: str, conn, log,
+                    sessions: int = 1, conn_factory=None) -> list:
 
     log.info(f"[{device_key}] collect_outputs — {len(commands)} command(s), check_type={check_type}")
 
     phase_key = "pre" if check_type == "pre" else "post"
-    device_results[device_key][phase_key]["execute_show_commands"]["status"] = "in_progress"
-
-    entries = []
-    for cmd in commands:
-        log.info(f"[{device_key}] Sending: '{cmd}'")
-        exception_str = ""
-        output        = ""
-        try:
-            output = conn.send_command(cmd)
-            print(f"[{device_key}] '{cmd}' — {len(output)} chars received")
-        except Exception:
-            exception_str = tb.format_exc()
-            log.error(f"[{device_key}] '{cmd}' send_command raised:\n{exception_str}")
-
-        stripped  = output.strip() if output else ""
-        collected = len(stripped) > MIN_OUTPUT_CHARS
-        entry = {
-            "cmd":       cmd,
-            "output":    output,
-            "json":      {},
-            "exception": f"send_command failed for '{cmd}'" if exception_str else "",
-        }
-        entries.append(entry)
-        log.info(f"[{device_key}] '{cmd}' collected={collected} ({len(stripped)} chars)")
-
-    device_results[device_key][phase_key]["execute_show_commands"]["commands"] = entries
+    step      = device_results[device_key][phase_key]["execute_show_commands"]
+    step["status"] = "in_progress"
+
+    sessions = min(sessions, len(commands))
+    if sessions > 1 and conn_factory is not None:
+        entries = [None] * len(commands)
+
+        def run_share(index: int):
+            worker_conn = conn
+            if index:
+                try:
+                    worker_conn = conn_factory(index)
+                except Exception as e:
+                    log.warning(f"[{device_key}] collect session {index} login failed — {e}")
+                    return
+            try:
+                for pos in range(index, len(commands), sessions):
+                    entries[pos] = send_show_command(device_key, worker_conn, commands[pos], log)
+            finally:
+                if worker_conn is not conn:
+                    logout_device(worker_conn, device_key, log)
+
+        with ThreadPoolExecutor(max_workers=sessions) as executor:
+            list(executor.map(run_share, range(sessions)))
+
+        for pos, entry in enumerate(entries):
+            if entry is None:
+                entries[pos] = send_show_command(device_key, conn, commands[pos], log)
+    else:
+        entries = [send_show_command(device_key, conn, cmd, log) for cmd in commands]
+
+    step["commands"] = entries
     log.info(f"[{device_key}] collect_outputs done — {len(entries)} entries stored")
     return entries
 
 
+def get_collected_output(device_key: str, check_type: str, cmd: str) -> str:
+    # Output already gathered by collect_outputs for this phase, so later
+    # steps can read it instead of sending the same command again;
+    # "" when the command was not in the list or came back empty.
+    phase_key = "pre" if check_type == "pre" else "post"
+    entries   = phase_commands(device_key, phase_key)
+    norm_cmd  = normalise(cmd)
+    for entry in entries:
+        output = entry.get("output") or ""
+        if normalise(entry.get("cmd")) == norm_cmd and len(output.strip()) > MIN_OUTPUT_CHARS:
+            return output
+    return ""
+
+
 def parse_outputs(device_key: str, vendor: str, check_type: str, log) -> bool:
 
     registry = VENDOR_REGISTRY.get(vendor)
@@ -374,22 +583,18 @@ def parse_outputs(device_key: str, vendor: str, check_type: str, log) -> bool:
         return False
 
     phase_key = "pre" if check_type == "pre" else "post"
-    entries = (
-        device_results
-        .get(device_key, {})
-        .get(phase_key, {})
-        .get("execute_show_commands", {})
-        .get("commands", [])
-    )
+    entries   = phase_commands(device_key, phase_key)
     if not entries:
         log.warning(f"[{device_key}] Nothing in {phase_key}.execute_show_commands.commands to parse")
         return False
 
-    all_ok = True
+    all_ok  = True
+    pool    = get_parser_pool()
+    pending = []
 
     for entry in entries:
         cmd      = entry.get("cmd")
-        output   = entry.get("output", "")
+        output   = entry.get("output") or ""
         norm_cmd = normalise(cmd)
 
         parser_fn = registry.get((vendor, norm_cmd))
@@ -397,20 +602,40 @@ def parse_outputs(device_key: str, vendor: str, check_type: str, log) -> bool:
             entry["exception"] = "no parser registered"
             continue
 
-        stripped = output.strip() if output else ""
-        if len(stripped) <= MIN_OUTPUT_CHARS:
+        if len(output.strip()) <= MIN_OUTPUT_CHARS:
             entry["json"]      = parser_fn("")
             entry["exception"] = ""
             continue
 
+        pending.append((entry, cmd, parser_fn, output, submit_parse(pool, parser_fn, output)))
+
+    for entry, cmd, parser_fn, output, future in pending:
         try:
-            result = parser_fn(output)
+            try:
+                result = future.result(timeout=PARSER_TIMEOUT_S)
+            except (BrokenProcessPool, CancelledError):
+                # worker crashed, or the pool was reset after another parser
+                # hung and this one was still queued: one more try on a
+                # fresh pool
+                log.warning(f"[{device_key}] parser pool broke during '{cmd}' — resubmitting")
+                forget_parse(parser_fn, output)
+                pool   = get_parser_pool()
+                result = submit_parse(pool, parser_fn, output).result(timeout=PARSER_TIMEOUT_S)
             if not result or (isinstance(result, dict) and all(not v for v in result.values())):
                 entry["exception"] = "parser returned empty result"
                 all_ok = False
                 continue
             entry["json"]      = result
             entry["exception"] = ""
+        except FutureTimeoutError:
+            forget_parse(parser_fn, output)
+            reset_parser_pool(pool)
+            pool = get_parser_pool()
+            entry["json"]      = {}
+            entry["exception"] = f"parser timeout for '{cmd}'"
+            log.error(f"[{device_key}] parser for '{cmd}' gave no result within {PARSER_TIMEOUT_S}s")
+            all_ok = False
+            continue
         except Exception:
             entry["json"]      = {}
             entry["exception"] = f"parser failed for '{cmd}'"
@@ -418,18 +643,23 @@ def parse_outputs(device_key: str, vendor: str, check_type: str, log) -> bool:
             all_ok = False
             continue
 
-    status = "completed" if all_ok else "completed_with_errors"
-    device_results[device_key][phase_key]["execute_show_commands"]["status"]    = status
-    device_results[device_key][phase_key]["execute_show_commands"]["exception"] = (
-        "" if all_ok else "one or more parsers failed"
-    )
+    step              = device_results[device_key][phase_key]["execute_show_commands"]
+    step["status"]    = "completed" if all_ok else "completed_with_errors"
+    step["exception"] = "" if all_ok else "one or more parsers failed"
 
     return all_ok
 
 
 # ─────────────────────────────────────────────────────────────────────────────
 # setup_logger
+# Device threads only enqueue records; one listener thread per log file does
+# the file writes, so a slow disk never stalls a session mid-command.
+# stop_log_listeners() drains and closes them at the end of the run.
 # ─────────────────────────────────────────────────────────────────────────────
+_log_listeners      = []
+_log_listeners_lock = threading.Lock()
+
+
 def setup_logger(name: str, vendor: str = "", model: str = ""):
     vendor = vendor or "unknown"
     model  = model  or "unknown"
@@ -448,13 +678,48 @@ def setup_logger(name: str, vendor: str = "", model: str = ""):
         datefmt="%Y-%m-%d_%H:%M:%S"
     )
     handler.setFormatter(formatter)
-    file_logger.addHandler(handler)
+    log_queue = queue.SimpleQueue()
+    listener  = logging.handlers.QueueListener(log_queue, handler)
+    listener.start()
+    with _log_listeners_lock:
+        _log_listeners.append(listener)
+    file_logger.addHandler(logging.handlers.QueueHandler(log_queue))
     return file_logger
 
 
+def stop_log_listeners():
+    with _log_listeners_lock:
+        listeners = _log_listeners[:]
+        _log_listeners.clear()
+    for listener in listeners:
+        listener.stop()
+        for handler in listener.handlers:
+            handler.close()
+
+
 # ─────────────────────────────────────────────────────────────────────────────
 # login / logout
+# Sessions carry a steady stream of short command writes, so Nagle is turned
+# off on the SSH socket (each write would otherwise wait on the previous
+# segment's ACK) and keepalives stop idle sessions being dropped during
+# long waits such as archive and snapshot commands.
 # ─────────────────────────────────────────────────────────────────────────────
+SSH_KEEPALIVE_SECS = 30
+
+
+def tune_transport(conn):
+    get_transport = getattr(conn.remote_conn, "get_transport", None)
+    if get_transport is None:
+        return
+    sock = get_transport().sock
+    if not isinstance(sock, socket.socket):
+        return
+    try:
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    except OSError:
+        pass
+
+
 def login_device(host, username, password, device_type, session_log_path, logger):
     try:
         logger.info(f"Connecting to {host} using Netmiko...")
@@ -464,7 +729,9 @@ def login_device(host, username, password, device_type, session_log_path, logger
             "username":    username,
             "password":    password,
             "session_log": session_log_path,
+            "keepalive":   SSH_KEEPALIVE_SECS,
         })
+        tune_transport(conn)
         logger.info(f"Login successful to {host}")
         return conn
     except NetmikoTimeoutException:
@@ -502,31 +769,58 @@ def load_yaml(filename):
 
 
 # ─────────────────────────────────────────────────────────────────────────────
-# export_device_summary
+# write_json / export_device_summary
+# orjson is optional; the stdlib encoder is the fallback.
+# A top-level dict (the all-devices summary) is written one value at a time,
+# re-indented to sit under its key, so only one device's encoding is held in
+# memory at once; the bytes match a single dumps of the whole dict.
+# json.dump already streams its chunks to the file.
 # ─────────────────────────────────────────────────────────────────────────────
-def export_device_summary(device_key: str):
+def write_json(path: str, data):
+    if orjson is not None:
+        option = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+        with open(path, "wb") as f:
+            if not isinstance(data, dict) or not data:
+                f.write(orjson.dumps(data, default=str, option=option))
+                return
+            separator = b"{\n  "
+            for key, value in data.items():
+                f.write(separator)
+                f.write(orjson.dumps(str(key)))
+                f.write(b": ")
+                f.write(orjson.dumps(value, default=str, option=option).replace(b"\n", b"\n  "))
+                separator = b",\n  "
+            f.write(b"\n}")
+        return
+    with open(path, "w") as f:
+        json.dump(data, f, indent=2, default=str)
+
+
+def export_device_summary(device_key: str, timestamp: str = None):
+    # timestamp lets a caller exporting several devices stamp them all alike;
+    # the JSON and HTML names always share one value either way.
     slot      = device_results.get(device_key, {})
     printable = {k: v for k, v in slot.items() if k != "conn"}
 
     with results_lock:
         all_devices_summary[device_key] = printable
+        snapshot = dict(all_devices_summary)
 
     output_dir = os.path.join(os.getcwd(), "precheck_jsons")
     os.makedirs(output_dir, exist_ok=True)
-    timestamp    = datetime.now().strftime('%Y-%m-%d_%H-%M-%S')
+    timestamp    = timestamp or datetime.now().strftime('%Y-%m-%d_%H-%M-%S')
     device_info  = slot.get("device_info", {})
     vendor       = device_info.get("vendor", "unknown")
     model        = device_info.get("model",  "unknown")
     summary_file = os.path.join(output_dir, f"{vendor}_{model}_{timestamp}.json")
-    with open(summary_file, "w") as f:
-        json.dump(all_devices_summary, f, indent=2, default=str)
+    write_json(summary_file, snapshot)
     print(f"[EXPORT] Summary JSON saved -> {summary_file}")
     print(f"[LOGS] Device log: logging/{vendor}_{model}_*.log | Session log: outputs/{vendor}_{model}_*.log")
 
     # ── HTML report ───────────────────────────────────────────────────────────
     reports_dir = os.path.join(os.getcwd(), "reports")
     os.makedirs(reports_dir, exist_ok=True)
-    generated   = generate_html_report(all_devices_summary, output_dir=reports_dir)
+    generated   = generate_html_report(snapshot, output_dir=reports_dir)
     html_name   = f"{vendor}_{model}_{timestamp}.html"
     html_path   = os.path.join(reports_dir, html_name)
     if generated and generated != html_path:
@@ -552,6 +846,40 @@ def merge_thread_result(device_key: str, result: dict):
         logger.info(f"[merge] device_key='{device_key}' merged into device_results")
 
 
+# ─────────────────────────────────────────────────────────────────────────────
+# session logs
+# Every login (pre-check and each post-reboot reconnect) gets its own session
+# log under outputs/; the directory is resolved and created on first use only.
+# ─────────────────────────────────────────────────────────────────────────────
+_session_log_dir = None
+
+
+def make_session_log_path(vendor: str, model: str, suffix: str = "") -> str:
+    global _session_log_dir
+    if _session_log_dir is None:
+        _session_log_dir = os.path.join(os.getcwd(), "outputs")
+        os.makedirs(_session_log_dir, exist_ok=True)
+    return os.path.join(
+        _session_log_dir,
+        f"{vendor}_{model}_{time.strftime('%Y-%m-%d_%H-%M-%S')}{suffix}.log"
+    )
+
+
+def open_collect_session(dev: dict, index: int, logger):
+    # Extra read-only session for collect_outputs; same credentials as
+    # connect(), its own session log so transcripts do not interleave
+    vendor = dev["vendor"].lower()
+    model  = str(dev["model"]).lower().replace("-", "")
+    return login_device(
+        device_type      = dev["device_type"],
+        host             = dev["host"],
+        username         = dev["username"],
+        password         = dev["password"],
+        session_log_path = make_session_log_path(vendor, model, suffix=f"_collect{index}"),
+        logger           = logger,
+    )
+
+
 # ─────────────────────────────────────────────────────────────────────────────
 # connect / disconnect
 # Used for the PRE-CHECK phase connection.
@@ -562,12 +890,7 @@ def connect(device_key: str, dev: dict, logger):
     vendor  = dev["vendor"].lower()
     model   = str(dev["model"]).lower().replace("-", "")
 
-    session_log_dir = os.path.join(os.getcwd(), "outputs")
-    os.makedirs(session_log_dir, exist_ok=True)
-    session_log_path = os.path.join(
-        session_log_dir,
-        f"{vendor}_{model}_{datetime.now().strftime('%Y-%m-%d_%H-%M-%S')}.log"
-    )
+    session_log_path = make_session_log_path(vendor, model)
 
     logger.info(f"[{device_key}] Connecting to {host}")
 
@@ -1,6 +1,7 @@
 # main.py
 import logging
 import sys
+import gc
 import threading
 import os
 from datetime import datetime
@@ -10,19 +11,23 @@ from lib.utilities import *
 from prechecks import PreCheck
 from upgrade import Upgrade, run_upgrade, run_rollback
 
-MAX_THREADS = 5
+# Device pipelines spend nearly all their time waiting on SSH, so threads
+# scale with the fleet; this only caps concurrent sessions.
+MAX_THREADS = 32
 
 
 # ─────────────────────────────────────────────────────────────────────────────
 # execute_show_commands
 # ─────────────────────────────────────────────────────────────────────────────
-def execute_show_commands(device_key, vendor, model, conn, check_type, logger):
+def execute_show_commands(device_key, vendor, model, conn, check_type, logger,
+                          sessions=1, conn_factory=None):
     commands = load_commands(vendor, model, logger)
     if not commands:
         logger.error(f"[{device_key}] execute_show_commands — no commands loaded, aborting")
         return False
 
-    entries = collect_outputs(device_key, vendor, commands, check_type, conn, logger)
+    entries = collect_outputs(device_key, vendor, commands, check_type, conn, logger,
+                              sessions=sessions, conn_factory=conn_factory)
     if not entries:
         logger.warning(f"[{device_key}] execute_show_commands — collect_outputs returned nothing")
 
@@ -49,7 +54,13 @@ def run_prechecks(conn, dev: dict, device_key: str, logger):
         print(f"[{device_key}] Executing show commands")
         logger.info(f"[{device_key}] Executing show commands")
 
-        exec_ok = execute_show_commands(device_key, vendor_lc, model_lc, conn, "pre", logger)
+        # collect_sessions (deviceDetails.yaml, default 1) opts a device into
+        # spreading the show commands over that many parallel SSH sessions
+        exec_ok = execute_show_commands(
+            device_key, vendor_lc, model_lc, conn, "pre", logger,
+            sessions     = dev.get("collect_sessions", 1),
+            conn_factory = lambda index: open_collect_session(dev, index, logger),
+        )
         if not exec_ok:
             msg = f"{host}: execute_show_commands() failed (collections/parsing)"
             logger.error(f"[{device_key}] STEP 1 EXECUTE failed — {msg}")
@@ -70,7 +81,15 @@ def run_prechecks(conn, dev: dict, device_key: str, logger):
 
         # ── STEP 3: Check storage ─────────────────────────────────────────────
         precheck = PreCheck(dev)
-        storage  = precheck.checkStorage(conn, min_disk_gb, logger)
+        try:
+            storage = precheck.checkStorage(conn, min_disk_gb, logger)
+        except Exception as e:
+            # checkStorage re-raises; record why here instead of letting the
+            # generic handler below swallow it without a step result
+            logger.error(f"[{device_key}] STEP 3 STORAGE failed — {e}")
+            device_results[device_key]["pre"]["check_storage"]["status"]    = "failed"
+            device_results[device_key]["pre"]["check_storage"]["exception"] = str(e)
+            return False
         if not storage:
             msg = f"{host}: checkStorage() failed"
             logger.error(f"[{device_key}] STEP 3 STORAGE failed — {msg}")
@@ -82,7 +101,8 @@ def run_prechecks(conn, dev: dict, device_key: str, logger):
 
         # ── STEP 4: Backup active filesystem (disk1 → disk2) ─────────────────
         try:
-            backup_disk = precheck.preBackupDisk(conn, logger)
+            vmhost_output = get_collected_output(device_key, "pre", "show vmhost version | no-more")
+            backup_disk   = precheck.preBackupDisk(conn, logger, vmhost_output)
             device_results[device_key]["pre"]["backup_active_filesystem"] = backup_disk
 
             if backup_disk.get("status") == "failed":
@@ -200,7 +220,7 @@ def run_prechecks(conn, dev: dict, device_key: str, logger):
 # ONE thread per device — owns everything from connect to report.
 # Thread lifecycle:
 #
-#   ThreadPoolExecutor (max 5 threads)
+#   ThreadPoolExecutor (one thread per device, max MAX_THREADS)
 #       └─ Thread-N  ←── ONE thread per device, never shared
 #             │
 #             ├─ init_device_results()       set up JSON slots
@@ -329,7 +349,11 @@ def main():
     all_devs         = devices["devices"]
     accepted_vendors = devices.get("accepted_vendors")
 
-    with ThreadPoolExecutor(max_workers=MAX_THREADS) as executor:
+    # Everything loaded so far lives for the whole run — keep it out of
+    # the GC generations the per-device threads churn through.
+    gc.freeze()
+
+    with ThreadPoolExecutor(max_workers=min(MAX_THREADS, len(all_devs)) or 1) as executor:
         futures = {
             executor.submit(run_device_pipeline, dev, accepted_vendors): dev
             for dev in all_devs
@@ -341,6 +365,8 @@ def main():
             except Exception as e:
                 print(f"[MAIN] Thread error for {dev.get('host')}: {e}")
 
+    shutdown_parser_pool()
+    stop_log_listeners()
     sys.exit(0)
 
 
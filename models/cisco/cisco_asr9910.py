@@ -5,7 +5,7 @@ from typing import List, Optional, Dict, Any
 # ---------------------------------------------------------------------------
 # ISIS
 # ---------------------------------------------------------------------------
-@dataclass
+@dataclass(slots=True)
 class ISISAdjacencies:
     systemID: str
     interface: str
@@ -17,8 +17,11 @@ class ISISAdjacencies:
     ipv4BFD: str
     ipv6BFD: str
 
+    def to_dict(self) -> dict:
+        return {name: getattr(self, name) for name in self.__slots__}
 
-@dataclass
+
+@dataclass(slots=True)
 class IsisAdjacencyEntry:
     SystemId: str
     Interface: str
@@ -31,7 +34,7 @@ class IsisAdjacencyEntry:
     IPv6BFD: str
 
 
-@dataclass
+@dataclass(slots=True)
 class IsisAdjacencyLevelBlock:
     Level: str
     TotalAdjacencyCount: int = 0
@@ -42,7 +45,7 @@ class IsisAdjacencyLevelBlock:
     IPv4BFDNonUpCount: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class IsisAdjacencyReport:
     Blocks: List[IsisAdjacencyLevelBlock] = field(default_factory=list)
     SourceFile: Optional[str] = None
@@ -52,7 +55,7 @@ class IsisAdjacencyReport:
 # ---------------------------------------------------------------------------
 # BFD
 # ---------------------------------------------------------------------------
-@dataclass
+@dataclass(slots=True)
 class BFDSession:
     interface: str
     dest_addr: str
@@ -67,7 +70,7 @@ class BFDSession:
     npu: str
 
 
-@dataclass
+@dataclass(slots=True)
 class ShowbfdSession:
     interface: str
     destAddr: str
@@ -76,21 +79,27 @@ class ShowbfdSession:
     npu: str
     state: str
 
+    def to_dict(self) -> dict:
+        return {name: getattr(self, name) for name in self.__slots__}
+
 
 # ---------------------------------------------------------------------------
 # Install Active Summary
 # ---------------------------------------------------------------------------
-@dataclass
+@dataclass(slots=True)
 class ShowInstallActiveSummary:
     Label: str
     AcivePackages: int
     Packages: List[str]
 
+    def to_dict(self) -> dict:
+        return {name: getattr(self, name) for name in self.__slots__}
+
 
 # ---------------------------------------------------------------------------
 # Route Summary
 # ---------------------------------------------------------------------------
-@dataclass
+@dataclass(slots=True)
 class ShowRouteSummary:
     routeSource: str
     routes: int
@@ -98,11 +107,14 @@ class ShowRouteSummary:
     deleted: int
     memory: int
 
+    def to_dict(self) -> dict:
+        return {name: getattr(self, name) for name in self.__slots__}
+
 
 # ---------------------------------------------------------------------------
 # BGP
 # ---------------------------------------------------------------------------
-@dataclass
+@dataclass(slots=True)
 class BgpProcessVersion:
     Process: str
     RcvTblVer: str
@@ -112,8 +124,11 @@ class BgpProcessVersion:
     SendTblVer: str
     StandbyVer: str
 
+    def to_dict(self) -> dict:
+        return {name: getattr(self, name) for name in self.__slots__}
 
-@dataclass
+
+@dataclass(slots=True)
 class BgpNeighbor:
     Neighbor: str
     Spk: str
@@ -126,8 +141,11 @@ class BgpNeighbor:
     UpDown: str
     StatePfxRcd: str
 
+    def to_dict(self) -> dict:
+        return {name: getattr(self, name) for name in self.__slots__}
+
 
-@dataclass
+@dataclass(slots=True)
 class ShowBgpAllSummary:
     RouterID: str
     LocalAS: str
@@ -136,8 +154,11 @@ class ShowBgpAllSummary:
     ProcessVersions: List[Dict[str, Any]]
     Neighbors: List[Dict[str, Any]]
 
+    def to_dict(self) -> dict:
+        return {name: getattr(self, name) for name in self.__slots__}
+
 
-@dataclass
+@dataclass(slots=True)
 class ShowBgpVrfAllSummary:
     VRF: str
     VRFState: str
@@ -149,11 +170,14 @@ class ShowBgpVrfAllSummary:
     MainTableVersion: str
     ProcessVersions: List[Dict[str, Any]]
 
+    def to_dict(self) -> dict:
+        return {name: getattr(self, name) for name in self.__slots__}
+
 
 # ---------------------------------------------------------------------------
 # IPv4 Interface Brief
 # ---------------------------------------------------------------------------
-@dataclass
+@dataclass(slots=True)
 class ShowIpv4VrfAllInterfaceBrief:
     Interface: str
     IPAddress: str
@@ -161,11 +185,14 @@ class ShowIpv4VrfAllInterfaceBrief:
     Protocol: str
     VrfName: str
 
+    def to_dict(self) -> dict:
+        return {name: getattr(self, name) for name in self.__slots__}
+
 
 # ---------------------------------------------------------------------------
 # MPLS LDP Neighbor
 # ---------------------------------------------------------------------------
-@dataclass
+@dataclass(slots=True)
 class ShowMplsLdpNeighbor:
     PeerLdpIdentifier: str
     LocalTCP: str
@@ -177,11 +204,14 @@ class ShowMplsLdpNeighbor:
     DiscoveryInterfaces: List[str]
     BoundIPv4Addresses: List[str]
 
+    def to_dict(self) -> dict:
+        return {name: getattr(self, name) for name in self.__slots__}
+
 
 # ---------------------------------------------------------------------------
 # PIM Neighbor
 # ---------------------------------------------------------------------------
-@dataclass
+@dataclass(slots=True)
 class PimNeighbor:
     vrf: str
     neighborAddress: str
@@ -194,11 +224,14 @@ class PimNeighbor:
     flags: List[str]
     flagsRaw: str
 
+    def to_dict(self) -> dict:
+        return {name: getattr(self, name) for name in self.__slots__}
+
 
 # ---------------------------------------------------------------------------
 # PFM Location
 # ---------------------------------------------------------------------------
-@dataclass
+@dataclass(slots=True)
 class ShowPfmLocationAll:
     Node: str
     CurrentTime: str
@@ -214,11 +247,14 @@ class ShowPfmLocationAll:
     DevicePath: str
     Handle: str
 
+    def to_dict(self) -> dict:
+        return {name: getattr(self, name) for name in self.__slots__}
+
 
 # ---------------------------------------------------------------------------
 # Processes CPU
 # ---------------------------------------------------------------------------
-@dataclass
+@dataclass(slots=True)
 class ShowProcessesCpu:
     PID: str
     OneMin: str
@@ -231,26 +267,38 @@ class ShowProcessesCpu:
     TTY: str = ""         # IOS only
     FifteenMin: str = ""  # XR only
 
+    def to_dict(self) -> dict:
+        return {name: getattr(self, name) for name in self.__slots__}
+
 # ---------------------------------------------------------------------------
 # Watchdog Memory State
 # ---------------------------------------------------------------------------
-@dataclass
+@dataclass(slots=True)
 class memoryInfo:
     physicalMem: str
     freeMem: str
     memoryState: str
 
+    def to_dict(self) -> dict:
+        return {name: getattr(self, name) for name in self.__slots__}
 
-@dataclass
+
+@dataclass(slots=True)
 class ShowWatchdogMemoryState:
     nodeName: str
     memoryInfo: List[memoryInfo]
 
+    def to_dict(self) -> dict:
+        return {
+            "nodeName": self.nodeName,
+            "memoryInfo": [m.to_dict() for m in self.memoryInfo],
+        }
+
 
 # ---------------------------------------------------------------------------
 # Memory Summary (not required per spec but kept for completeness)
 # ---------------------------------------------------------------------------
-@dataclass
+@dataclass(slots=True)
 class ShowMemorySummary:
     node: str
     physical_total: str
@@ -268,7 +316,7 @@ class ShowMemorySummary:
 # ---------------------------------------------------------------------------
 # Redundancy
 # ---------------------------------------------------------------------------
-@dataclass
+@dataclass(slots=True)
 class ShowRedundancy:
     ActiveNode: str
     StandbyNode: str
@@ -276,22 +324,28 @@ class ShowRedundancy:
     RedundancyMode: str
     LastSwitchover: str
 
+    def to_dict(self) -> dict:
+        return {name: getattr(self, name) for name in self.__slots__}
+
 
 # ---------------------------------------------------------------------------
 # Interfaces Description
 # ---------------------------------------------------------------------------
-@dataclass
+@dataclass(slots=True)
 class ShowInterfacesDescription:
     Interface: str
     Status: str
     Protocol: str
     Description: str
 
+    def to_dict(self) -> dict:
+        return {name: getattr(self, name) for name in self.__slots__}
+
 
 # ---------------------------------------------------------------------------
 # Filesystem
 # ---------------------------------------------------------------------------
-@dataclass
+@dataclass(slots=True)
 class ShowFileSystemEntry:
     sizeBytes: int
     freeBytes: int
@@ -300,19 +354,25 @@ class ShowFileSystemEntry:
     prefixesRaw: str
     prefixes: List[str]
 
+    def to_dict(self) -> dict:
+        return {name: getattr(self, name) for name in self.__slots__}
+
 
 # ---------------------------------------------------------------------------
 # Interfaces (Bundle-Ether)
 # ---------------------------------------------------------------------------
-@dataclass
+@dataclass(slots=True)
 class BundleMember:
     Interface: str
     Duplex: str
     Speed: str
     State: str
 
+    def to_dict(self) -> dict:
+        return {name: getattr(self, name) for name in self.__slots__}
+
 
-@dataclass
+@dataclass(slots=True)
 class ShowInterfacesBundleEther:
     Interface: str
     AdminState: str
@@ -327,11 +387,14 @@ class ShowInterfacesBundleEther:
     MemberCount: int
     Members: List[BundleMember]
 
+    def to_dict(self) -> dict:
+        return {name: getattr(self, name) for name in self.__slots__}
+
 
 # ---------------------------------------------------------------------------
 # MSDP Peer
 # ---------------------------------------------------------------------------
-@dataclass
+@dataclass(slots=True)
 class ShowMsdpPeer:
     PeerAddress: str
     AS: str
@@ -341,11 +404,14 @@ class ShowMsdpPeer:
     ConnectionSource: str
     RPFPeer: str
 
+    def to_dict(self) -> dict:
+        return {name: getattr(self, name) for name in self.__slots__}
+
 
 # ---------------------------------------------------------------------------
 # L2VPN XConnect Brief
 # ---------------------------------------------------------------------------
-@dataclass
+@dataclass(slots=True)
 class ShowL2vpnXconnectBrief:
     LikeToLike_UP: int
     LikeToLike_DOWN: int
@@ -357,8 +423,11 @@ class ShowL2vpnXconnectBrief:
     Total_DOWN: int
     Total_UNRESOLVED: int
 
+    def to_dict(self) -> dict:
+        return {name: getattr(self, name) for name in self.__slots__}
+
 
-@dataclass
+@dataclass(slots=True)
 class L2vpnXconnectBriefRow:
     domain: str
     category: str
@@ -368,7 +437,7 @@ class L2vpnXconnectBriefRow:
     unresolved: int
 
 
-@dataclass
+@dataclass(slots=True)
 class L2vpnXconnectBriefSummary:
     totalUp: int
     totalDown: int
@@ -378,7 +447,7 @@ class L2vpnXconnectBriefSummary:
 # ---------------------------------------------------------------------------
 # HW Module FPD
 # ---------------------------------------------------------------------------
-@dataclass
+@dataclass(slots=True)
 class FPDEntry:
     Location: str
     CardType: str
@@ -387,33 +456,42 @@ class FPDEntry:
     ATRstatus: str
     FPDVersions: dict
 
+    def to_dict(self) -> dict:
+        return {name: getattr(self, name) for name in self.__slots__}
+
 
 # ---------------------------------------------------------------------------
 # Platform
 # ---------------------------------------------------------------------------
-@dataclass
+@dataclass(slots=True)
 class ShowPlatform:
     Node: str
     Type: str
     State: str
     ConfigState: str
 
+    def to_dict(self) -> dict:
+        return {name: getattr(self, name) for name in self.__slots__}
+
 
 # ---------------------------------------------------------------------------
 # Media Location
 # ---------------------------------------------------------------------------
-@dataclass
+@dataclass(slots=True)
 class ShowMediaLocation:
     Disk: str
     Size: str
     Used: str
     Free: str
 
+    def to_dict(self) -> dict:
+        return {name: getattr(self, name) for name in self.__slots__}
+
 
 # ---------------------------------------------------------------------------
 # Version
 # ---------------------------------------------------------------------------
-@dataclass
+@dataclass(slots=True)
 class ShowVersion:
     Version: str
     Uptime: str
@@ -421,4 +499,7 @@ class ShowVersion:
     Processor: str
     SerialNumber: str
     ROM: str
-    BuildInfo: str
\ No newline at end of file
+    BuildInfo: str
+
+    def to_dict(self) -> dict:
+        return {name: getattr(self, name) for name in self.__slots__}
@@ -1,5 +1,5 @@
 import sys
-from dataclasses import dataclass, field, asdict
+from dataclasses import dataclass, field
 from typing import List, Dict, Any, Union, Optional
 
 
@@ -7,7 +7,7 @@ from typing import List, Dict, Any, Union, Optional
 # show arp no-resolve | no-more
 # ────────────────────────────────────────────────────────────────────────────────
 
-@dataclass
+@dataclass(slots=True)
 class ShowArpNoResolveEntry:
     mac_address: str
     ip_address: str
@@ -38,7 +38,7 @@ class ShowArpNoResolve:
 # show lldp neighbors | no-more
 # ────────────────────────────────────────────────────────────────────────────────
 
-@dataclass
+@dataclass(slots=True)
 class ShowLldpNeighborsEntry:
     local_interface: str
     parent_interface: str
@@ -69,7 +69,7 @@ class ShowLldpNeighbors:
 # show chassis routing-engine | no-more
 # ────────────────────────────────────────────────────────────────────────────────
 
-@dataclass
+@dataclass(slots=True)
 class CpuUtilization:
     user: Optional[int] = None
     background: Optional[int] = None
@@ -78,17 +78,17 @@ class CpuUtilization:
     idle: Optional[int] = None
 
     def to_dict(self) -> dict:
-        return {k: v for k, v in self.__dict__.items()}
+        return {name: getattr(self, name) for name in self.__slots__}
 
 
-@dataclass
+@dataclass(slots=True)
 class LoadAverages:
     one_minute: Optional[float] = None
     five_minute: Optional[float] = None
     fifteen_minute: Optional[float] = None
 
     def to_dict(self) -> dict:
-        return {k: v for k, v in self.__dict__.items()}
+        return {name: getattr(self, name) for name in self.__slots__}
 
 
 @dataclass
@@ -137,7 +137,7 @@ class ShowChassisRoutingEngine:
 # show system uptime | no-more
 # ────────────────────────────────────────────────────────────────────────────────
 
-@dataclass
+@dataclass(slots=True)
 class ShowSystemUptime:
     current_time: Optional[str] = None
     time_source: Optional[str] = None
@@ -156,14 +156,14 @@ class ShowSystemUptime:
     load_average_15min: Optional[float] = None
 
     def to_dict(self) -> dict:
-        return {k: v for k, v in self.__dict__.items()}
+        return {name: getattr(self, name) for name in self.__slots__}
 
 
 # ────────────────────────────────────────────────────────────────────────────────
 # show ntp associations no-resolve | no-more
 # ────────────────────────────────────────────────────────────────────────────────
 
-@dataclass
+@dataclass(slots=True)
 class NtpAssociation:
     remote: Optional[str] = None
     refid: Optional[str] = None
@@ -180,7 +180,7 @@ class NtpAssociation:
     rootdisp: Optional[float] = None
 
     def to_dict(self) -> dict:
-        return {k: v for k, v in self.__dict__.items()}
+        return {name: getattr(self, name) for name in self.__slots__}
 
 
 @dataclass
@@ -195,7 +195,7 @@ class ShowNtpAssociations:
 # show vmhost version | no-more
 # ────────────────────────────────────────────────────────────────────────────────
 
-@dataclass
+@dataclass(slots=True)
 class VmhostVersionSet:
     version_set: Optional[str] = None
     vmhost_version: Optional[str] = None
@@ -205,7 +205,7 @@ class VmhostVersionSet:
     junos_disk: Optional[str] = None
 
     def to_dict(self) -> dict:
-        return {k: v for k, v in self.__dict__.items()}
+        return {name: getattr(self, name) for name in self.__slots__}
 
 
 @dataclass
@@ -238,7 +238,7 @@ class ShowVmhostVersion:
 # show vmhost snapshot | no-more
 # ────────────────────────────────────────────────────────────────────────────────
 
-@dataclass
+@dataclass(slots=True)
 class VMHostSnapshotVersion:
     version_set: Optional[str] = None
     vmhost_version: Optional[str] = None
@@ -248,7 +248,7 @@ class VMHostSnapshotVersion:
     junos_disk: Optional[str] = None
 
     def to_dict(self) -> dict:
-        return {k: v for k, v in self.__dict__.items()}
+        return {name: getattr(self, name) for name in self.__slots__}
 
 
 @dataclass
@@ -271,7 +271,7 @@ class VMHostSnapshot:
 # show chassis hardware | no-more
 # ────────────────────────────────────────────────────────────────────────────────
 
-@dataclass
+@dataclass(slots=True)
 class ChassisHardwareItem:
     item: Optional[str] = None
     version: Optional[str] = None
@@ -281,7 +281,7 @@ class ChassisHardwareItem:
     indent_level: Optional[int] = None
 
     def to_dict(self) -> dict:
-        return {k: v for k, v in self.__dict__.items()}
+        return {name: getattr(self, name) for name in self.__slots__}
 
 
 @dataclass
@@ -296,7 +296,7 @@ class ChassisHardware:
 # show chassis fpc detail | no-more
 # ────────────────────────────────────────────────────────────────────────────────
 
-@dataclass
+@dataclass(slots=True)
 class ChassisFpcDetail:
     slot: Optional[int] = None
     state: Optional[str] = None
@@ -311,7 +311,7 @@ class ChassisFpcDetail:
     pfes_in_high_performance_mode: Optional[str] = None
 
     def to_dict(self) -> dict:
-        return {k: v for k, v in self.__dict__.items()}
+        return {name: getattr(self, name) for name in self.__slots__}
 
 
 @dataclass
@@ -326,14 +326,14 @@ class ShowChassisFpcDetail:
 # show chassis alarms | no-more
 # ────────────────────────────────────────────────────────────────────────────────
 
-@dataclass
+@dataclass(slots=True)
 class ChassisAlarm:
     alarm_time: Optional[str] = None
     alarm_class: Optional[str] = None
     alarm_description: Optional[str] = None
 
     def to_dict(self) -> dict:
-        return {k: v for k, v in self.__dict__.items()}
+        return {name: getattr(self, name) for name in self.__slots__}
 
 
 @dataclass
@@ -354,7 +354,7 @@ class ShowChassisAlarms:
 # show system alarms | no-more
 # ────────────────────────────────────────────────────────────────────────────────
 
-@dataclass
+@dataclass(slots=True)
 class SystemAlarm:
     alarm_time: Optional[str] = None
     alarm_class: Optional[str] = None
@@ -362,7 +362,7 @@ class SystemAlarm:
     alarm_source: Optional[str] = None
 
     def to_dict(self) -> dict:
-        return {k: v for k, v in self.__dict__.items()}
+        return {name: getattr(self, name) for name in self.__slots__}
 
 
 @dataclass
@@ -383,7 +383,7 @@ class ShowSystemAlarms:
 # show chassis environment | no-more
 # ────────────────────────────────────────────────────────────────────────────────
 
-@dataclass
+@dataclass(slots=True)
 class EnvironmentItem:
     item_class: Optional[str] = None
     item_name: Optional[str] = None
@@ -391,7 +391,7 @@ class EnvironmentItem:
     measurement: Optional[str] = None
 
     def to_dict(self) -> dict:
-        return {k: v for k, v in self.__dict__.items()}
+        return {name: getattr(self, name) for name in self.__slots__}
 
 
 @dataclass
@@ -406,7 +406,7 @@ class ShowChassisEnvironment:
 # show system resource-monitor fpc | no-more
 # ────────────────────────────────────────────────────────────────────────────────
 
-@dataclass
+@dataclass(slots=True)
 class PfeResourceUsage:
     pfe_number: Optional[int] = None
     encap_mem_free_percent: Optional[str] = None
@@ -414,7 +414,7 @@ class PfeResourceUsage:
     fw_mem_free_percent: Optional[int] = None
 
     def to_dict(self) -> dict:
-        return {k: v for k, v in self.__dict__.items()}
+        return {name: getattr(self, name) for name in self.__slots__}
 
 
 @dataclass
@@ -451,7 +451,7 @@ class ShowSystemResourceMonitorFpc:
 # show system processes extensive | match rpd | no-more
 # ────────────────────────────────────────────────────────────────────────────────
 
-@dataclass
+@dataclass(slots=True)
 class RpdProcessEntry:
     pid: int
     user: str
@@ -466,7 +466,7 @@ class RpdProcessEntry:
     thread_name: str
 
     def to_dict(self) -> dict:
-        return {k: v for k, v in self.__dict__.items()}
+        return {name: getattr(self, name) for name in self.__slots__}
 
 
 @dataclass
@@ -485,7 +485,7 @@ class ShowSystemProcessesRpd:
 # show interface terse | no-more
 # ────────────────────────────────────────────────────────────────────────────────
 
-@dataclass
+@dataclass(slots=True)
 class InterfaceEntry:
     interface: str
     admin: str
@@ -495,7 +495,7 @@ class InterfaceEntry:
     remote: str = ""
 
     def to_dict(self) -> dict:
-        return {k: v for k, v in self.__dict__.items()}
+        return {name: getattr(self, name) for name in self.__slots__}
 
 
 @dataclass
@@ -514,7 +514,7 @@ class ShowInterfacesTerse:
 # show oam ethernet connectivity-fault-management interfaces extensive | no-more
 # ────────────────────────────────────────────────────────────────────────────────
 
-@dataclass
+@dataclass(slots=True)
 class OamCfmInterface:
     interface_name: Optional[str] = None
     interface_status: Optional[str] = None
@@ -535,7 +535,7 @@ class OamCfmInterface:
     mep_status: Optional[str] = None
 
     def to_dict(self) -> dict:
-        return {k: v for k, v in self.__dict__.items()}
+        return {name: getattr(self, name) for name in self.__slots__}
 
 
 @dataclass
@@ -550,7 +550,7 @@ class ShowOamCfmInterfaces:
 # show vrrp summary | no-more
 # ────────────────────────────────────────────────────────────────────────────────
 
-@dataclass
+@dataclass(slots=True)
 class ShowVrrpSummaryAddress:
     type: str
     address: str
@@ -559,7 +559,7 @@ class ShowVrrpSummaryAddress:
         return {"type": self.type, "address": self.address}
 
 
-@dataclass
+@dataclass(slots=True)
 class ShowVrrpSummaryEntry:
     interface: str
     state: str
@@ -591,7 +591,7 @@ class ShowVrrpSummary:
 # show bfd session | no-more
 # ────────────────────────────────────────────────────────────────────────────────
 
-@dataclass
+@dataclass(slots=True)
 class ShowBfdSessionEntry:
     address: str
     state: str
@@ -601,7 +601,7 @@ class ShowBfdSessionEntry:
     multiplier: str
 
     def to_dict(self) -> dict:
-        return {k: v for k, v in self.__dict__.items()}
+        return {name: getattr(self, name) for name in self.__slots__}
 
 
 @dataclass
@@ -626,7 +626,7 @@ class ShowBfdSession:
 # show rsvp neighbor | no-more
 # ────────────────────────────────────────────────────────────────────────────────
 
-@dataclass
+@dataclass(slots=True)
 class ShowRsvpNeighborEntry:
     address: str
     idle: int
@@ -637,7 +637,7 @@ class ShowRsvpNeighborEntry:
     msg_rcvd: int
 
     def to_dict(self) -> dict:
-        return {k: v for k, v in self.__dict__.items()}
+        return {name: getattr(self, name) for name in self.__slots__}
 
 
 @dataclass
@@ -656,7 +656,7 @@ class ShowRsvpNeighbor:
 # show rsvp session | no-more
 # ────────────────────────────────────────────────────────────────────────────────
 
-@dataclass
+@dataclass(slots=True)
 class RsvpSessionIngressEntry:
     to: str
     from_: str
@@ -668,10 +668,10 @@ class RsvpSessionIngressEntry:
     lsp_name: str
 
     def to_dict(self) -> dict:
-        return {k: v for k, v in self.__dict__.items()}
+        return {name: getattr(self, name) for name in self.__slots__}
 
 
-@dataclass
+@dataclass(slots=True)
 class RsvpSessionEgressEntry:
     to: str
     from_: str
@@ -683,10 +683,10 @@ class RsvpSessionEgressEntry:
     lsp_name: str
 
     def to_dict(self) -> dict:
-        return {k: v for k, v in self.__dict__.items()}
+        return {name: getattr(self, name) for name in self.__slots__}
 
 
-@dataclass
+@dataclass(slots=True)
 class RsvpSessionTransitEntry:
     to: str
     from_: str
@@ -698,7 +698,7 @@ class RsvpSessionTransitEntry:
     lsp_name: str
 
     def to_dict(self) -> dict:
-        return {k: v for k, v in self.__dict__.items()}
+        return {name: getattr(self, name) for name in self.__slots__}
 
 
 @dataclass
@@ -737,7 +737,7 @@ class ShowRsvpSession:
 # show route table inet.0 | no-more
 # ────────────────────────────────────────────────────────────────────────────────
 
-@dataclass
+@dataclass(slots=True)
 class RouteEntry:
     destination: str
     protocol: str
@@ -749,7 +749,7 @@ class RouteEntry:
     flags: str = ""
 
     def to_dict(self) -> dict:
-        return {k: v for k, v in self.__dict__.items()}
+        return {name: getattr(self, name) for name in self.__slots__}
 
 
 @dataclass
@@ -778,17 +778,17 @@ class RouteTableData:
 # show route table inet.3 | no-more
 # ────────────────────────────────────────────────────────────────────────────────
 
-@dataclass
+@dataclass(slots=True)
 class ShowRouteTableInet3NextHop:
     to: str
     via: str
     mpls_label: str = ""
 
     def to_dict(self) -> dict:
-        return {k: v for k, v in self.__dict__.items()}
+        return {name: getattr(self, name) for name in self.__slots__}
 
 
-@dataclass
+@dataclass(slots=True)
 class ShowRouteTableInet3Entry:
     destination: str
     protocol: str
@@ -832,7 +832,7 @@ class ShowRouteTableInet3:
 # show route table mpls.0 | no-more
 # ────────────────────────────────────────────────────────────────────────────────
 
-@dataclass
+@dataclass(slots=True)
 class ShowRouteTableMpls0NextHop:
     to: Optional[str] = None
     via: Optional[str] = None
@@ -841,10 +841,10 @@ class ShowRouteTableMpls0NextHop:
     lsp_name: Optional[str] = None
 
     def to_dict(self) -> dict:
-        return {k: v for k, v in self.__dict__.items()}
+        return {name: getattr(self, name) for name in self.__slots__}
 
 
-@dataclass
+@dataclass(slots=True)
 class ShowRouteTableMpls0Entry:
     label: str = ""
     protocol: str = ""
@@ -888,14 +888,14 @@ class ShowRouteTableMpls0:
 # show mpls interface | no-more
 # ────────────────────────────────────────────────────────────────────────────────
 
-@dataclass
+@dataclass(slots=True)
 class ShowMplsInterfaceEntry:
     interface: str
     state: str
     administrative_groups: str
 
     def to_dict(self) -> dict:
-        return {k: v for k, v in self.__dict__.items()}
+        return {name: getattr(self, name) for name in self.__slots__}
 
 
 @dataclass
@@ -910,7 +910,7 @@ class ShowMplsInterface:
 # show mpls lsp | no-more
 # ────────────────────────────────────────────────────────────────────────────────
 
-@dataclass
+@dataclass(slots=True)
 class MplsLspIngressEntry:
     to: str
     from_: str
@@ -921,10 +921,10 @@ class MplsLspIngressEntry:
     lsp_name: str
 
     def to_dict(self) -> dict:
-        return {k: v for k, v in self.__dict__.items()}
+        return {name: getattr(self, name) for name in self.__slots__}
 
 
-@dataclass
+@dataclass(slots=True)
 class MplsLspEgressEntry:
     to: str
     from_: str
@@ -936,10 +936,10 @@ class MplsLspEgressEntry:
     lsp_name: str
 
     def to_dict(self) -> dict:
-        return {k: v for k, v in self.__dict__.items()}
+        return {name: getattr(self, name) for name in self.__slots__}
 
 
-@dataclass
+@dataclass(slots=True)
 class MplsLspTransitEntry:
     to: str
     from_: str
@@ -951,7 +951,7 @@ class MplsLspTransitEntry:
     lsp_name: str
 
     def to_dict(self) -> dict:
-        return {k: v for k, v in self.__dict__.items()}
+        return {name: getattr(self, name) for name in self.__slots__}
 
 
 @dataclass
@@ -990,7 +990,7 @@ class ShowMplsLsp:
 # show mpls lsp p2mp | no-more
 # ────────────────────────────────────────────────────────────────────────────────
 
-@dataclass
+@dataclass(slots=True)
 class P2MPIngressBranch:
     to: str
     from_: str
@@ -1001,10 +1001,10 @@ class P2MPIngressBranch:
     lsp_name: str
 
     def to_dict(self) -> dict:
-        return {k: v for k, v in self.__dict__.items()}
+        return {name: getattr(self, name) for name in self.__slots__}
 
 
-@dataclass
+@dataclass(slots=True)
 class P2MPEgressBranch:
     to: str
     from_: str
@@ -1016,10 +1016,10 @@ class P2MPEgressBranch:
     lsp_name: str
 
     def to_dict(self) -> dict:
-        return {k: v for k, v in self.__dict__.items()}
+        return {name: getattr(self, name) for name in self.__slots__}
 
 
-@dataclass
+@dataclass(slots=True)
 class P2MPTransitBranch:
     to: str
     from_: str
@@ -1031,7 +1031,7 @@ class P2MPTransitBranch:
     lsp_name: str
 
     def to_dict(self) -> dict:
-        return {k: v for k, v in self.__dict__.items()}
+        return {name: getattr(self, name) for name in self.__slots__}
 
 
 @dataclass
@@ -1090,7 +1090,7 @@ class ShowMplsLspP2MP:
 # show isis adjacency extensive | no-more
 # ────────────────────────────────────────────────────────────────────────────────
 
-@dataclass
+@dataclass(slots=True)
 class ShowIsisAdjacencyTransition:
     when: str
     state: str
@@ -1098,10 +1098,10 @@ class ShowIsisAdjacencyTransition:
     down_reason: str = ""
 
     def to_dict(self) -> dict:
-        return {k: v for k, v in self.__dict__.items()}
+        return {name: getattr(self, name) for name in self.__slots__}
 
 
-@dataclass
+@dataclass(slots=True)
 class ShowIsisAdjacencyEntry:
     system_name: str
     interface: str
@@ -1153,7 +1153,7 @@ class ShowIsisAdjacencyExtensive:
 # show route summary | no-more
 # ────────────────────────────────────────────────────────────────────────────────
 
-@dataclass
+@dataclass(slots=True)
 class ShowRouteSummaryHighwater:
     rib_unique_destination_routes: str = ""
     rib_routes: str = ""
@@ -1161,20 +1161,20 @@ class ShowRouteSummaryHighwater:
     vrf_type_routing_instances: str = ""
 
     def to_dict(self) -> dict:
-        return {k: v for k, v in self.__dict__.items()}
+        return {name: getattr(self, name) for name in self.__slots__}
 
 
-@dataclass
+@dataclass(slots=True)
 class ShowRouteSummaryProtocol:
     protocol: str
     routes: int
     active: int
 
     def to_dict(self) -> dict:
-        return {k: v for k, v in self.__dict__.items()}
+        return {name: getattr(self, name) for name in self.__slots__}
 
 
-@dataclass
+@dataclass(slots=True)
 class ShowRouteSummaryTable:
     table_name: str
     destinations: int
@@ -1217,7 +1217,7 @@ class ShowRouteSummary:
 # show mpls lsp unidirectional | match Dn | no-more
 # ────────────────────────────────────────────────────────────────────────────────
 
-@dataclass
+@dataclass(slots=True)
 class RsvpSessionEntry:
     to_address: str
     from_address: str
@@ -1229,7 +1229,7 @@ class RsvpSessionEntry:
     lsp_name: str
 
     def to_dict(self) -> dict:
-        return {k: v for k, v in self.__dict__.items()}
+        return {name: getattr(self, name) for name in self.__slots__}
 
 
 @dataclass
@@ -1264,7 +1264,7 @@ class ShowRsvpData:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class MplsLspEntry:
     to_address: str
     from_address: str
@@ -1276,7 +1276,7 @@ class MplsLspEntry:
     lsp_name: str
 
     def to_dict(self) -> dict:
-        return {k: v for k, v in self.__dict__.items()}
+        return {name: getattr(self, name) for name in self.__slots__}
 
 
 @dataclass
@@ -1313,7 +1313,7 @@ class ShowMplsLspData:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class DownLspEntry:
     to: str
     from_: str
@@ -1323,7 +1323,7 @@ class DownLspEntry:
     lsp_name: str
 
     def to_dict(self) -> dict:
-        return {k: v for k, v in self.__dict__.items()}
+        return {name: getattr(self, name) for name in self.__slots__}
 
 
 @dataclass
@@ -1342,7 +1342,7 @@ class DownLspSummary:
 # show ldp neighbor | no-more
 # ────────────────────────────────────────────────────────────────────────────────
 
-@dataclass
+@dataclass(slots=True)
 class LdpNeighbor:
     address: Optional[str] = None
     interface: Optional[str] = None
@@ -1350,7 +1350,7 @@ class LdpNeighbor:
     hold_time: Optional[int] = None
 
     def to_dict(self) -> dict:
-        return {k: v for k, v in self.__dict__.items()}
+        return {name: getattr(self, name) for name in self.__slots__}
 
 
 @dataclass
@@ -1365,7 +1365,7 @@ class ShowLdpNeighbor:
 # show connections | no-more
 # ────────────────────────────────────────────────────────────────────────────────
 
-@dataclass
+@dataclass(slots=True)
 class Connection:
     connection_id: Optional[str] = None
     source: Optional[str] = None
@@ -1373,7 +1373,7 @@ class Connection:
     state: Optional[str] = None
 
     def to_dict(self) -> dict:
-        return {k: v for k, v in self.__dict__.items()}
+        return {name: getattr(self, name) for name in self.__slots__}
 
 
 @dataclass
@@ -1392,7 +1392,7 @@ class ShowConnections:
 # show log messages | last 200 | no-more
 # ────────────────────────────────────────────────────────────────────────────────
 
-@dataclass
+@dataclass(slots=True)
 class LogMessageEntry:
     timestamp: str
     hostname: str
@@ -1401,7 +1401,7 @@ class LogMessageEntry:
     message: str
 
     def to_dict(self) -> dict:
-        return {k: v for k, v in self.__dict__.items()}
+        return {name: getattr(self, name) for name in self.__slots__}
 
 
 @dataclass
@@ -162,8 +162,9 @@ def parse_show_rsvp_session(text_content: str) -> Dict[str, Any]:
                 result.transit_up = int(transit_total.group(2))
                 result.transit_down = int(transit_total.group(3))
             else:
-                result.transit_up = sum(1 for e in result.transit_entries if e.state == 'Up')
-                result.transit_down = sum(1 for e in result.transit_entries if e.state == 'Down')
+                transit_states      = [e.state for e in result.transit_entries]
+                result.transit_up   = transit_states.count('Up')
+                result.transit_down = transit_states.count('Down')
 
         return asdict(result)
     except Exception as e:
@@ -1,7 +1,16 @@
 from typing import List, Dict, Any
-import re
 import sys
-from dataclasses import dataclass, asdict, field
+# Same engine choice as the Juniper parser: the third-party regex module when
+# installed (VERSION0 keeps re semantics, including the zero-width lookahead
+# splits used below), the stdlib otherwise and always under PyPy.
+if sys.implementation.name == 'pypy':
+    import re
+else:
+    try:
+        import regex as re
+    except ImportError:
+        import re
+from dataclasses import dataclass, field
 import logging
 
 # Import models
@@ -36,6 +45,11 @@ from models.cisco.cisco_asr9910 import (
 
 logger = logging.getLogger(__name__)
 
+
+REDUNDANCY_ACTIVE_PATTERN      = re.compile(r'Node\s+(\S+)\s+is in ACTIVE role')
+REDUNDANCY_STANDBY_PATTERN     = re.compile(r'Partner node\s+\((\S+)\)\s+is in STANDBY role')
+REDUNDANCY_LAST_SWITCH_PATTERN = re.compile(r'Last switch-over\s+(.+?):\s+\d+\s+day')
+
 # ---------------------------------------------------------------------------
 # show redundancy
 # ---------------------------------------------------------------------------
@@ -47,26 +61,39 @@ def show_redundancy(content: str) -> List[Dict[str, Any]]:
             raise ValueError(f"No output found for command: {cmd}")
 
         # "Node 0/RSP0/CPU0 is in ACTIVE role"
-        active_match = re.search(r'Node\s+(\S+)\s+is in ACTIVE role', content)
+        active_match = REDUNDANCY_ACTIVE_PATTERN.search(content)
 
         # "Partner node (0/RSP1/CPU0) is in STANDBY role"
-        standby_match = re.search(r'Partner node\s+\((\S+)\)\s+is in STANDBY role', content)
+        standby_match = REDUNDANCY_STANDBY_PATTERN.search(content)
 
         # "Last switch-over Tue Mar  3 09:09:09 2026: 1 day, 20 hours..."
-        last_sw_match = re.search(r'Last switch-over\s+(.+?):\s+\d+\s+day', content)
+        last_sw_match = REDUNDANCY_LAST_SWITCH_PATTERN.search(content)
 
-        result = [asdict(ShowRedundancy(
+        result = [ShowRedundancy(
             ActiveNode=active_match.group(1).strip() if active_match else "",
             StandbyNode=standby_match.group(1).strip() if standby_match else "",
             RedundancyState="ACTIVE/STANDBY" if active_match and standby_match else "",
             RedundancyMode="",   # not present in XR show redundancy output
             LastSwitchover=last_sw_match.group(1).strip() if last_sw_match else ""
-        ))]
+        ).to_dict()]
 
         return result
 
     except Exception as e:
         return [{"error": f"Error parsing command output: {str(e)}"}]
+
+
+# Matches any interface name (BE1, Te0/0/0/1, Gi0/0/0/0, etc.)
+# Echo and Async columns can be "n/a" or "value(interval*mult)"
+BFD_SESSION_PATTERN = re.compile(
+    r'(?m)^(?P<interface>\S+)\s+'
+    r'(?P<destAddr>\S+)\s+'
+    r'(?P<echo>\S+)\s+'
+    r'(?P<async_val>\S+)\s+'
+    r'(?P<state>\S+)\s*\n\s+'
+    r'(?P<hw>\S+)\s+(?P<npu>\S+)'
+)
+
 #-----------------------------------------
 # show bfd session
 # ---------------------------------------------------------------------------
@@ -78,18 +105,7 @@ def show_bfd_session(content: str) -> List[Dict[str, Any]]:
 
         result = []
 
-        # Matches any interface name (BE1, Te0/0/0/1, Gi0/0/0/0, etc.)
-        # Echo and Async columns can be "n/a" or "value(interval*mult)"
-        bfd_pattern = re.compile(
-            r'(?m)^(?P<interface>\S+)\s+'
-            r'(?P<destAddr>\S+)\s+'
-            r'(?P<echo>\S+)\s+'
-            r'(?P<async_val>\S+)\s+'
-            r'(?P<state>\S+)\s*\n\s+'
-            r'(?P<hw>\S+)\s+(?P<npu>\S+)'
-        )
-
-        for match in bfd_pattern.finditer(content):
+        for match in BFD_SESSION_PATTERN.finditer(content):
             # Skip the header line if accidentally matched
             if match.group("interface") in ("Interface", "---"):
                 continue
@@ -104,13 +120,30 @@ def show_bfd_session(content: str) -> List[Dict[str, Any]]:
                 npu=match.group("npu"),
                 state=match.group("state")
             )
-            result.append(asdict(entry))
+            result.append(entry.to_dict())
 
         return result
 
     except Exception as e:
         return [{"error": f"Error parsing command output: {str(e)}"}]
 
+
+# XR format: "CPU utilization for one minute: 2%; five minutes: 2%; fifteen minutes: 2%"
+CPU_UTILIZATION_PATTERN = re.compile(
+    r'CPU utilization for one minute:\s*(\d+)%;\s*five minutes:\s*(\d+)%;\s*fifteen minutes:\s*(\d+)%'
+)
+
+# XR per-process format: "PID    1Min    5Min    15Min Process"
+# e.g.  "1        0%      0%       0% init"
+CPU_PROCESS_PATTERN = re.compile(
+    r'^\s*(\d+)\s+'
+    r'(\d+)%\s+'
+    r'(\d+)%\s+'
+    r'(\d+)%\s+'
+    r'(.+)$',
+    re.MULTILINE
+)
+
 # ---------------------------------------------------------------------------
 # show processes cpu
 # ---------------------------------------------------------------------------
@@ -120,30 +153,15 @@ def show_processes_cpu(content: str) -> List[Dict[str, Any]]:
         if not content:
             raise ValueError(f"No output found for command: {cmd}")
 
-        # XR format: "CPU utilization for one minute: 2%; five minutes: 2%; fifteen minutes: 2%"
-        cpu_match = re.search(
-            r'CPU utilization for one minute:\s*(\d+)%;\s*five minutes:\s*(\d+)%;\s*fifteen minutes:\s*(\d+)%',
-            content
-        )
+        cpu_match = CPU_UTILIZATION_PATTERN.search(content)
 
         one_min  = cpu_match.group(1) if cpu_match else ""
         five_min = cpu_match.group(2) if cpu_match else ""
         fifteen  = cpu_match.group(3) if cpu_match else ""
 
-        # XR per-process format: "PID    1Min    5Min    15Min Process"
-        # e.g.  "1        0%      0%       0% init"
-        process_pattern = re.compile(
-            r'^\s*(\d+)\s+'
-            r'(\d+)%\s+'
-            r'(\d+)%\s+'
-            r'(\d+)%\s+'
-            r'(.+)$',
-            re.MULTILINE
-        )
-
         processes = []
-        for m in process_pattern.finditer(content):
-            processes.append(asdict(ShowProcessesCpu(
+        for m in CPU_PROCESS_PATTERN.finditer(content):
+            processes.append(ShowProcessesCpu(
                 PID=m.group(1),
                 Runtime="",      # not present in XR format
                 Invoked="",      # not present in XR format
@@ -153,7 +171,7 @@ def show_processes_cpu(content: str) -> List[Dict[str, Any]]:
                 FiveMin=m.group(3),
                 TTY="",          # not present in XR format
                 Process=m.group(5).strip()
-            )))
+            ).to_dict())
 
         result = [{
             "CPUUtilization": {
@@ -169,6 +187,12 @@ def show_processes_cpu(content: str) -> List[Dict[str, Any]]:
 
     except Exception as e:
         return [{"error": f"Error parsing command output: {str(e)}"}]
+
+
+INSTALL_LABEL_PATTERN        = re.compile(r'^\s*Label\s*:\s*(.+?)\s*$', re.MULTILINE)
+INSTALL_ACTIVE_COUNT_PATTERN = re.compile(r'Active Packages:\s*(?P<count>\d+)')
+INSTALL_PACKAGE_LINE_PATTERN = re.compile(r'^(?:[ \t]+)(?!Active)(?!Label)(.+\S)', re.MULTILINE)
+
 # ---------------------------------------------------------------------------
 # show install active summary
 # ---------------------------------------------------------------------------
@@ -185,24 +209,20 @@ def show_install_active_summary(content: str) -> List[Dict[str, Any]]:
         if not content:
             raise ValueError(f"No output found for command: {cmd}")
 
-        label_match = re.search(r'^\s*Label\s*:\s*(.+?)\s*$', content, flags=re.MULTILINE)
+        label_match = INSTALL_LABEL_PATTERN.search(content)
         label = label_match.group(1).strip() if label_match else "Unknown"
 
-        m_count = re.search(r'Active Packages:\s*(?P<count>\d+)', content)
+        m_count = INSTALL_ACTIVE_COUNT_PATTERN.search(content)
         activePackages = int(m_count.group("count")) if m_count else 0
 
-        package_lines = re.findall(
-            r'^(?:[ \t]+)(?!Active)(?!Label)(.+\S)',
-            content,
-            re.MULTILINE
-        )
-        packages = [line.strip() for line in package_lines if line.strip()]
+        package_lines = INSTALL_PACKAGE_LINE_PATTERN.findall(content)
+        packages = [line for line in map(str.strip, package_lines) if line]
 
-        result = [asdict(ShowInstallActiveSummary(
+        result = [ShowInstallActiveSummary(
             Label=label,
             AcivePackages=activePackages,
             Packages=packages
-        ))]
+        ).to_dict()]
 
         return result
 
@@ -210,6 +230,9 @@ def show_install_active_summary(content: str) -> List[Dict[str, Any]]:
         return [{"error": f"Error parsing command output: {str(e)}"}]
 
 
+ISIS_LEVEL_PATTERN       = re.compile(r'^IS-IS\s\S+\sLevel-(?P<adjacencyLevel>\d+)', re.MULTILINE)
+ISIS_TOTAL_COUNT_PATTERN = re.compile(r'^Total\s+adjacency\s+count:\s*(?P<adjacencyCount>\d+)', re.MULTILINE)
+
 # ---------------------------------------------------------------------------
 # show isis adjacency
 # ---------------------------------------------------------------------------
@@ -228,11 +251,7 @@ def show_isis_adjacency(content: str) -> List[Dict[str, Any]]:
 
         result, adjacencies = [], []
 
-        match = re.search(
-            r'^IS-IS\s\S+\sLevel-(?P<adjacencyLevel>\d+)',
-            content,
-            re.MULTILINE
-        )
+        match = ISIS_LEVEL_PATTERN.search(content)
         adjacencyLevel = int(match.group("adjacencyLevel")) if match else 0
 
         for line in content.splitlines():
@@ -247,7 +266,10 @@ def show_isis_adjacency(content: str) -> List[Dict[str, Any]]:
             ):
                 continue
 
-            cols = re.split(r'\s{1,}', line)
+            # line is stripped and non-empty, so str.split() gives the same
+            # columns as splitting on \s{1,} without going through the regex engine;
+            # only the first nine are read, so the rest is left unsplit
+            cols = line.split(None, 9)
             if len(cols) < 9:
                 continue
 
@@ -262,13 +284,9 @@ def show_isis_adjacency(content: str) -> List[Dict[str, Any]]:
                 ipv4BFD=cols[7],
                 ipv6BFD=cols[8]
             )
-            adjacencies.append(asdict(entry))
+            adjacencies.append(entry.to_dict())
 
-        total_match = re.search(
-            r'^Total\s+adjacency\s+count:\s*(?P<adjacencyCount>\d+)',
-            content,
-            re.MULTILINE
-        )
+        total_match = ISIS_TOTAL_COUNT_PATTERN.search(content)
         adjacencyCount = int(total_match.group("adjacencyCount")) if total_match else 0
 
         result.append({
@@ -283,7 +301,7 @@ def show_isis_adjacency(content: str) -> List[Dict[str, Any]]:
         return [{"error": f"Error parsing command output: {str(e)}"}]
 
 
-
+COLUMN_SPLIT_PATTERN = re.compile(r'\s{2,}')
 
 # ---------------------------------------------------------------------------
 # show route summary
@@ -309,7 +327,7 @@ def show_route_summary(content: str) -> List[Dict[str, Any]]:
             if not line or line.startswith("Route"):
                 continue
 
-            cols = re.split(r'\s{2,}', line)
+            cols = COLUMN_SPLIT_PATTERN.split(line, 5)
             if len(cols) < 5:
                 continue
 
@@ -320,7 +338,7 @@ def show_route_summary(content: str) -> List[Dict[str, Any]]:
                 deleted=cols[3],
                 memory=cols[4]
             )
-            result.append(asdict(entry))
+            result.append(entry.to_dict())
 
         return result
 
@@ -328,6 +346,34 @@ def show_route_summary(content: str) -> List[Dict[str, Any]]:
         return [{"error": f"Error parsing command output: {str(e)}"}]
 
 
+BGP_ROUTER_ID_PATTERN          = re.compile(r'router identifier\s+(\S+)')
+BGP_LOCAL_AS_PATTERN           = re.compile(r'local AS number\s+(\d+)')
+BGP_TABLE_STATE_PATTERN        = re.compile(r'BGP table state:\s+(\S+)')
+BGP_MAIN_TABLE_VERSION_PATTERN = re.compile(r'main routing table version\s+(\d+)')
+
+BGP_PROCESS_PATTERN = re.compile(
+    r'(\S+)\s+'
+    r'(\d+)\s+'
+    r'(\d+)\s+'
+    r'(\d+)\s+'
+    r'(\d+)\s+'
+    r'(\d+)\s+'
+    r'(\d+)'
+)
+
+BGP_NEIGHBOR_PATTERN = re.compile(
+    r'(\d+\.\d+\.\d+\.\d+)\s+'
+    r'(\d+)\s+'
+    r'(\d+)\s+'
+    r'(\d+)\s+'
+    r'(\d+)\s+'
+    r'(\d+)\s+'
+    r'(\d+)\s+'
+    r'(\d+)\s+'
+    r'(\S+)\s+'
+    r'(\d+)'
+)
+
 # ---------------------------------------------------------------------------
 # show bgp all summary
 # ---------------------------------------------------------------------------
@@ -344,23 +390,13 @@ def show_bgp_all_summary(content: str) -> List[Dict[str, Any]]:
         if not content:
             raise ValueError(f"No output found for command: {cmd}")
 
-        router_id = re.search(r'router identifier\s+(\S+)', content)
-        local_as = re.search(r'local AS number\s+(\d+)', content)
-        table_state = re.search(r'BGP table state:\s+(\S+)', content)
-        main_table_version = re.search(r'main routing table version\s+(\d+)', content)
-
-        process_pattern = (
-            r'(\S+)\s+'
-            r'(\d+)\s+'
-            r'(\d+)\s+'
-            r'(\d+)\s+'
-            r'(\d+)\s+'
-            r'(\d+)\s+'
-            r'(\d+)'
-        )
+        router_id = BGP_ROUTER_ID_PATTERN.search(content)
+        local_as = BGP_LOCAL_AS_PATTERN.search(content)
+        table_state = BGP_TABLE_STATE_PATTERN.search(content)
+        main_table_version = BGP_MAIN_TABLE_VERSION_PATTERN.search(content)
 
         process_versions = [
-            asdict(BgpProcessVersion(
+            BgpProcessVersion(
                 Process=m[0],
                 RcvTblVer=m[1],
                 BRibRib=m[2],
@@ -368,25 +404,12 @@ def show_bgp_all_summary(content: str) -> List[Dict[str, Any]]:
                 ImportVer=m[4],
                 SendTblVer=m[5],
                 StandbyVer=m[6],
-            ))
-            for m in re.findall(process_pattern, content)
+            ).to_dict()
+            for m in BGP_PROCESS_PATTERN.findall(content)
         ]
 
-        neighbor_pattern = (
-            r'(\d+\.\d+\.\d+\.\d+)\s+'
-            r'(\d+)\s+'
-            r'(\d+)\s+'
-            r'(\d+)\s+'
-            r'(\d+)\s+'
-            r'(\d+)\s+'
-            r'(\d+)\s+'
-            r'(\d+)\s+'
-            r'(\S+)\s+'
-            r'(\d+)'
-        )
-
         neighbors = [
-            asdict(BgpNeighbor(
+            BgpNeighbor(
                 Neighbor=m[0],
                 Spk=m[1],
                 RemoteAS=m[2],
@@ -397,18 +420,18 @@ def show_bgp_all_summary(content: str) -> List[Dict[str, Any]]:
                 OutQ=m[7],
                 UpDown=m[8],
                 StatePfxRcd=m[9],
-            ))
-            for m in re.findall(neighbor_pattern, content)
+            ).to_dict()
+            for m in BGP_NEIGHBOR_PATTERN.findall(content)
         ]
 
-        result = [asdict(ShowBgpAllSummary(
+        result = [ShowBgpAllSummary(
             RouterID=router_id.group(1) if router_id else "",
             LocalAS=local_as.group(1) if local_as else "",
             TableState=table_state.group(1) if table_state else "",
             MainTableVersion=main_table_version.group(1) if main_table_version else "",
             ProcessVersions=process_versions,
             Neighbors=neighbors,
-        ))]
+        ).to_dict()]
 
         return result
 
@@ -416,6 +439,16 @@ def show_bgp_all_summary(content: str) -> List[Dict[str, Any]]:
         return [{"error": f"Error parsing command output: {str(e)}"}]
 
 
+BGP_VRF_NAME_PATTERN       = re.compile(r'VRF:\s+(\S+)')
+BGP_VRF_STATE_PATTERN      = re.compile(r'BGP VRF \S+, state:\s+(\S+)')
+BGP_VRF_RD_PATTERN         = re.compile(r'BGP Route Distinguisher:\s+(\S+)')
+BGP_VRF_ID_PATTERN         = re.compile(r'VRF ID:\s+(\S+)')
+BGP_VRF_ROUTER_PATTERN     = re.compile(r'BGP router identifier\s+(\S+), local AS number\s+(\d+)')
+BGP_VRF_MAIN_TABLE_PATTERN = re.compile(r'BGP main routing table version\s+(\d+)')
+BGP_VRF_PROCESS_PATTERN    = re.compile(
+    r'^(\S+)\s+(\d+)\s+(\d+)\s+(\d+)\s+(\d+)\s+(\d+)\s+(\d+)', re.MULTILINE
+)
+
 # ---------------------------------------------------------------------------
 # show bgp vrf all summary
 # ---------------------------------------------------------------------------
@@ -432,24 +465,20 @@ def show_bgp_vrf_all_summary(content: str) -> List[Dict[str, Any]]:
         if not content:
             raise ValueError(f"No output found for command: {cmd}")
 
-        vrf_match = re.search(r'VRF:\s+(\S+)', content)
-        state_match = re.search(r'BGP VRF \S+, state:\s+(\S+)', content)
-        rd_match = re.search(r'BGP Route Distinguisher:\s+(\S+)', content)
-        vrf_id_match = re.search(r'VRF ID:\s+(\S+)', content)
+        vrf_match = BGP_VRF_NAME_PATTERN.search(content)
+        state_match = BGP_VRF_STATE_PATTERN.search(content)
+        rd_match = BGP_VRF_RD_PATTERN.search(content)
+        vrf_id_match = BGP_VRF_ID_PATTERN.search(content)
 
-        router_match = re.search(
-            r'BGP router identifier\s+(\S+), local AS number\s+(\d+)',
-            content
-        )
+        router_match = BGP_VRF_ROUTER_PATTERN.search(content)
 
-        table_state_match = re.search(r'BGP table state:\s+(\S+)', content)
-        main_tbl_match = re.search(r'BGP main routing table version\s+(\d+)', content)
+        table_state_match = BGP_TABLE_STATE_PATTERN.search(content)
+        main_tbl_match = BGP_VRF_MAIN_TABLE_PATTERN.search(content)
 
-        process_pattern = r'^(\S+)\s+(\d+)\s+(\d+)\s+(\d+)\s+(\d+)\s+(\d+)\s+(\d+)'
-        process_matches = re.findall(process_pattern, content, re.MULTILINE)
+        process_matches = BGP_VRF_PROCESS_PATTERN.findall(content)
 
         process_list = [
-            asdict(BgpProcessVersion(
+            BgpProcessVersion(
                 Process=p[0],
                 RcvTblVer=p[1],
                 BRibRib=p[2],
@@ -457,11 +486,11 @@ def show_bgp_vrf_all_summary(content: str) -> List[Dict[str, Any]]:
                 ImportVer=p[4],
                 SendTblVer=p[5],
                 StandbyVer=p[6],
-            ))
+            ).to_dict()
             for p in process_matches
         ]
 
-        result = [asdict(ShowBgpVrfAllSummary(
+        result = [ShowBgpVrfAllSummary(
             VRF=vrf_match.group(1) if vrf_match else "",
             VRFState=state_match.group(1) if state_match else "",
             RouteDistinguisher=rd_match.group(1) if rd_match else "",
@@ -471,7 +500,7 @@ def show_bgp_vrf_all_summary(content: str) -> List[Dict[str, Any]]:
             TableState=table_state_match.group(1) if table_state_match else "",
             MainTableVersion=main_tbl_match.group(1) if main_tbl_match else "",
             ProcessVersions=process_list
-        ))]
+        ).to_dict()]
 
         return result
 
@@ -479,6 +508,10 @@ def show_bgp_vrf_all_summary(content: str) -> List[Dict[str, Any]]:
         return [{"error": f"Error parsing command output: {str(e)}"}]
 
 
+IPV4_INTERFACE_BRIEF_PATTERN = re.compile(
+    r'^(\S+)\s+(\S+)\s+(Up|Down|Shutdown|up|down)\s+(Up|Down|up|down)\s+(\S+)', re.MULTILINE
+)
+
 # ---------------------------------------------------------------------------
 # show ipv4 vrf all interface brief
 # ---------------------------------------------------------------------------
@@ -495,17 +528,16 @@ def show_ipv4_vrf_all_interface_brief(content: str) -> List[Dict[str, Any]]:
         if not content:
             raise ValueError(f"No output found for command: {cmd}")
 
-        pattern = r'^(\S+)\s+(\S+)\s+(Up|Down|Shutdown|up|down)\s+(Up|Down|up|down)\s+(\S+)'
-        matches = re.findall(pattern, content, re.MULTILINE)
+        matches = IPV4_INTERFACE_BRIEF_PATTERN.findall(content)
 
         result = [
-            asdict(ShowIpv4VrfAllInterfaceBrief(
+            ShowIpv4VrfAllInterfaceBrief(
                 Interface=m[0],
                 IPAddress=m[1],
                 Status=m[2],
                 Protocol=m[3],
                 VrfName=m[4]
-            ))
+            ).to_dict()
             for m in matches
         ]
 
@@ -515,6 +547,14 @@ def show_ipv4_vrf_all_interface_brief(content: str) -> List[Dict[str, Any]]:
         return [{"error": f"Error parsing command output: {str(e)}"}]
 
 
+LDP_PEER_PATTERN      = re.compile(r'Peer LDP Identifier:\s+(\S+)')
+LDP_TCP_PATTERN       = re.compile(r'TCP connection:\s+(\S+)\s*-\s*(\S+)')
+LDP_STATE_PATTERN     = re.compile(r'State:\s+(\S+)')
+LDP_UPTIME_PATTERN    = re.compile(r'Up time:\s+(\S+)')
+LDP_MSGS_PATTERN      = re.compile(r'Msgs sent/rcvd:\s+(\d+)/(\d+)')
+LDP_DISCOVERY_PATTERN = re.compile(r'(TenGigE\S+)')
+LDP_IPV4_PATTERN      = re.compile(r'\b\d+\.\d+\.\d+\.\d+\b')
+
 # ---------------------------------------------------------------------------
 # show mpls ldp neighbor
 # ---------------------------------------------------------------------------
@@ -531,16 +571,16 @@ def show_mpls_ldp_neighbor(content: str) -> List[Dict[str, Any]]:
         if not content:
             raise ValueError(f"No output found for command: {cmd}")
 
-        peer_match = re.search(r'Peer LDP Identifier:\s+(\S+)', content)
-        tcp_match = re.search(r'TCP connection:\s+(\S+)\s*-\s*(\S+)', content)
-        state_match = re.search(r'State:\s+(\S+)', content)
-        uptime_match = re.search(r'Up time:\s+(\S+)', content)
-        msgs_match = re.search(r'Msgs sent/rcvd:\s+(\d+)/(\d+)', content)
+        peer_match = LDP_PEER_PATTERN.search(content)
+        tcp_match = LDP_TCP_PATTERN.search(content)
+        state_match = LDP_STATE_PATTERN.search(content)
+        uptime_match = LDP_UPTIME_PATTERN.search(content)
+        msgs_match = LDP_MSGS_PATTERN.search(content)
 
-        discovery_matches = re.findall(r'(TenGigE\S+)', content)
-        bound_ipv4 = re.findall(r'\b\d+\.\d+\.\d+\.\d+\b', content)
+        discovery_matches = LDP_DISCOVERY_PATTERN.findall(content)
+        bound_ipv4 = LDP_IPV4_PATTERN.findall(content)
 
-        result = [asdict(ShowMplsLdpNeighbor(
+        result = [ShowMplsLdpNeighbor(
             PeerLdpIdentifier=peer_match.group(1) if peer_match else "",
             LocalTCP=tcp_match.group(1) if tcp_match else "",
             RemoteTCP=tcp_match.group(2) if tcp_match else "",
@@ -550,7 +590,7 @@ def show_mpls_ldp_neighbor(content: str) -> List[Dict[str, Any]]:
             MsgsReceived=msgs_match.group(2) if msgs_match else "",
             DiscoveryInterfaces=discovery_matches,
             BoundIPv4Addresses=bound_ipv4
-        ))]
+        ).to_dict()]
 
         return result
 
@@ -558,6 +598,25 @@ def show_mpls_ldp_neighbor(content: str) -> List[Dict[str, Any]]:
         return [{"error": f"Error parsing command output: {str(e)}"}]
 
 
+PIM_VRF_PATTERN = re.compile(r'PIM neighbors in VRF\s+(\S+)', re.IGNORECASE)
+
+PIM_NEIGHBOR_ROW_PATTERN = re.compile(
+    r'^\s*'
+    r'(?P<addr>\d{1,3}(?:\.\d{1,3}){3})'
+    r'(?P<self>\*)?'
+    r'\s+'
+    r'(?P<intf>\S+)'
+    r'\s+'
+    r'(?P<uptime>\S+)'
+    r'\s+'
+    r'(?P<expires>\S+)'
+    r'\s+'
+    r'(?P<drpri>\d+)'
+    r'\s+'
+    r'(?P<flags>.+?)'
+    r'\s*$'
+)
+
 # ---------------------------------------------------------------------------
 # show pim neighbor
 # ---------------------------------------------------------------------------
@@ -574,7 +633,7 @@ def show_pim_neighbor(content: str) -> List[Dict[str, Any]]:
         if not content:
             raise ValueError(f"No output found for command: {cmd}")
 
-        vrf_match = re.search(r'PIM neighbors in VRF\s+(\S+)', content, flags=re.IGNORECASE)
+        vrf_match = PIM_VRF_PATTERN.search(content)
         vrf = vrf_match.group(1) if vrf_match else "default"
 
         result: List[Dict[str, Any]] = []
@@ -595,30 +654,17 @@ def show_pim_neighbor(content: str) -> List[Dict[str, Any]]:
             ):
                 continue
 
-            m = re.match(
-                r'^\s*'
-                r'(?P<addr>\d{1,3}(?:\.\d{1,3}){3})'
-                r'(?P<self>\*)?'
-                r'\s+'
-                r'(?P<intf>\S+)'
-                r'\s+'
-                r'(?P<uptime>\S+)'
-                r'\s+'
-                r'(?P<expires>\S+)'
-                r'\s+'
-                r'(?P<drpri>\d+)'
-                r'\s+'
-                r'(?P<flags>.+?)'
-                r'\s*$',
-                stripped
-            )
+            # Rows start with the neighbor address; anything else cannot
+            # match, so it is dropped before the regex runs
+            if not stripped[:1].isdigit():
+                continue
+
+            m = PIM_NEIGHBOR_ROW_PATTERN.match(stripped)
             if not m:
                 continue
 
-            try:
-                drpri = int(m.group("drpri"))
-            except Exception:
-                drpri = 0
+            # drpri is matched as \d+, so int() cannot fail here
+            drpri = int(m.group("drpri"))
 
             flags_raw = m.group("flags").strip()
             is_dr = "(dr)" in flags_raw.lower()
@@ -641,7 +687,7 @@ def show_pim_neighbor(content: str) -> List[Dict[str, Any]]:
                 flags=letters,
                 flagsRaw=flags_raw
             )
-            result.append(asdict(entry))
+            result.append(entry.to_dict())
 
         return result
 
@@ -649,6 +695,23 @@ def show_pim_neighbor(content: str) -> List[Dict[str, Any]]:
         return [{"error": f"Error parsing command output: {str(e)}"}]
 
 
+PFM_NODE_SPLIT_PATTERN   = re.compile(r'node:\s+')
+PFM_CURRENT_TIME_PATTERN = re.compile(r'CURRENT TIME:\s+(.+)')
+PFM_TOTAL_PATTERN        = re.compile(r'PFM TOTAL:\s+(\d+)')
+PFM_EA_PATTERN           = re.compile(r'EMERGENCY/ALERT\(E/A\):\s+(\d+)')
+PFM_CR_PATTERN           = re.compile(r'CRITICAL\(CR\):\s+(\d+)')
+PFM_ER_PATTERN           = re.compile(r'ERROR\(ER\):\s+(\d+)')
+PFM_RAISED_TIME_PATTERN  = re.compile(r'Raised Time\s*\n\s*(.+)')
+
+PFM_FAULT_PATTERN = re.compile(
+    r'\|\s*(\d+)\s*\|'
+    r'\s*([^|]+)\s*\|'
+    r'\s*(E/A|CR|ER)\s*\|'
+    r'\s*(\d+)\s*\|'
+    r'\s*([^|]+)\s*\|'
+    r'\s*(0x[0-9A-Fa-f]+)\s*\|'
+)
+
 # ---------------------------------------------------------------------------
 # show pfm location all
 # ---------------------------------------------------------------------------
@@ -665,30 +728,22 @@ def show_pfm_location_all(content: str) -> List[Dict[str, Any]]:
         if not content:
             raise ValueError(f"No output found for command: {cmd}")
 
-        node_blocks = re.split(r'node:\s+', content)
+        node_blocks = PFM_NODE_SPLIT_PATTERN.split(content)
         results = []
 
         for block in node_blocks[1:]:
-            node_name = block.splitlines()[0].strip()
-
-            time_match = re.search(r'CURRENT TIME:\s+(.+)', block)
-            total_match = re.search(r'PFM TOTAL:\s+(\d+)', block)
-            ea_match = re.search(r'EMERGENCY/ALERT\(E/A\):\s+(\d+)', block)
-            cr_match = re.search(r'CRITICAL\(CR\):\s+(\d+)', block)
-            er_match = re.search(r'ERROR\(ER\):\s+(\d+)', block)
-            raised_time_match = re.search(r'Raised Time\s*\n\s*(.+)', block)
-
-            fault_pattern = (
-                r'\|\s*(\d+)\s*\|'
-                r'\s*([^|]+)\s*\|'
-                r'\s*(E/A|CR|ER)\s*\|'
-                r'\s*(\d+)\s*\|'
-                r'\s*([^|]+)\s*\|'
-                r'\s*(0x[0-9A-Fa-f]+)\s*\|'
-            )
-            fault_match = re.search(fault_pattern, block)
+            node_name = block.partition('\n')[0].strip()
 
-            results.append(asdict(ShowPfmLocationAll(
+            time_match = PFM_CURRENT_TIME_PATTERN.search(block)
+            total_match = PFM_TOTAL_PATTERN.search(block)
+            ea_match = PFM_EA_PATTERN.search(block)
+            cr_match = PFM_CR_PATTERN.search(block)
+            er_match = PFM_ER_PATTERN.search(block)
+            raised_time_match = PFM_RAISED_TIME_PATTERN.search(block)
+
+            fault_match = PFM_FAULT_PATTERN.search(block)
+
+            results.append(ShowPfmLocationAll(
                 Node=node_name,
                 CurrentTime=time_match.group(1).strip() if time_match else "",
                 PFMTotal=int(total_match.group(1)) if total_match else 0,
@@ -702,7 +757,7 @@ def show_pfm_location_all(content: str) -> List[Dict[str, Any]]:
                 ProcessID=fault_match.group(4) if fault_match else "",
                 DevicePath=fault_match.group(5).strip() if fault_match else "",
                 Handle=fault_match.group(6) if fault_match else ""
-            )))
+            ).to_dict())
 
         return results
 
@@ -710,6 +765,15 @@ def show_pfm_location_all(content: str) -> List[Dict[str, Any]]:
         return [{"error": f"Error parsing command output: {str(e)}"}]
 
 
+WATCHDOG_MEMORY_PATTERN = re.compile(
+    r"----\s*(?P<section>[^-]+?)\s*----\s*"
+    r"Memory information:\s*"
+    r"\s*Physical Memory\s*:\s*(?P<physical>[\d.]+)\s*MB\s*"
+    r"\s*Free Memory\s*:\s*(?P<free>[\d.]+)\s*MB\s*"
+    r"\s*Memory State\s*:\s*(?P<state>\w+)",
+    re.MULTILINE
+)
+
 # ---------------------------------------------------------------------------
 # show watchdog memory-state location all
 # ---------------------------------------------------------------------------
@@ -728,16 +792,7 @@ def show_watchdog_memory_state(content: str) -> List[Dict[str, Any]]:
 
         result = []
 
-        pattern = re.compile(
-            r"----\s*(?P<section>[^-]+?)\s*----\s*"
-            r"Memory information:\s*"
-            r"\s*Physical Memory\s*:\s*(?P<physical>[\d.]+)\s*MB\s*"
-            r"\s*Free Memory\s*:\s*(?P<free>[\d.]+)\s*MB\s*"
-            r"\s*Memory State\s*:\s*(?P<state>\w+)",
-            re.MULTILINE
-        )
-
-        for match in pattern.finditer(content):
+        for match in WATCHDOG_MEMORY_PATTERN.finditer(content):
             mem_info = memoryInfo(
                 physicalMem=match.group("physical"),
                 freeMem=match.group("free"),
@@ -747,7 +802,7 @@ def show_watchdog_memory_state(content: str) -> List[Dict[str, Any]]:
                 nodeName=match.group("section").strip(),
                 memoryInfo=[mem_info]
             )
-            result.append(asdict(node_state))
+            result.append(node_state.to_dict())
 
         return result
 
@@ -755,6 +810,9 @@ def show_watchdog_memory_state(content: str) -> List[Dict[str, Any]]:
         return [{"error": f"Error parsing command output: {str(e)}"}]
 
 
+INTERFACE_DESCRIPTION_PATTERN = re.compile(
+    r'^(\S+)\s+(up|down|admin-down)\s+(up|down)\s+(.+)$', re.MULTILINE
+)
 
 # ---------------------------------------------------------------------------
 # show interfaces description
@@ -772,16 +830,15 @@ def show_interfaces_description(content: str) -> List[Dict[str, Any]]:
         if not content:
             raise ValueError(f"No output found for command: {cmd}")
 
-        pattern = r'^(\S+)\s+(up|down|admin-down)\s+(up|down)\s+(.+)$'
-        matches = re.findall(pattern, content, re.MULTILINE)
+        matches = INTERFACE_DESCRIPTION_PATTERN.findall(content)
 
         result = [
-            asdict(ShowInterfacesDescription(
+            ShowInterfacesDescription(
                 Interface=match[0],
                 Status=match[1],
                 Protocol=match[2],
                 Description=match[3].strip()
-            ))
+            ).to_dict()
             for match in matches
         ]
 
@@ -824,7 +881,7 @@ def show_filesystem(content: str) -> List[Dict[str, Any]]:
             ):
                 continue
 
-            cols = re.split(r'\s{2,}', line)
+            cols = COLUMN_SPLIT_PATTERN.split(line, 5)
             if len(cols) < 5:
                 continue
 
@@ -846,7 +903,7 @@ def show_filesystem(content: str) -> List[Dict[str, Any]]:
                 prefixesRaw=prefixes_raw,
                 prefixes=prefixes
             )
-            result.append(asdict(entry))
+            result.append(entry.to_dict())
 
         return result
 
@@ -854,6 +911,19 @@ def show_filesystem(content: str) -> List[Dict[str, Any]]:
         return [{"error": f"Error parsing command output: {str(e)}"}]
 
 
+BUNDLE_SPLIT_PATTERN        = re.compile(r'(?=^Bundle-Ether)', re.MULTILINE)
+BUNDLE_HEADER_PATTERN       = re.compile(r'^(Bundle-Ether\S+) is (\w+), line protocol is (\w+)')
+BUNDLE_MAC_PATTERN          = re.compile(r'address is (\S+)')
+BUNDLE_DESCRIPTION_PATTERN  = re.compile(r'Description:\s+(.+)')
+BUNDLE_IP_PATTERN           = re.compile(r'Internet address is (\S+)')
+BUNDLE_MTU_BW_PATTERN       = re.compile(r'MTU (\d+) bytes, BW (\d+) Kbit')
+BUNDLE_FLAP_PATTERN         = re.compile(r'Last link flapped (.+)')
+BUNDLE_ARP_PATTERN          = re.compile(r'ARP timeout (\S+)')
+BUNDLE_MEMBER_COUNT_PATTERN = re.compile(r'No\. of members in this bundle:\s+(\d+)')
+BUNDLE_MEMBER_PATTERN       = re.compile(
+    r'^(HundredGigE\S+)\s+(Full-duplex|Half-duplex)\s+(\S+)\s+(\S+)', re.MULTILINE
+)
+
 # ---------------------------------------------------------------------------
 # show interfaces (Bundle-Ether)
 # ---------------------------------------------------------------------------
@@ -871,7 +941,7 @@ def show_interfaces(content: str) -> List[Dict[str, Any]]:
             raise ValueError(f"No output found for command: {cmd}")
 
         results = []
-        bundle_blocks = re.split(r'(?=^Bundle-Ether)', content, flags=re.MULTILINE)
+        bundle_blocks = BUNDLE_SPLIT_PATTERN.split(content)
 
         for block in bundle_blocks:
             if not block.strip():
@@ -879,32 +949,26 @@ def show_interfaces(content: str) -> List[Dict[str, Any]]:
 
             members = []
 
-            header_match = re.search(
-                r'^(Bundle-Ether\S+) is (\w+), line protocol is (\w+)', block
-            )
-            mac_match = re.search(r'address is (\S+)', block)
-            desc_match = re.search(r'Description:\s+(.+)', block)
-            ip_match = re.search(r'Internet address is (\S+)', block)
-            mtu_bw_match = re.search(r'MTU (\d+) bytes, BW (\d+) Kbit', block)
-            flap_match = re.search(r'Last link flapped (.+)', block)
-            arp_match = re.search(r'ARP timeout (\S+)', block)
-            member_count_match = re.search(r'No\. of members in this bundle:\s+(\d+)', block)
-
-            member_pattern = re.findall(
-                r'^(HundredGigE\S+)\s+(Full-duplex|Half-duplex)\s+(\S+)\s+(\S+)',
-                block,
-                re.MULTILINE
-            )
+            header_match = BUNDLE_HEADER_PATTERN.search(block)
+            mac_match = BUNDLE_MAC_PATTERN.search(block)
+            desc_match = BUNDLE_DESCRIPTION_PATTERN.search(block)
+            ip_match = BUNDLE_IP_PATTERN.search(block)
+            mtu_bw_match = BUNDLE_MTU_BW_PATTERN.search(block)
+            flap_match = BUNDLE_FLAP_PATTERN.search(block)
+            arp_match = BUNDLE_ARP_PATTERN.search(block)
+            member_count_match = BUNDLE_MEMBER_COUNT_PATTERN.search(block)
+
+            member_pattern = BUNDLE_MEMBER_PATTERN.findall(block)
 
             for iface, duplex, speed, state in member_pattern:
-                members.append(asdict(BundleMember(
+                members.append(BundleMember(
                     Interface=iface,
                     Duplex=duplex,
                     Speed=speed,
                     State=state
-                )))
+                ).to_dict())
 
-            results.append(asdict(ShowInterfacesBundleEther(
+            results.append(ShowInterfacesBundleEther(
                 Interface=header_match.group(1) if header_match else "",
                 AdminState=header_match.group(2) if header_match else "",
                 LineProtocol=header_match.group(3) if header_match else "",
@@ -917,7 +981,7 @@ def show_interfaces(content: str) -> List[Dict[str, Any]]:
                 ArpTimeout=arp_match.group(1) if arp_match else "",
                 MemberCount=int(member_count_match.group(1)) if member_count_match else 0,
                 Members=members
-            )))
+            ).to_dict())
 
         return results
 
@@ -925,6 +989,15 @@ def show_interfaces(content: str) -> List[Dict[str, Any]]:
         return [{"error": f"Error parsing Bundle-Ether output: {str(e)}"}]
 
 
+MSDP_PEER_SPLIT_PATTERN  = re.compile(r'(?=MSDP Peer\s+\S+)')
+MSDP_PEER_PATTERN        = re.compile(r'MSDP Peer\s+(\S+),')
+MSDP_AS_PATTERN          = re.compile(r'AS\s+(\d+)')
+MSDP_STATE_PATTERN       = re.compile(r'State:\s+(\S+)')
+MSDP_UPTIME_PATTERN      = re.compile(r'Uptime/Reset-time:\s+(\S+)')
+MSDP_SA_COUNT_PATTERN    = re.compile(r'SA Count:\s+(\d+)')
+MSDP_CONN_SOURCE_PATTERN = re.compile(r'Connection Source:\s+(\S+)')
+MSDP_RPF_PEER_PATTERN    = re.compile(r'RPF Peer:\s+(\S+)')
+
 # ---------------------------------------------------------------------------
 # show msdp peer
 # ---------------------------------------------------------------------------
@@ -944,21 +1017,21 @@ def show_msdp_peer(content: str) -> List[Dict[str, Any]]:
         result = []
 
         # Split on peer blocks
-        peer_blocks = re.split(r'(?=MSDP Peer\s+\S+)', content)
+        peer_blocks = MSDP_PEER_SPLIT_PATTERN.split(content)
 
         for block in peer_blocks:
             if not block.strip():
                 continue
 
-            peer_match = re.search(r'MSDP Peer\s+(\S+),', block)
-            as_match = re.search(r'AS\s+(\d+)', block)
-            state_match = re.search(r'State:\s+(\S+)', block)
-            uptime_match = re.search(r'Uptime/Reset-time:\s+(\S+)', block)
-            sa_count_match = re.search(r'SA Count:\s+(\d+)', block)
-            conn_match = re.search(r'Connection Source:\s+(\S+)', block)
-            rpf_match = re.search(r'RPF Peer:\s+(\S+)', block)
+            peer_match = MSDP_PEER_PATTERN.search(block)
+            as_match = MSDP_AS_PATTERN.search(block)
+            state_match = MSDP_STATE_PATTERN.search(block)
+            uptime_match = MSDP_UPTIME_PATTERN.search(block)
+            sa_count_match = MSDP_SA_COUNT_PATTERN.search(block)
+            conn_match = MSDP_CONN_SOURCE_PATTERN.search(block)
+            rpf_match = MSDP_RPF_PEER_PATTERN.search(block)
 
-            result.append(asdict(ShowMsdpPeer(
+            result.append(ShowMsdpPeer(
                 PeerAddress=peer_match.group(1) if peer_match else "",
                 AS=as_match.group(1) if as_match else "",
                 State=state_match.group(1) if state_match else "",
@@ -966,7 +1039,7 @@ def show_msdp_peer(content: str) -> List[Dict[str, Any]]:
                 SACount=int(sa_count_match.group(1)) if sa_count_match else 0,
                 ConnectionSource=conn_match.group(1) if conn_match else "",
                 RPFPeer=rpf_match.group(1) if rpf_match else ""
-            )))
+            ).to_dict())
 
         return result
 
@@ -974,6 +1047,10 @@ def show_msdp_peer(content: str) -> List[Dict[str, Any]]:
         return [{"error": f"Error parsing command output: {str(e)}"}]
 
 
+XCONNECT_LIKE_TO_LIKE_PATTERN = re.compile(r'Like-to-Like\s+(\d+)\s+(\d+)\s+(\d+)')
+XCONNECT_PW_ETHER_PATTERN     = re.compile(r'PW-Ether\s+(\d+)\s+(\d+)\s+(\d+)')
+XCONNECT_TOTAL_PATTERN        = re.compile(r'Total:\s+(\d+)\s+UP,\s+(\d+)\s+DOWN,\s+(\d+)\s+UNRESOLVED')
+
 # ---------------------------------------------------------------------------
 # show l2vpn xconnect brief
 # ---------------------------------------------------------------------------
@@ -990,11 +1067,11 @@ def show_l2vpn_xconnect_brief(content: str) -> List[Dict[str, Any]]:
         if not content:
             raise ValueError(f"No output found for command: {cmd}")
 
-        like_match = re.search(r'Like-to-Like\s+(\d+)\s+(\d+)\s+(\d+)', content)
-        pw_match = re.search(r'PW-Ether\s+(\d+)\s+(\d+)\s+(\d+)', content)
-        total_match = re.search(r'Total:\s+(\d+)\s+UP,\s+(\d+)\s+DOWN,\s+(\d+)\s+UNRESOLVED', content)
+        like_match = XCONNECT_LIKE_TO_LIKE_PATTERN.search(content)
+        pw_match = XCONNECT_PW_ETHER_PATTERN.search(content)
+        total_match = XCONNECT_TOTAL_PATTERN.search(content)
 
-        result = [asdict(ShowL2vpnXconnectBrief(
+        result = [ShowL2vpnXconnectBrief(
             LikeToLike_UP=int(like_match.group(1)) if like_match else 0,
             LikeToLike_DOWN=int(like_match.group(2)) if like_match else 0,
             LikeToLike_UNR=int(like_match.group(3)) if like_match else 0,
@@ -1004,7 +1081,7 @@ def show_l2vpn_xconnect_brief(content: str) -> List[Dict[str, Any]]:
             Total_UP=int(total_match.group(1)) if total_match else 0,
             Total_DOWN=int(total_match.group(2)) if total_match else 0,
             Total_UNRESOLVED=int(total_match.group(3)) if total_match else 0,
-        ))]
+        ).to_dict()]
 
         return result
 
@@ -1012,6 +1089,8 @@ def show_l2vpn_xconnect_brief(content: str) -> List[Dict[str, Any]]:
         return [{"error": f"Error parsing command output: {str(e)}"}]
 
 
+FPD_AUTO_UPGRADE_PATTERN = re.compile(r'^Auto-upgrade\s*:\s*(?P<AutoUpgrade>\S+)', re.MULTILINE)
+
 # ---------------------------------------------------------------------------
 # show hw-module fpd
 # ---------------------------------------------------------------------------
@@ -1028,11 +1107,7 @@ def show_hw_module_fpd(content: str) -> List[Dict[str, Any]]:
         if not content:
             raise ValueError(f"No output found for command: {cmd}")
 
-        auto_upgrade_pattern = re.search(
-            r'^Auto-upgrade\s*:\s*(?P<AutoUpgrade>\S+)',
-            content,
-            re.MULTILINE
-        )
+        auto_upgrade_pattern = FPD_AUTO_UPGRADE_PATTERN.search(content)
         auto_upgrade = auto_upgrade_pattern.group("AutoUpgrade") if auto_upgrade_pattern else ""
 
         fpds = []
@@ -1050,7 +1125,9 @@ def show_hw_module_fpd(content: str) -> List[Dict[str, Any]]:
             ):
                 continue
 
-            cols = re.split(r'\s{1,}', line)
+            # line is stripped and non-empty, so str.split() gives the same
+            # columns as splitting on \s{1,} without going through the regex engine
+            cols = line.split(None, 7)
             if len(cols) < 7:
                 continue
 
@@ -1070,7 +1147,7 @@ def show_hw_module_fpd(content: str) -> List[Dict[str, Any]]:
                 ATRstatus=cols[4],
                 FPDVersions=fpd_version
             )
-            fpds.append(asdict(fpd))
+            fpds.append(fpd.to_dict())
 
         result = [{"AutoUpgrade": auto_upgrade, "FPDs": fpds}]
 
@@ -1080,6 +1157,8 @@ def show_hw_module_fpd(content: str) -> List[Dict[str, Any]]:
         return [{"error": f"Error parsing command output: {str(e)}"}]
 
 
+PLATFORM_ROW_PATTERN = re.compile(r'^(\S+)\s+(\S+)\s+(.+?)\s+(NSHUT|SHUT|N/A)', re.MULTILINE)
+
 # ---------------------------------------------------------------------------
 # show platform
 # ---------------------------------------------------------------------------
@@ -1096,16 +1175,15 @@ def show_platform(content: str) -> List[Dict[str, Any]]:
         if not content:
             raise ValueError(f"No output found for command: {cmd}")
 
-        pattern = r'^(\S+)\s+(\S+)\s+(.+?)\s+(NSHUT|SHUT|N/A)'
-        matches = re.findall(pattern, content, re.MULTILINE)
+        matches = PLATFORM_ROW_PATTERN.findall(content)
 
         result = [
-            asdict(ShowPlatform(
+            ShowPlatform(
                 Node=m[0],
                 Type=m[1],
                 State=m[2].strip(),
                 ConfigState=m[3]
-            ))
+            ).to_dict()
             for m in matches
         ]
 
@@ -1115,6 +1193,21 @@ def show_platform(content: str) -> List[Dict[str, Any]]:
         return [{"error": f"Error parsing command output: {str(e)}"}]
 
 
+# Each disk entry block
+MEDIA_DISK_PATTERN = re.compile(
+    r'(?P<disk>\S+disk\S*|harddisk\S*|compactflash\S*|usb\S*)'
+    r'.*?Size\s*:\s*(?P<size>[\d.]+\s*\S+)'
+    r'.*?Used\s*:\s*(?P<used>[\d.]+\s*\S+)'
+    r'.*?Free\s*:\s*(?P<free>[\d.]+\s*\S+)',
+    re.IGNORECASE | re.DOTALL
+)
+
+# Fallback: simple table rows
+MEDIA_ROW_PATTERN = re.compile(
+    r'^(\S+)\s+([\d.]+\s*\w+)\s+([\d.]+\s*\w+)\s+([\d.]+\s*\w+)',
+    re.MULTILINE
+)
+
 # ---------------------------------------------------------------------------
 # show media location (e.g. show media location 0/RSP1/CPU0)
 # ---------------------------------------------------------------------------
@@ -1133,36 +1226,23 @@ def show_media_location(content: str) -> List[Dict[str, Any]]:
 
         result = []
 
-        # Each disk entry block
-        disk_pattern = re.compile(
-            r'(?P<disk>\S+disk\S*|harddisk\S*|compactflash\S*|usb\S*)'
-            r'.*?Size\s*:\s*(?P<size>[\d.]+\s*\S+)'
-            r'.*?Used\s*:\s*(?P<used>[\d.]+\s*\S+)'
-            r'.*?Free\s*:\s*(?P<free>[\d.]+\s*\S+)',
-            re.IGNORECASE | re.DOTALL
-        )
-
-        for m in disk_pattern.finditer(content):
-            result.append(asdict(ShowMediaLocation(
+        for m in MEDIA_DISK_PATTERN.finditer(content):
+            result.append(ShowMediaLocation(
                 Disk=m.group("disk"),
                 Size=m.group("size").strip(),
                 Used=m.group("used").strip(),
                 Free=m.group("free").strip()
-            )))
+            ).to_dict())
 
         # Fallback: parse simple table rows
         if not result:
-            row_pattern = re.compile(
-                r'^(\S+)\s+([\d.]+\s*\w+)\s+([\d.]+\s*\w+)\s+([\d.]+\s*\w+)',
-                re.MULTILINE
-            )
-            for m in row_pattern.finditer(content):
-                result.append(asdict(ShowMediaLocation(
+            for m in MEDIA_ROW_PATTERN.finditer(content):
+                result.append(ShowMediaLocation(
                     Disk=m.group(1),
                     Size=m.group(2),
                     Used=m.group(3),
                     Free=m.group(4)
-                )))
+                ).to_dict())
 
         return result
 
@@ -1170,6 +1250,16 @@ def show_media_location(content: str) -> List[Dict[str, Any]]:
         return [{"error": f"Error parsing command output: {str(e)}"}]
 
 
+VERSION_PATTERN           = re.compile(r'Version\s+:\s+(.+)')
+VERSION_XR_PATTERN        = re.compile(r'Cisco IOS XR Software.*?Version\s+(\S+)')
+VERSION_UPTIME_PATTERN    = re.compile(r'uptime is\s+(.+)')
+VERSION_IMAGE_PATTERN     = re.compile(r'image file is\s+"?(\S+)"?', re.IGNORECASE)
+VERSION_PROCESSOR_PATTERN = re.compile(r'processor\s+with\s+(.+)', re.IGNORECASE)
+VERSION_SERIAL_PATTERN    = re.compile(r'[Ss]erial\s+[Nn]umber\s*:\s*(\S+)')
+VERSION_CHASSIS_PATTERN   = re.compile(r'[Cc]hassis\s+[Ss]N\s*:\s*(\S+)')
+VERSION_ROM_PATTERN       = re.compile(r'ROM:\s+(.+)')
+VERSION_BUILT_PATTERN     = re.compile(r'Built\s+:\s+(.+)')
+
 # ---------------------------------------------------------------------------
 # show version
 # ---------------------------------------------------------------------------
@@ -1186,19 +1276,19 @@ def show_version(content: str) -> List[Dict[str, Any]]:
         if not content:
             raise ValueError(f"No output found for command: {cmd}")
 
-        version_match = re.search(r'Version\s+:\s+(.+)', content)
+        version_match = VERSION_PATTERN.search(content)
         if not version_match:
-            version_match = re.search(r'Cisco IOS XR Software.*?Version\s+(\S+)', content)
+            version_match = VERSION_XR_PATTERN.search(content)
 
-        uptime_match = re.search(r'uptime is\s+(.+)', content)
-        image_match = re.search(r'image file is\s+"?(\S+)"?', content, re.IGNORECASE)
-        processor_match = re.search(r'processor\s+with\s+(.+)', content, re.IGNORECASE)
-        serial_match = re.search(r'[Ss]erial\s+[Nn]umber\s*:\s*(\S+)', content)
-        chassis_match = re.search(r'[Cc]hassis\s+[Ss]N\s*:\s*(\S+)', content)
-        rom_match = re.search(r'ROM:\s+(.+)', content)
-        build_info_match = re.search(r'Built\s+:\s+(.+)', content)
+        uptime_match = VERSION_UPTIME_PATTERN.search(content)
+        image_match = VERSION_IMAGE_PATTERN.search(content)
+        processor_match = VERSION_PROCESSOR_PATTERN.search(content)
+        serial_match = VERSION_SERIAL_PATTERN.search(content)
+        chassis_match = VERSION_CHASSIS_PATTERN.search(content)
+        rom_match = VERSION_ROM_PATTERN.search(content)
+        build_info_match = VERSION_BUILT_PATTERN.search(content)
 
-        result = [asdict(ShowVersion(
+        result = [ShowVersion(
             Version=version_match.group(1).strip() if version_match else "",
             Uptime=uptime_match.group(1).strip() if uptime_match else "",
             ImageFile=image_match.group(1).strip() if image_match else "",
@@ -1208,7 +1298,7 @@ def show_version(content: str) -> List[Dict[str, Any]]:
             ),
             ROM=rom_match.group(1).strip() if rom_match else "",
             BuildInfo=build_info_match.group(1).strip() if build_info_match else ""
-        ))]
+        ).to_dict()]
 
         return result
 
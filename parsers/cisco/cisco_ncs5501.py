@@ -21,7 +21,7 @@ def show_inventory() -> List[dict]:
     command: show inventory
     """
     try:
-        print("Running Show inventory ....") 
+        logger.debug("Running Show inventory ....") 
         cmd = "show inventory"
         
         content = COMMAND_OUTPUT_STORE.get(cmd).get("output")
@@ -37,13 +37,13 @@ def show_inventory() -> List[dict]:
             r'SN:\s*(?P<SN>\S+)'
         )  
 
-        print("pattern: ", pattern)
+        logger.debug("pattern: %s", pattern)
         inventory = [] 
 
         matches = list(pattern.finditer(content))
 
         for match in matches: 
-            print("match: ", match)
+            logger.debug("match: %s", match)
             inventory.append(
                 asdict(
                     cisco_ncs5501.ShowInventory(
@@ -56,7 +56,7 @@ def show_inventory() -> List[dict]:
                 )
             )
             
-        print("inventory: ", inventory)
+        logger.debug("inventory: %s", inventory)
 
         # Creating json file 
         output_file = write_json(
@@ -71,6 +71,11 @@ def show_inventory() -> List[dict]:
     except Exception as e: 
         return {"error": f"Error reading file: {str(e)}"}
 
+
+INSTALL_ACTIVE_COUNT_PATTERN   = re.compile(r'Active Packages:\s*(?P<count>\d+)')
+INSTALL_ACTIVE_PACKAGE_PATTERN = re.compile(r'^\s+(?!Active)(?!Mon)(\S+)', re.MULTILINE)
+
+
 def show_install_active_summary() -> Dict[str, Any]:
     """
     Docstring for show_install_active_summary
@@ -81,26 +86,19 @@ def show_install_active_summary() -> Dict[str, Any]:
     :rtype: Dict[str, Any]
     """
     try: 
-        print(" Show install active summary ....")
+        logger.debug(" Show install active summary ....")
         cmd = "show install active summary"
         content = COMMAND_OUTPUT_STORE.get(cmd)
-        print(f" Content: {content}")
+        logger.debug(" Content: %s", content)
         if not content: 
             raise ValueError(f"No output found for command: {cmd}")
 
-        match = re.search(
-            r'Active Packages:\s*(?P<count>\d+)', 
-            content
-        )
+        match = INSTALL_ACTIVE_COUNT_PATTERN.search(content)
         activePackages = int(match.group("count")) if match else 0
         
-        print(f" Active Packages: {activePackages}")
+        logger.debug(" Active Packages: %s", activePackages)
 
-        package = re.findall(
-            r'^\s+(?!Active)(?!Mon)(\S+)',
-            content,
-            re.MULTILINE
-        )
+        package = INSTALL_ACTIVE_PACKAGE_PATTERN.findall(content)
 
         packages = [line.strip() for line in package  if line.strip() ]
 
@@ -125,6 +123,11 @@ def show_install_active_summary() -> Dict[str, Any]:
     except Exception as e: 
         return {"error": f"Error reading file: {str(e)}"}
             
+
+
+COLUMN_SPLIT_PATTERN = re.compile(r'\s{2,}')
+
+
 def show_platform() -> Dict[str, Any]: 
     """
     Docstring for show_platform
@@ -135,10 +138,10 @@ def show_platform() -> Dict[str, Any]:
     :rtype: Dict[str, Any]
     """
     try: 
-        print("Show platform ...")
+        logger.debug("Show platform ...")
         cmd = "show platform" 
         content = COMMAND_OUTPUT_STORE.get(cmd)
-        print(f" Content: {content}")
+        logger.debug(" Content: %s", content)
         if not content: 
             raise ValueError(f"No output found for command: {cmd}")
 
@@ -146,14 +149,14 @@ def show_platform() -> Dict[str, Any]:
 
         for line in content.splitlines(): 
             line = line.strip()
-            print(f" Line: {line}") 
+            logger.debug(" Line: %s", line) 
 
             # Skip headers and separators 
             if not line or line.startswith("Node") or line.startswith("-"): 
                 continue
 
-            cols = re.split(r'\s{2,}', line)
-            print(f" cols: {cols}")
+            cols = COLUMN_SPLIT_PATTERN.split(line)
+            logger.debug(" cols: %s", cols)
 
             entry = ShowPlatform(
                 Node=cols[0], 
@@ -161,10 +164,10 @@ def show_platform() -> Dict[str, Any]:
                 State=cols[2], 
                 ConfigState=cols[3] if len(cols) > 3 else None
             )
-            print(f" entry: {entry}")
+            logger.debug(" entry: %s", entry)
             result.append(asdict(entry))
-            print(f" result: {result}")
-        print(f" Result: {result}")
+            logger.debug(" result: %s", result)
+        logger.debug(" Result: %s", result)
 
         # Creating json file 
         output_file = write_json(
@@ -179,6 +182,12 @@ def show_platform() -> Dict[str, Any]:
     except Exception as e: 
         return {"error": f"Error reading file: {str(e)}"}
     
+
+
+INSTALL_COMMITTED_COUNT_PATTERN   = re.compile(r'Committed Packages:\s*(?P<count>\d+)')
+INSTALL_COMMITTED_PACKAGE_PATTERN = re.compile(r'^\s+(\S+)', re.MULTILINE)
+
+
 def show_install_committed_summary() -> Dict[str, Any]: 
     """
     Docstring for show_install_committed_summary
@@ -189,27 +198,20 @@ def show_install_committed_summary() -> Dict[str, Any]:
     :rtype: Dict[str, Any]
     """
     try: 
-        print("show install committed summary ...")
+        logger.debug("show install committed summary ...")
         cmd = "show install committed summary"
         content = COMMAND_OUTPUT_STORE.get(cmd)
-        print(f" Content: {content}")
+        logger.debug(" Content: %s", content)
         if not content: 
             raise ValueError(f"No output found for command: {cmd}")
         
-        match = re.search(
-            r'Committed Packages:\s*(?P<count>\d+)',
-            content
-        )
+        match = INSTALL_COMMITTED_COUNT_PATTERN.search(content)
 
         committedPackages = int(match.group("count")) if match else 0 
 
-        print(f"Committed Package: {committedPackages}")
+        logger.debug("Committed Package: %s", committedPackages)
 
-        package = re.findall(
-            r'^\s+(\S+)', 
-            content, 
-            re.MULTILINE
-        )
+        package = INSTALL_COMMITTED_PACKAGE_PATTERN.findall(content)
 
         packages = [line.strip() for line in package  if line.strip() ]
 
@@ -233,6 +235,12 @@ def show_install_committed_summary() -> Dict[str, Any]:
     except Exception as e: 
         return {"error": f"Error reading file: {str(e)}"}
     
+
+
+FPD_AUTO_UPGRADE_PATTERN = re.compile(r'^Auto-upgrade\s*:\s*(?P<AutoUpgrade>\S+)', re.MULTILINE)
+WHITESPACE_SPLIT_PATTERN = re.compile(r'\s{1,}')
+
+
 def show_hw_module_fpd(): 
     """
     Docstring for show_hw_module_fpd
@@ -241,26 +249,22 @@ def show_hw_module_fpd():
     :type folder_path: str
     """
     try: 
-        print("show hw_module fpd ...")
+        logger.debug("show hw_module fpd ...")
         
         cmd = "show hw-module fpd"
         content = COMMAND_OUTPUT_STORE.get(cmd)
-        print(f" Content: {content}")
+        logger.debug(" Content: %s", content)
         if not content: 
             raise ValueError(f"No output found for command: {cmd}")
 
-        auto_upgrade_pattern = re.search(
-            r'^Auto-upgrade\s*:\s*(?P<AutoUpgrade>\S+)',
-            content,
-            re.MULTILINE
-        )
+        auto_upgrade_pattern = FPD_AUTO_UPGRADE_PATTERN.search(content)
 
         auto_upgrade = auto_upgrade_pattern.group("AutoUpgrade") if auto_upgrade_pattern else ""
         fpds, result = [], []
 
         for line in content.splitlines(): 
             line  = line.strip() 
-            print(f" Line: {line}")
+            logger.debug(" Line: %s", line)
 
             if (
                 not line 
@@ -272,12 +276,12 @@ def show_hw_module_fpd():
             ): 
                 continue 
 
-            cols = re.split(r'\s{1,}', line)
+            cols = WHITESPACE_SPLIT_PATTERN.split(line)
             # print(f" cols: {cols}")
 
             # card_type, hwver, fpd_device = cols[1].split()
 
-            print(f" cols: {cols}")
+            logger.debug(" cols: %s", cols)
             # print(f"cardType: {card_type}, hwver: {hwver}, and fpddevice: {fpd_device}")
             fpd_version = { 
                 "Running": float(cols[5]), 
@@ -304,7 +308,7 @@ def show_hw_module_fpd():
                 "FPDs": fpds
             }
         )
-        print(f" Result: {result}")
+        logger.debug(" Result: %s", result)
         # Creating json file 
         output_file = write_json(
             command_name="show_hw_module_fpd", 
@@ -318,6 +322,10 @@ def show_hw_module_fpd():
     except Exception as e: 
         return {"error": f"Error reading file: {str(e)}"}
 
+
+MEDIA_LOCATION_PATTERN = re.compile(r'^Media Info for Location:\s*([A-Za-z0-9_-]+)$', re.MULTILINE)
+
+
 def show_media(): 
     """
     Docstring for show_media
@@ -326,27 +334,23 @@ def show_media():
     :type folder_path: str
     """
     try: 
-        print("show media ...")
+        logger.debug("show media ...")
         
         cmd = "show media"
         content = COMMAND_OUTPUT_STORE.get(cmd)
-        print(f" Content: {content}")
+        logger.debug(" Content: %s", content)
         if not content: 
             raise ValueError(f"No output found for command: {cmd}")
 
-        print(f" Content: {content}")
+        logger.debug(" Content: %s", content)
         mediaInfo, result = [] , []
 
-        mediaLocation = re.search(
-            r'^Media Info for Location:\s*([A-Za-z0-9_-]+)$',
-            content, 
-            re.MULTILINE
-        )
+        mediaLocation = MEDIA_LOCATION_PATTERN.search(content)
         location = mediaLocation.group(1) if mediaLocation else ""
 
         for line in content.splitlines(): 
             line = line.strip() 
-            print(f" Line: {line}")
+            logger.debug(" Line: %s", line)
 
             # Skip headers and separators 
             if (
@@ -357,8 +361,8 @@ def show_media():
                 ): 
                 continue 
             
-            cols = re.split(r'\s{2,}', line)
-            print(f"cols: {cols}")
+            cols = COLUMN_SPLIT_PATTERN.split(line)
+            logger.debug("cols: %s", cols)
 
             entry = MediaInfo( 
                 Partition=cols[0], 
@@ -368,7 +372,7 @@ def show_media():
                 Avail=cols[4]
             )
             mediaInfo.append(asdict(entry))
-            print(f"Media Info: {mediaInfo}")
+            logger.debug("Media Info: %s", mediaInfo)
         
         result.append(
             {
@@ -376,7 +380,7 @@ def show_media():
                 "MediaInfo": mediaInfo
             }
         )
-        print(f" Result: {result}")
+        logger.debug(" Result: %s", result)
 
         output_file = write_json(
             command_name="show_media", 
@@ -398,11 +402,11 @@ def show_route_summary():
     :type folder_path: str
     """
     try: 
-        print(" show route summary ...")
+        logger.debug(" show route summary ...")
         
         cmd = "show route summary"
         content = COMMAND_OUTPUT_STORE.get(cmd)
-        print(f" Content: {content}")
+        logger.debug(" Content: %s", content)
         if not content: 
             raise ValueError(f"No output found for command: {cmd}")
 
@@ -410,7 +414,7 @@ def show_route_summary():
 
         for line in content.splitlines(): 
             line = line.strip() 
-            print(f" Line: {line}")
+            logger.debug(" Line: %s", line)
 
             if ( 
                 not line 
@@ -418,8 +422,8 @@ def show_route_summary():
             ): 
                 continue 
 
-            cols = re.split(r'\s{2,}', line)
-            print(f" cols: {cols}")
+            cols = COLUMN_SPLIT_PATTERN.split(line)
+            logger.debug(" cols: %s", cols)
 
             entry = ShowRouteSummary(
                 routeSource=cols[0],
@@ -454,7 +458,7 @@ def show_watchdog_memory_state():
         
         cmd = "show watchdog memory-state location all"
         content = COMMAND_OUTPUT_STORE.get(cmd)
-        print(f" Content: {content}")
+        logger.debug(" Content: %s", content)
         if not content: 
             raise ValueError(f"No output found for command: {cmd}")
         
@@ -504,7 +508,7 @@ def show_ipv4_vrf_all_interface_brief():
 
         cmd = "show ipv4 vrf all interface brief"
         content = COMMAND_OUTPUT_STORE.get(cmd).get("output")
-        print(f" Content: {content}")
+        logger.debug(" Content: %s", content)
         if not content:
             raise ValueError(f"No output found for command: {cmd}")
 
@@ -512,7 +516,7 @@ def show_ipv4_vrf_all_interface_brief():
 
         for line in content.splitlines():
             line = line.strip()
-            print(f" line: {line}")
+            logger.debug(" line: %s", line)
 
             if(
                 not line
@@ -520,8 +524,8 @@ def show_ipv4_vrf_all_interface_brief():
             ):
                 continue
 
-            cols = re.split(r'\s{2,}', line)
-            print(f"cols: {cols}")
+            cols = COLUMN_SPLIT_PATTERN.split(line)
+            logger.debug("cols: %s", cols)
 
             entry = ShowIpv4VrfAllInterfaceBrief(
                 interface = cols[0],
@@ -531,7 +535,7 @@ def show_ipv4_vrf_all_interface_brief():
                 VRFName = cols[4]
             )
             result.append(asdict(entry))
-        print(f"result: {result}")
+        logger.debug("result: %s", result)
 
         output_file = write_json(
             command_name="show_ipv4_vrf_all_interface_brief",
@@ -544,28 +548,29 @@ def show_ipv4_vrf_all_interface_brief():
     except Exception as e:
         return {"error": f"Error reading file: {str(e)}"}
 
+
+LLDP_TOTAL_PATTERN = re.compile(r'^Total\sentries\sdisplayed:\s*(?P<count>\d+)')
+
+
 def show_lldp_neighbors():
     try:
         logger.info("show lldp neighbors")
 
         cmd = "show lldp neighbors"
         content = COMMAND_OUTPUT_STORE.get(cmd).get("output")
-        print(f" Content: {content}")
+        logger.debug(" Content: %s", content)
         if not content:
             raise ValueError(f"No output found for command: {cmd}")
 
         result, neighbors = [], []
 
-        match = re.search(
-            r'^Total\sentries\sdisplayed:\s*(?P<count>\d+)',
-            content
-        )
+        match = LLDP_TOTAL_PATTERN.search(content)
         total_neighbors = int(match.group("count")) if match else 0
 
 
         for line in content.splitlines():
             line = line.strip()
-            print(f" line: {line}")
+            logger.debug(" line: %s", line)
 
             if(
                 not line
@@ -576,7 +581,7 @@ def show_lldp_neighbors():
             ):
                 continue
 
-            cols = re.split(r'\s{1,}', line)
+            cols = WHITESPACE_SPLIT_PATTERN.split(line)
 
             entry = lldpNeighbors(
                 deviceId = cols[0],
@@ -605,28 +610,30 @@ def show_lldp_neighbors():
     except Exception as e:
         return {"error": f"Error reading file: {str(e)}"}
 
+
+ISIS_LEVEL_PATTERN           = re.compile(r'^IS-IS\sCOLT\sLevel-(?P<adjacencyLevel>\d+)')
+ISIS_ADJACENCY_COUNT_PATTERN = re.compile(r'^Total\s+adjacency\s+count:\s*(?P<adjacencyCount>\d+)', re.MULTILINE)
+
+
 def show_isis_adjacency():
     try:
         logger.info("show isis adjacency")
 
         cmd = "show isis adjacency"
         content = pre_output.get(cmd).get("output")
-        print(f" Content: {content}")
+        logger.debug(" Content: %s", content)
         if not content:
             raise ValueError(f"No output found for command: {cmd}")
 
         result, adjacencies = [], []
 
-        match = re.search(
-            r'^IS-IS\sCOLT\sLevel-(?P<adjacencyLevel>\d+)',
-            content
-        )
+        match = ISIS_LEVEL_PATTERN.search(content)
         adjacencyLevel = int(match.group("adjacencyLevel")) if match else 0
-        print(f"Adjacency Level: {adjacencyLevel}")
+        logger.debug("Adjacency Level: %s", adjacencyLevel)
 
         for line in content.splitlines():
             line = line.strip()
-            print(f" line: {line}")
+            logger.debug(" line: %s", line)
 
             if(
                 not line
@@ -637,8 +644,8 @@ def show_isis_adjacency():
             ):
                 continue
             
-            cols = re.split(r'\s{1,}', line)
-            print(f"cols: {cols}")
+            cols = WHITESPACE_SPLIT_PATTERN.split(line)
+            logger.debug("cols: %s", cols)
 
             entry = ISISAdjacencies(
                 systemID = cols[0],
@@ -652,16 +659,12 @@ def show_isis_adjacency():
                 ipv6BFD = cols[8]
             )
             adjacencies.append(asdict(entry))
-        print(f"adjacency: {adjacencies}")
+        logger.debug("adjacency: %s", adjacencies)
 
-        match = re.search(
-            r'^Total\s+adjacency\s+count:\s*(?P<adjacencyCount>\d+)',
-            content,
-            re.MULTILINE
-        )
+        match = ISIS_ADJACENCY_COUNT_PATTERN.search(content)
 
         adjacencyCount = int(match.group("adjacencyCount")) if match else 0 
-        print(f"Adjacency count: {adjacencyCount}")
+        logger.debug("Adjacency count: %s", adjacencyCount)
 
         result.append(
             {
@@ -670,7 +673,7 @@ def show_isis_adjacency():
                 "totalAdjacency": adjacencyCount
             }
         )
-        print(f" result: {result}")
+        logger.debug(" result: %s", result)
 
         output_file = write_json(
             command_name="show_isis_adjacencies",
@@ -685,10 +688,10 @@ def show_isis_adjacency():
                                              
 def show_interface_description():
         logger.info("show interface description")
-        print("coming")
+        logger.debug("coming")
         cmd = "show interface description"
         content = COMMAND_OUTPUT_STORE.get(cmd).get("output")
-        print(f" Content: {content}\n")
+        logger.debug(" Content: %s\n", content)
         if not content:
             raise ValueError(f"No output found for command: {cmd}")
 
@@ -696,7 +699,7 @@ def show_interface_description():
 
         for line in content.splitlines():
             line = line.strip()
-            print(f"Line: {line}")
+            logger.debug("Line: %s", line)
 
             if (
                 not line
@@ -705,8 +708,8 @@ def show_interface_description():
             ):
                 continue
 
-            cols = re.split(r'\s{2,}', line)
-            print(f"cols: {cols}")
+            cols = COLUMN_SPLIT_PATTERN.split(line)
+            logger.debug("cols: %s", cols)
 
             entry = ShowInterfaceDescription(
                     interface = cols[0],
@@ -716,7 +719,7 @@ def show_interface_description():
             )
 
             result.append(asdict(entry))
-        print(f"result: {result}")
+        logger.debug("result: %s", result)
         output_file = write_json(
             command_name="show_interface_description",
             vendor="cisco",
@@ -1,156 +1,162 @@
-import re
+# Optional regex engine (VERSION0 keeps re semantics); stdlib re on PyPy or when missing.
+import sys
+if sys.implementation.name == 'pypy':
+    import re
+else:
+    try:
+        import regex as re
+    except ImportError:
+        import re
+import io
 import json
-from dataclasses import asdict
+from dataclasses import dataclass
+from functools import partial
 from models.juniper.juniper_mx204 import *
 from typing import Any, Dict
 
 
 # ────────────────────────────────────────────────────────────────────────────────
+# Table-driven parsers: one regex row per entry, groups map onto entry fields
+# in declaration order. Used by the flat tabular commands below.
+# CLI output is plain ASCII, so module-level patterns compile with re.ASCII
+# and \d / \s / \w skip Unicode category lookups.
+# ────────────────────────────────────────────────────────────────────────────────
+@dataclass(frozen=True)
+class ParserSpec:
+    cmd: str
+    pattern: re.Pattern
+    result_cls: type
+    entry_cls: type
+
+
+def run_parser_spec(spec: ParserSpec, text_content: str):
+    result = spec.result_cls()
+    entry_cls = spec.entry_cls
+    result.entries = [entry_cls(*match.groups()) for match in spec.pattern.finditer(text_content)]
+    return result
+
+
+ARP_SPEC = ParserSpec(
+    cmd="show arp no-resolve | no-more",
+    pattern=re.compile(r'([0-9a-f:]{17})\s+(\d{1,3}(?:\.\d{1,3}){3})\s+(\S+)\s+(\S+)', re.IGNORECASE | re.ASCII),
+    result_cls=ShowArpNoResolve,
+    entry_cls=ShowArpNoResolveEntry,
+)
+
+LLDP_SPEC = ParserSpec(
+    cmd="show lldp neighbors | no-more",
+    pattern=re.compile(r'^\s*(\S+)\s+(\S+)\s+([0-9A-Fa-f:]{17})\s+(\S+)\s+(.+?)\s*$', re.MULTILINE | re.ASCII),
+    result_cls=ShowLldpNeighbors,
+    entry_cls=ShowLldpNeighborsEntry,
+)
+
+BFD_SPEC = ParserSpec(
+    cmd="show bfd session | no-more",
+    pattern=re.compile(r'(\d{1,3}(?:\.\d{1,3}){3})\s+(\S+)\s+(\S+)\s+([\d.]+)\s+([\d.]+)\s+(\d+)', re.ASCII),
+    result_cls=ShowBfdSession,
+    entry_cls=ShowBfdSessionEntry,
+)
+
+
+# ────────────────────────────────────────────────────────────────────────────────
+ARP_TOTAL_PATTERN = re.compile(r'Total entries:\s*(\d+)', re.ASCII)
+
+
 def parse_show_arp_no_resolve(text_content: str) -> Dict[str, Any]:
-    cmd = "show arp no-resolve | no-more"
+    cmd = ARP_SPEC.cmd
     try:
-        result = ShowArpNoResolve()
-        pattern = r'([0-9a-f:]{17})\s+(\d+\.\d+\.\d+\.\d+)\s+(\S+)\s+(\S+)'
-        for match in re.finditer(pattern, text_content, re.IGNORECASE):
-            entry = ShowArpNoResolveEntry(
-                mac_address=match.group(1),
-                ip_address=match.group(2),
-                interface=match.group(3),
-                flags=match.group(4)
-            )
-            result.entries.append(entry)
+        result = run_parser_spec(ARP_SPEC, text_content)
 
-        total_match = re.search(r'Total entries:\s*(\d+)', text_content)
+        total_match = ARP_TOTAL_PATTERN.search(text_content)
         result.total_entries = int(total_match.group(1)) if total_match else len(result.entries)
 
-        return asdict(result)
+        return result.to_dict()
     except Exception as e:
         return {"error": f"Error parsing {cmd}: {str(e)}"}
 
 
 # ────────────────────────────────────────────────────────────────────────────────
 def parse_show_lldp_neighbors(text_content: str) -> Dict[str, Any]:
-    cmd = "show lldp neighbors | no-more"
+    cmd = LLDP_SPEC.cmd
     try:
-        result = ShowLldpNeighbors()
-
-        pattern = re.compile(
-            r'^\s*(\S+)\s+(\S+)\s+([0-9A-Fa-f:]{17})\s+(\S+)\s+(.+)$',
-            re.MULTILINE
-        )
-
-        for match in pattern.finditer(text_content):
-            local_interface = match.group(1)
-            parent_interface = match.group(2)
-            chassis_id = match.group(3)
-            port_info = match.group(4)
-            system_name = match.group(5).strip()
-
-            if local_interface.lower() == 'local' and parent_interface.lower() == 'interface':
-                continue
-
-            entry = ShowLldpNeighborsEntry(
-                local_interface=local_interface,
-                parent_interface=parent_interface,
-                chassis_id=chassis_id,
-                port_info=port_info,
-                system_name=system_name,
-            )
-            result.entries.append(entry)
-
-        return asdict(result)
+        # The header row never carries a 17-char chassis id, so it cannot match
+        return run_parser_spec(LLDP_SPEC, text_content).to_dict()
     except Exception as e:
         return {"error": f"Error parsing {cmd}: {str(e)}"}
 
 
 # ────────────────────────────────────────────────────────────────────────────────
+ROUTING_ENGINE_TEMPERATURE_PATTERN     = re.compile(r'Temperature\s+(\d+\s+degrees\s+C\s+/\s+\d+\s+degrees\s+F)', re.ASCII)
+ROUTING_ENGINE_CPU_TEMPERATURE_PATTERN = re.compile(r'CPU temperature\s+(\d+\s+degrees\s+C\s+/\s+\d+\s+degrees\s+F)', re.ASCII)
+ROUTING_ENGINE_DRAM_PATTERN            = re.compile(r'DRAM\s+(\d+\s+MB.*)', re.ASCII)
+ROUTING_ENGINE_MEMORY_UTIL_PATTERN     = re.compile(r'Memory utilization\s+(\d+)\s+percent', re.ASCII)
+# All four CPU utilization blocks in one scan; the interval picks the field
+ROUTING_ENGINE_CPU_UTIL_PATTERN        = re.compile(
+    r'(5 sec|1 min|5 min|15 min) CPU utilization:\s+User\s+(\d+)\s+percent\s+Background\s+(\d+)\s+percent\s+'
+    r'Kernel\s+(\d+)\s+percent\s+Interrupt\s+(\d+)\s+percent\s+Idle\s+(\d+)\s+percent',
+    re.ASCII
+)
+ROUTING_ENGINE_CPU_UTIL_FIELDS         = {
+    '5 sec':  'cpu_util_5_sec',
+    '1 min':  'cpu_util_1_min',
+    '5 min':  'cpu_util_5_min',
+    '15 min': 'cpu_util_15_min',
+}
+ROUTING_ENGINE_MODEL_PATTERN           = re.compile(r'Model\s+(.+)', re.ASCII)
+ROUTING_ENGINE_START_TIME_PATTERN      = re.compile(r'Start time\s+(.+)', re.ASCII)
+ROUTING_ENGINE_UPTIME_PATTERN          = re.compile(r'Uptime\s+(.+)', re.ASCII)
+ROUTING_ENGINE_REBOOT_REASON_PATTERN   = re.compile(r'Last reboot reason\s+(.+)', re.ASCII)
+ROUTING_ENGINE_LOAD_AVERAGES_PATTERN   = re.compile(r'Load averages:.*?\n\s+([\d.]+)\s+([\d.]+)\s+([\d.]+)', re.ASCII)
+
+
 def parse_29_show_chassis_routing_engine(text_content: str) -> Dict[str, Any]:
     cmd = "show chassis routing-engine | no-more"
     try:
         routing_engine_result = ShowChassisRoutingEngine()
         re_status = RoutingEngineStatus()
 
-        temp_match = re.search(r'Temperature\s+(\d+\s+degrees\s+C\s+/\s+\d+\s+degrees\s+F)', text_content)
+        temp_match = ROUTING_ENGINE_TEMPERATURE_PATTERN.search(text_content)
         if temp_match:
             re_status.temperature = temp_match.group(1)
 
-        cpu_temp_match = re.search(r'CPU temperature\s+(\d+\s+degrees\s+C\s+/\s+\d+\s+degrees\s+F)', text_content)
+        cpu_temp_match = ROUTING_ENGINE_CPU_TEMPERATURE_PATTERN.search(text_content)
         if cpu_temp_match:
             re_status.cpu_temperature = cpu_temp_match.group(1)
 
-        dram_match = re.search(r'DRAM\s+(\d+\s+MB.*?)(?:\n|$)', text_content)
+        dram_match = ROUTING_ENGINE_DRAM_PATTERN.search(text_content)
         if dram_match:
             re_status.dram = dram_match.group(1).strip()
 
-        mem_util_match = re.search(r'Memory utilization\s+(\d+)\s+percent', text_content)
+        mem_util_match = ROUTING_ENGINE_MEMORY_UTIL_PATTERN.search(text_content)
         if mem_util_match:
             re_status.memory_utilization = int(mem_util_match.group(1))
 
-        cpu_5sec_block = re.search(
-            r'5 sec CPU utilization:\s+User\s+(\d+)\s+percent\s+Background\s+(\d+)\s+percent\s+'
-            r'Kernel\s+(\d+)\s+percent\s+Interrupt\s+(\d+)\s+percent\s+Idle\s+(\d+)\s+percent',
-            text_content
-        )
-        if cpu_5sec_block:
-            re_status.cpu_util_5_sec = CpuUtilization(
-                user=int(cpu_5sec_block.group(1)), background=int(cpu_5sec_block.group(2)),
-                kernel=int(cpu_5sec_block.group(3)), interrupt=int(cpu_5sec_block.group(4)),
-                idle=int(cpu_5sec_block.group(5))
-            )
-
-        cpu_1min_block = re.search(
-            r'1 min CPU utilization:\s+User\s+(\d+)\s+percent\s+Background\s+(\d+)\s+percent\s+'
-            r'Kernel\s+(\d+)\s+percent\s+Interrupt\s+(\d+)\s+percent\s+Idle\s+(\d+)\s+percent',
-            text_content
-        )
-        if cpu_1min_block:
-            re_status.cpu_util_1_min = CpuUtilization(
-                user=int(cpu_1min_block.group(1)), background=int(cpu_1min_block.group(2)),
-                kernel=int(cpu_1min_block.group(3)), interrupt=int(cpu_1min_block.group(4)),
-                idle=int(cpu_1min_block.group(5))
-            )
-
-        cpu_5min_block = re.search(
-            r'5 min CPU utilization:\s+User\s+(\d+)\s+percent\s+Background\s+(\d+)\s+percent\s+'
-            r'Kernel\s+(\d+)\s+percent\s+Interrupt\s+(\d+)\s+percent\s+Idle\s+(\d+)\s+percent',
-            text_content
-        )
-        if cpu_5min_block:
-            re_status.cpu_util_5_min = CpuUtilization(
-                user=int(cpu_5min_block.group(1)), background=int(cpu_5min_block.group(2)),
-                kernel=int(cpu_5min_block.group(3)), interrupt=int(cpu_5min_block.group(4)),
-                idle=int(cpu_5min_block.group(5))
-            )
-
-        cpu_15min_block = re.search(
-            r'15 min CPU utilization:\s+User\s+(\d+)\s+percent\s+Background\s+(\d+)\s+percent\s+'
-            r'Kernel\s+(\d+)\s+percent\s+Interrupt\s+(\d+)\s+percent\s+Idle\s+(\d+)\s+percent',
-            text_content
-        )
-        if cpu_15min_block:
-            re_status.cpu_util_15_min = CpuUtilization(
-                user=int(cpu_15min_block.group(1)), background=int(cpu_15min_block.group(2)),
-                kernel=int(cpu_15min_block.group(3)), interrupt=int(cpu_15min_block.group(4)),
-                idle=int(cpu_15min_block.group(5))
-            )
+        # First block per interval wins, as with one search per interval
+        for cpu_block in ROUTING_ENGINE_CPU_UTIL_PATTERN.finditer(text_content):
+            field_name = ROUTING_ENGINE_CPU_UTIL_FIELDS[cpu_block.group(1)]
+            if getattr(re_status, field_name) is None:
+                user, background, kernel, interrupt, idle = map(int, cpu_block.group(2, 3, 4, 5, 6))
+                setattr(re_status, field_name, CpuUtilization(
+                    user=user, background=background, kernel=kernel, interrupt=interrupt, idle=idle
+                ))
 
-        model_match = re.search(r'Model\s+(.+?)(?:\n|$)', text_content)
+        model_match = ROUTING_ENGINE_MODEL_PATTERN.search(text_content)
         if model_match:
             re_status.model = model_match.group(1).strip()
 
-        start_time_match = re.search(r'Start time\s+(.+?)(?:\n|$)', text_content)
+        start_time_match = ROUTING_ENGINE_START_TIME_PATTERN.search(text_content)
         if start_time_match:
             re_status.start_time = start_time_match.group(1).strip()
 
-        uptime_match = re.search(r'Uptime\s+(.+?)(?:\n|$)', text_content)
+        uptime_match = ROUTING_ENGINE_UPTIME_PATTERN.search(text_content)
         if uptime_match:
             re_status.uptime = uptime_match.group(1).strip()
 
-        reboot_match = re.search(r'Last reboot reason\s+(.+?)(?:\n|$)', text_content)
+        reboot_match = ROUTING_ENGINE_REBOOT_REASON_PATTERN.search(text_content)
         if reboot_match:
             re_status.last_reboot_reason = reboot_match.group(1).strip()
 
-        load_avg_match = re.search(r'Load averages:.*?\n\s+([\d.]+)\s+([\d.]+)\s+([\d.]+)', text_content)
+        load_avg_match = ROUTING_ENGINE_LOAD_AVERAGES_PATTERN.search(text_content)
         if load_avg_match:
             re_status.load_averages = LoadAverages(
                 one_minute=float(load_avg_match.group(1)),
@@ -165,39 +171,49 @@ def parse_29_show_chassis_routing_engine(text_content: str) -> Dict[str, Any]:
 
 
 # ────────────────────────────────────────────────────────────────────────────────
+UPTIME_CURRENT_TIME_PATTERN      = re.compile(r'Current time:\s+(.+)', re.ASCII)
+UPTIME_TIME_SOURCE_PATTERN       = re.compile(r'Time Source:\s+(.+)', re.ASCII)
+UPTIME_SYSTEM_BOOTED_PATTERN     = re.compile(r'System booted:\s+(.+?)\s+\((.+?)\)', re.ASCII)
+UPTIME_PROTOCOLS_STARTED_PATTERN = re.compile(r'Protocols started:\s+(.+?)\s+\((.+?)\)', re.ASCII)
+UPTIME_LAST_CONFIGURED_PATTERN   = re.compile(r'Last configured:\s+(.+?)\s+\((.+?)\)\s+by\s+(.+)', re.ASCII)
+# Anchored so the digit-led clock is only tried at line starts, not at every
+# digit in the timestamps above it
+UPTIME_LINE_PATTERN              = re.compile(
+    r'^[^\S\n]*(\d{1,2}:\d{2}[AP]M)\s+up\s+(.+?),\s+(\d+)\s+users?,\s+load averages?:\s+([\d.]+),\s+([\d.]+),\s+([\d.]+)',
+    re.MULTILINE | re.ASCII
+)
+
+
 def parse_21_show_system_uptime(text_content: str) -> Dict[str, Any]:
     cmd = "show system uptime | no-more"
     try:
         result = ShowSystemUptime()
 
-        current_time_match = re.search(r'Current time:\s+(.+)', text_content)
+        current_time_match = UPTIME_CURRENT_TIME_PATTERN.search(text_content)
         if current_time_match:
             result.current_time = current_time_match.group(1).strip()
 
-        time_source_match = re.search(r'Time Source:\s+(.+)', text_content)
+        time_source_match = UPTIME_TIME_SOURCE_PATTERN.search(text_content)
         if time_source_match:
             result.time_source = time_source_match.group(1).strip()
 
-        system_booted_match = re.search(r'System booted:\s+(.+?)\s+\((.+?)\)', text_content)
+        system_booted_match = UPTIME_SYSTEM_BOOTED_PATTERN.search(text_content)
         if system_booted_match:
             result.system_booted = system_booted_match.group(1).strip()
             result.system_booted_ago = system_booted_match.group(2).strip()
 
-        protocols_started_match = re.search(r'Protocols started:\s+(.+?)\s+\((.+?)\)', text_content)
+        protocols_started_match = UPTIME_PROTOCOLS_STARTED_PATTERN.search(text_content)
         if protocols_started_match:
             result.protocols_started = protocols_started_match.group(1).strip()
             result.protocols_started_ago = protocols_started_match.group(2).strip()
 
-        last_configured_match = re.search(r'Last configured:\s+(.+?)\s+\((.+?)\)\s+by\s+(.+)', text_content)
+        last_configured_match = UPTIME_LAST_CONFIGURED_PATTERN.search(text_content)
         if last_configured_match:
             result.last_configured = last_configured_match.group(1).strip()
             result.last_configured_ago = last_configured_match.group(2).strip()
             result.last_configured_by = last_configured_match.group(3).strip()
 
-        uptime_line_match = re.search(
-            r'(\d{1,2}:\d{2}[AP]M)\s+up\s+(.+?),\s+(\d+)\s+users?,\s+load averages?:\s+([\d.]+),\s+([\d.]+),\s+([\d.]+)',
-            text_content
-        )
+        uptime_line_match = UPTIME_LINE_PATTERN.search(text_content)
         if uptime_line_match:
             result.uptime_time = uptime_line_match.group(1).strip()
             result.uptime_duration = uptime_line_match.group(2).strip()
@@ -212,99 +228,129 @@ def parse_21_show_system_uptime(text_content: str) -> Dict[str, Any]:
 
 
 # ────────────────────────────────────────────────────────────────────────────────
+# Juniper NTP output columns (11 fields):
+# remote  refid  auth  st  t  when  poll  reach  delay  offset  jitter
+# Example:
+#  10.91.141.57   .INIT.   -  16  u  -  1024  0  0.000  +0.000  0.000
+NTP_ASSOCIATION_PATTERN = re.compile(
+    r'^\s*([*#+x\- ]?)(\S+)'   # optional tally + remote
+    r'\s+(\S+)'                # refid
+    r'\s+(\S+)'                # auth
+    r'\s+(\d+)'                # st
+    r'\s+(\w+)'                # t
+    r'\s+(\S+)'                # when (can be '-')
+    r'\s+(\d+)'                # poll
+    r'\s+(\d+)'                # reach
+    r'\s+([\d.]+)'             # delay
+    r'\s+([+\-]?[\d.]+)'       # offset
+    r'\s+([\d.]+)',            # jitter
+    re.ASCII
+)
+
+
 def parse_22_show_ntp_associations(text_content: str) -> Dict[str, Any]:
     cmd = "show ntp associations no-resolve | no-more"
     try:
         result = ShowNtpAssociations()
-
-        # Juniper NTP output columns (11 fields):
-        # remote  refid  auth  st  t  when  poll  reach  delay  offset  jitter
-        # Example:
-        #  10.91.141.57   .INIT.   -  16  u  -  1024  0  0.000  +0.000  0.000
-        ntp_pattern = (
-            r'^\s*([*#+x\- ]?)(\S+)'   # optional tally + remote
-            r'\s+(\S+)'                # refid
-            r'\s+(\S+)'                # auth
-            r'\s+(\d+)'                # st
-            r'\s+(\w+)'                # t
-            r'\s+(\S+)'                # when (can be '-')
-            r'\s+(\d+)'                # poll
-            r'\s+(\d+)'                # reach
-            r'\s+([\d.]+)'             # delay
-            r'\s+([+\-]?[\d.]+)'       # offset
-            r'\s+([\d.]+)'             # jitter
-        )
-
-        for line in text_content.splitlines():
-            if 'remote' in line or '=====' in line or not line.strip():
+        # Rows go straight into result's list through a bound append, so the
+        # loop does no attribute lookups to add an entry; the list grows in
+        # place and is never copied or reassigned.
+        append_association = result.associations.append
+
+        # Header and ===== rule are dropped with a substring test before the
+        # regex runs; a blank line simply fails the match. Lines are read off
+        # a StringIO rather than a splitlines() list, so only one line is
+        # alive at a time; newline=None folds \r\n / \r endings to \n like
+        # splitlines() does, and the trailing \n is ignored by the match.
+        for line in io.StringIO(text_content, newline=None):
+            if 'remote' in line or '=====' in line:
                 continue
-            match = re.match(ntp_pattern, line)
+            match = NTP_ASSOCIATION_PATTERN.match(line)
             if match:
+                _, remote, refid, auth, st, t, when, poll, reach, delay, offset, jitter = match.groups()
                 ntp_entry = NtpAssociation(
-                    remote=match.group(2),
-                    refid=match.group(3),
-                    auth=match.group(4),
-                    st=int(match.group(5)),
-                    t=match.group(6),
-                    when=match.group(7),
-                    poll=int(match.group(8)),
-                    reach=int(match.group(9)),
-                    delay=float(match.group(10)),
-                    offset=match.group(11),
-                    jitter=float(match.group(12)),
+                    remote=remote,
+                    refid=refid,
+                    auth=auth,
+                    st=int(st),
+                    t=t,
+                    when=when,
+                    poll=int(poll),
+                    reach=int(reach),
+                    delay=float(delay),
+                    offset=offset,
+                    jitter=float(jitter),
                 )
-                result.associations.append(ntp_entry)
+                append_association(ntp_entry)
 
         return result.to_dict()
     except Exception as e:
         return {"error": f"Error parsing {cmd}: {str(e)}"}
 
 # ────────────────────────────────────────────────────────────────────────────────
+VMHOST_ROOT_DETAILS_PATTERN  = re.compile(
+    r'Current root details,\s+Device\s+(\S+),\s+Label:\s+(\S+),\s+Partition:\s+(\S+)', re.ASCII
+)
+VMHOST_BOOT_DISK_PATTERN     = re.compile(r'Current boot disk:\s+(.+)', re.ASCII)
+VMHOST_ROOT_SET_PATTERN      = re.compile(r'Current root set:\s+(.+)', re.ASCII)
+VMHOST_UEFI_PATTERN          = re.compile(r'UEFI\s+Version:\s+(.+)', re.ASCII)
+# The disk name runs from the start of its line, so these only try line
+# starts; callers also skip them when the "... Time:" phrase is absent
+VMHOST_DISK_UPGRADE_PATTERN  = re.compile(r'^(.+?Disk),\s+Upgrade Time:\s+(.+)', re.MULTILINE | re.ASCII)
+VMHOST_DISK_SNAPSHOT_PATTERN = re.compile(r'^(.+?Disk),\s+Snapshot Time:\s+(.+)', re.MULTILINE | re.ASCII)
+# Shared by show vmhost version and show vmhost snapshot
+VMHOST_VERSION_SET_PATTERN   = re.compile(
+    r'Version:\s+set\s+(\w+)\s+VMHost Version:\s+(.+?)\s+VMHost Root:\s+(.+?)\s+'
+    r'VMHost Core:\s+(.+?)\s+kernel:\s+(.+?)\s+Junos Disk:\s+(.+?)(?=\n\n|\nVersion:|\Z)',
+    re.DOTALL | re.ASCII
+)
+
+
+def vmhost_version_set_from_row(entry_cls, row):
+    # Shared by show vmhost version and show vmhost snapshot; row is a
+    # findall() tuple: set, vmhost version, root, core, kernel, junos disk
+    version_set, vmhost_version, vmhost_root, vmhost_core, kernel, junos_disk = row
+    return entry_cls(
+        version_set=version_set.strip(),
+        vmhost_version=vmhost_version.strip(),
+        vmhost_root=vmhost_root.strip(),
+        vmhost_core=vmhost_core.strip(),
+        kernel=kernel.strip(),
+        junos_disk=junos_disk.strip()
+    )
+
+
 def parse_23_show_vmhost_version(text_content: str) -> Dict[str, Any]:
     cmd = "show vmhost version | no-more"
     try:
         result = ShowVmhostVersion()
 
-        root_details_match = re.search(
-            r'Current root details,\s+Device\s+(\S+),\s+Label:\s+(\S+),\s+Partition:\s+(\S+)',
-            text_content
-        )
+        root_details_match = VMHOST_ROOT_DETAILS_PATTERN.search(text_content)
         if root_details_match:
             result.current_device = root_details_match.group(1).strip()
             result.current_label = root_details_match.group(2).strip()
             result.current_partition = root_details_match.group(3).strip()
 
-        boot_disk_match = re.search(r'Current boot disk:\s+(.+)', text_content)
+        boot_disk_match = VMHOST_BOOT_DISK_PATTERN.search(text_content)
         if boot_disk_match:
             result.current_boot_disk = boot_disk_match.group(1).strip()
 
-        root_set_match = re.search(r'Current root set:\s+(.+)', text_content)
+        root_set_match = VMHOST_ROOT_SET_PATTERN.search(text_content)
         if root_set_match:
             result.current_root_set = root_set_match.group(1).strip()
 
-        uefi_match = re.search(r'UEFI\s+Version:\s+(.+)', text_content)
+        uefi_match = VMHOST_UEFI_PATTERN.search(text_content)
         if uefi_match:
             result.uefi_version = uefi_match.group(1).strip()
 
-        disk_upgrade_match = re.search(r'(.+?Disk),\s+Upgrade Time:\s+(.+)', text_content)
+        disk_upgrade_match = 'Upgrade Time:' in text_content and VMHOST_DISK_UPGRADE_PATTERN.search(text_content)
         if disk_upgrade_match:
             result.disk_type = disk_upgrade_match.group(1).strip()
             result.upgrade_time = disk_upgrade_match.group(2).strip()
 
-        version_set_pattern = (
-            r'Version:\s+set\s+(\w+)\s+VMHost Version:\s+(.+?)\s+VMHost Root:\s+(.+?)\s+'
-            r'VMHost Core:\s+(.+?)\s+kernel:\s+(.+?)\s+Junos Disk:\s+(.+?)(?=\n\n|\nVersion:|\Z)'
-        )
-        for match in re.finditer(version_set_pattern, text_content, re.DOTALL):
-            version_entry = VmhostVersionSet(
-                version_set=match.group(1).strip(),
-                vmhost_version=match.group(2).strip(),
-                vmhost_root=match.group(3).strip(),
-                vmhost_core=match.group(4).strip(),
-                kernel=match.group(5).strip(),
-                junos_disk=match.group(6).strip()
-            )
-            result.versions.append(version_entry)
+        result.versions = list(map(
+            partial(vmhost_version_set_from_row, VmhostVersionSet), VMHOST_VERSION_SET_PATTERN.findall(text_content)
+        ))
 
         return result.to_dict()
     except Exception as e:
@@ -317,29 +363,18 @@ def parse_24_show_vmhost_snapshot(text_content: str) -> Dict[str, Any]:
     try:
         result = VMHostSnapshot()
 
-        uefi_match = re.search(r'UEFI\s+Version:\s+(.+)', text_content)
+        uefi_match = VMHOST_UEFI_PATTERN.search(text_content)
         if uefi_match:
             result.uefi_version = uefi_match.group(1).strip()
 
-        disk_match = re.search(r'(.+?Disk),\s+Snapshot Time:\s+(.+)', text_content)
+        disk_match = 'Snapshot Time:' in text_content and VMHOST_DISK_SNAPSHOT_PATTERN.search(text_content)
         if disk_match:
             result.disk_type = disk_match.group(1).strip()
             result.snapshot_time = disk_match.group(2).strip()
 
-        version_set_pattern = (
-            r'Version:\s+set\s+(\w+)\s+VMHost Version:\s+(.+?)\s+VMHost Root:\s+(.+?)\s+'
-            r'VMHost Core:\s+(.+?)\s+kernel:\s+(.+?)\s+Junos Disk:\s+(.+?)(?=\n\n|\nVersion:|\Z)'
-        )
-        for match in re.finditer(version_set_pattern, text_content, re.DOTALL):
-            version_entry = VMHostSnapshotVersion(
-                version_set=match.group(1).strip(),
-                vmhost_version=match.group(2).strip(),
-                vmhost_root=match.group(3).strip(),
-                vmhost_core=match.group(4).strip(),
-                kernel=match.group(5).strip(),
-                junos_disk=match.group(6).strip()
-            )
-            result.versions.append(version_entry)
+        result.versions = list(map(
+            partial(vmhost_version_set_from_row, VMHostSnapshotVersion), VMHOST_VERSION_SET_PATTERN.findall(text_content)
+        ))
 
         return result.to_dict()
     except Exception as e:
@@ -347,18 +382,33 @@ def parse_24_show_vmhost_snapshot(text_content: str) -> Dict[str, Any]:
 
 
 # ────────────────────────────────────────────────────────────────────────────────
+# Item names that run past the first token: '' takes an optional slot number
+# ("FPC 0"), a word takes that word plus the slot ("Routing Engine 0").
+HARDWARE_ITEM_NAMES = {
+    'Chassis': '',
+    'FPC':     '',
+    'PIC':     '',
+    'Xcvr':    '',
+    'PEM':     '',
+    'CB':      '',
+    'Routing': 'Engine',
+    'Fan':     'Tray',
+}
+
+
 def parse_25_show_chassis_hardware(text_content: str) -> Dict[str, Any]:
     cmd = "show chassis hardware | no-more"
     try:
         result = ChassisHardware()
+        append_item = result.items.append
 
-        for line in text_content.splitlines():
+        for line in io.StringIO(text_content, newline=None):
             if 'Hardware inventory:' in line or ('Item' in line and 'Version' in line) or not line.strip():
                 continue
 
             indent = len(line) - len(line.lstrip())
             indent_level = indent // 2
-            parts = line.strip().split()
+            parts = line.split()
 
             if len(parts) < 2:
                 continue
@@ -370,19 +420,13 @@ def parse_25_show_chassis_hardware(text_content: str) -> Dict[str, Any]:
                 version = parts[rev_index + 1] if rev_index + 1 < len(parts) else None
                 remaining = parts[rev_index + 2:]
             else:
-                if parts[0] in ['Chassis', 'FPC', 'PIC', 'Xcvr', 'PEM', 'CB']:
-                    if len(parts) > 1 and parts[1].isdigit():
-                        item_name = f"{parts[0]} {parts[1]}"
-                        remaining = parts[2:]
-                    else:
-                        item_name = parts[0]
-                        remaining = parts[1:]
-                elif parts[0] == 'Routing' and len(parts) > 1 and parts[1] == 'Engine':
-                    item_name = f"Routing Engine {parts[2]}" if len(parts) > 2 else "Routing Engine"
-                    remaining = parts[3:] if len(parts) > 2 else []
-                elif parts[0] == 'Fan' and len(parts) > 1 and parts[1] == 'Tray':
-                    item_name = f"Fan Tray {parts[2]}" if len(parts) > 2 else "Fan Tray"
-                    remaining = parts[3:] if len(parts) > 2 else []
+                second_word = HARDWARE_ITEM_NAMES.get(parts[0])
+                if second_word == '' and parts[1].isdigit():
+                    item_name = f"{parts[0]} {parts[1]}"
+                    remaining = parts[2:]
+                elif second_word and parts[1] == second_word:
+                    item_name = ' '.join(parts[:3])
+                    remaining = parts[3:]
                 else:
                     item_name = parts[0]
                     remaining = parts[1:]
@@ -412,7 +456,7 @@ def parse_25_show_chassis_hardware(text_content: str) -> Dict[str, Any]:
                 description=description,
                 indent_level=indent_level
             )
-            result.items.append(hardware_item)
+            append_item(hardware_item)
 
         return result.to_dict()
     except Exception as e:
@@ -420,13 +464,25 @@ def parse_25_show_chassis_hardware(text_content: str) -> Dict[str, Any]:
 
 
 # ────────────────────────────────────────────────────────────────────────────────
+FPC_SLOT_PATTERN        = re.compile(r'Slot\s+(\d+)\s+information:', re.ASCII)
+FPC_STATE_PATTERN       = re.compile(r'State\s+(\S+)', re.ASCII)
+FPC_CPU_DRAM_PATTERN    = re.compile(r'Total CPU DRAM\s+(.+)', re.ASCII)
+FPC_RLDRAM_PATTERN      = re.compile(r'Total RLDRAM\s+(.+)', re.ASCII)
+FPC_DDR_DRAM_PATTERN    = re.compile(r'Total DDR DRAM\s+(.+)', re.ASCII)
+FPC_FIPS_PATTERN        = re.compile(r'FIPS Capable\s+(\S+)', re.ASCII)
+FPC_TEMPERATURE_PATTERN = re.compile(r'Temperature\s+(\S+)', re.ASCII)
+FPC_START_TIME_PATTERN  = re.compile(r'Start time\s+(.+)', re.ASCII)
+FPC_UPTIME_PATTERN      = re.compile(r'Uptime\s+(.+)', re.ASCII)
+FPC_HP_SUPPORT_PATTERN  = re.compile(r'High-Performance mode support\s+(\S+)', re.ASCII)
+FPC_HP_PFES_PATTERN     = re.compile(r'PFEs in High-Performance mode\s+(.+)', re.ASCII)
+
+
 def parse_26_show_chassis_fpc_detail(text_content: str) -> Dict[str, Any]:
     cmd = "show chassis fpc detail | no-more"
     try:
         chassis_fpc_result = ShowChassisFpcDetail()
 
-        slot_pattern = r'Slot\s+(\d+)\s+information:'
-        slot_matches = list(re.finditer(slot_pattern, text_content))
+        slot_matches = list(FPC_SLOT_PATTERN.finditer(text_content))
 
         if not slot_matches:
             return chassis_fpc_result.to_dict()
@@ -435,47 +491,46 @@ def parse_26_show_chassis_fpc_detail(text_content: str) -> Dict[str, Any]:
             slot_num = int(slot_match.group(1))
             start_pos = slot_match.end()
             end_pos = slot_matches[idx + 1].start() if idx + 1 < len(slot_matches) else len(text_content)
-            slot_block = text_content[start_pos:end_pos]
 
             fpc_entry = ChassisFpcDetail(slot=slot_num)
 
-            state_match = re.search(r'State\s+(\S+)', slot_block)
+            state_match = FPC_STATE_PATTERN.search(text_content, start_pos, end_pos)
             if state_match:
                 fpc_entry.state = state_match.group(1)
 
-            cpu_dram_match = re.search(r'Total CPU DRAM\s+(.+)', slot_block)
+            cpu_dram_match = FPC_CPU_DRAM_PATTERN.search(text_content, start_pos, end_pos)
             if cpu_dram_match:
                 fpc_entry.total_cpu_dram = cpu_dram_match.group(1).strip()
 
-            rldram_match = re.search(r'Total RLDRAM\s+(.+)', slot_block)
+            rldram_match = FPC_RLDRAM_PATTERN.search(text_content, start_pos, end_pos)
             if rldram_match:
                 fpc_entry.total_rldram = rldram_match.group(1).strip()
 
-            ddr_dram_match = re.search(r'Total DDR DRAM\s+(.+)', slot_block)
+            ddr_dram_match = FPC_DDR_DRAM_PATTERN.search(text_content, start_pos, end_pos)
             if ddr_dram_match:
                 fpc_entry.total_ddr_dram = ddr_dram_match.group(1).strip()
 
-            fips_match = re.search(r'FIPS Capable\s+(\S+)', slot_block)
+            fips_match = FPC_FIPS_PATTERN.search(text_content, start_pos, end_pos)
             if fips_match:
                 fpc_entry.fips_capable = fips_match.group(1)
 
-            temp_match = re.search(r'Temperature\s+(\S+)', slot_block)
+            temp_match = FPC_TEMPERATURE_PATTERN.search(text_content, start_pos, end_pos)
             if temp_match:
                 fpc_entry.temperature = temp_match.group(1)
 
-            start_time_match = re.search(r'Start time\s+(.+)', slot_block)
+            start_time_match = FPC_START_TIME_PATTERN.search(text_content, start_pos, end_pos)
             if start_time_match:
                 fpc_entry.start_time = start_time_match.group(1).strip()
 
-            uptime_match = re.search(r'Uptime\s+(.+)', slot_block)
+            uptime_match = FPC_UPTIME_PATTERN.search(text_content, start_pos, end_pos)
             if uptime_match:
                 fpc_entry.uptime = uptime_match.group(1).strip()
 
-            hp_support_match = re.search(r'High-Performance mode support\s+(\S+)', slot_block)
+            hp_support_match = FPC_HP_SUPPORT_PATTERN.search(text_content, start_pos, end_pos)
             if hp_support_match:
                 fpc_entry.high_performance_mode_support = hp_support_match.group(1)
 
-            pfes_match = re.search(r'PFEs in High-Performance mode\s+(.+)', slot_block)
+            pfes_match = FPC_HP_PFES_PATTERN.search(text_content, start_pos, end_pos)
             if pfes_match:
                 fpc_entry.pfes_in_high_performance_mode = pfes_match.group(1).strip()
 
@@ -501,13 +556,17 @@ def parse_27_show_chassis_alarms(text_content: str) -> Dict[str, Any]:
 
 
 # ────────────────────────────────────────────────────────────────────────────────
+# Alarm rows lead with their timestamp
+SYSTEM_ALARMS_TIMESTAMP_PATTERN = re.compile(r'^[^\S\n]*\d{4}-\d{2}-\d{2}\s+\d{2}:\d{2}:\d{2}', re.MULTILINE | re.ASCII)
+
+
 def parse_28_show_system_alarms(text_content: str) -> Dict[str, Any]:
     cmd = "show system alarms | no-more"
     try:
         s = text_content or ""
-        if re.search(r'\bNo\s+alarms\s+currently\s+active\b', s, re.IGNORECASE):
+        if "no alarms currently active" in s.lower():
             return {"system_alarms": "None"}
-        if not re.search(r'\d{4}-\d{2}-\d{2}\s+\d{2}:\d{2}:\d{2}', s):
+        if not SYSTEM_ALARMS_TIMESTAMP_PATTERN.search(s):
             return {"system_alarms": "None"}
         return {"system_alarms": "None"}
     except Exception as e:
@@ -515,46 +574,35 @@ def parse_28_show_system_alarms(text_content: str) -> Dict[str, Any]:
 
 
 # ────────────────────────────────────────────────────────────────────────────────
+# One match per line except the header. The class token is captured whenever
+# it leads the line, even if no status follows, so later rows inherit it;
+# status is the first whole OK/Absent/Failed/Check token, with the item
+# before it and the measurement after it.
+ENVIRONMENT_LINE_PATTERN = re.compile(
+    r'^(?![^\n]*Class Item)[^\S\n]*(?:(Temp|Power|Fans)(?!\S)[^\S\n]*)?'
+    r'(?:((?:\S+[^\S\n]+)*?)(OK|Absent|Failed|Check)(?!\S)(.*))?.*$',
+    re.MULTILINE | re.ASCII
+)
+
+
 def parse_30_show_chassis_environment(text_content: str) -> Dict[str, Any]:
     cmd = "show chassis environment | no-more"
     try:
         environment_result = ShowChassisEnvironment()
         current_class = None
 
-        for line in text_content.splitlines():
-            if 'Class Item' in line or not line.strip():
-                continue
-
-            parts = line.split()
-            if not parts:
-                continue
-
-            if parts[0] in ['Temp', 'Power', 'Fans']:
-                current_class = parts[0]
-                rest = ' '.join(parts[1:])
-            else:
-                rest = line.strip()
-
-            status = None
-            status_index = -1
-            for i, word in enumerate(rest.split()):
-                if word in ['OK', 'Absent', 'Failed', 'Check']:
-                    status = word
-                    status_index = i
-                    break
+        for item_class, item, status, measurement in ENVIRONMENT_LINE_PATTERN.findall(text_content):
+            if item_class:
+                current_class = item_class
 
-            if status_index == -1:
+            if not status:
                 continue
 
-            rest_parts = rest.split()
-            item_name = ' '.join(rest_parts[:status_index])
-            measurement = ' '.join(rest_parts[status_index + 1:])
-
             env_item = EnvironmentItem(
                 item_class=current_class,
-                item_name=item_name,
+                item_name=' '.join(item.split()),
                 status=status,
-                measurement=measurement
+                measurement=' '.join(measurement.split())
             )
             environment_result.items.append(env_item)
 
@@ -564,43 +612,58 @@ def parse_30_show_chassis_environment(text_content: str) -> Dict[str, Any]:
 
 
 # ────────────────────────────────────────────────────────────────────────────────
+RESOURCE_MONITOR_HEAP_PATTERN   = re.compile(r'Free Heap Mem Watermark\s+:\s+(\d+)', re.ASCII)
+RESOURCE_MONITOR_NH_PATTERN     = re.compile(r'Free NH Mem Watermark\s+:\s+(\d+)', re.ASCII)
+RESOURCE_MONITOR_FILTER_PATTERN = re.compile(r'Free Filter Mem Watermark\s*:\s*(\d+)', re.ASCII)
+
+
 def parse_31_show_system_resource_monitor_fpc(text_content: str) -> Dict[str, Any]:
     cmd = "show system resource-monitor fpc | no-more"
     try:
         resource_monitor_result = ShowSystemResourceMonitorFpc()
 
-        heap_watermark_match = re.search(r'Free Heap Mem Watermark\s+:\s+(\d+)', text_content)
+        heap_watermark_match = RESOURCE_MONITOR_HEAP_PATTERN.search(text_content)
         if heap_watermark_match:
             resource_monitor_result.free_heap_mem_watermark = int(heap_watermark_match.group(1))
 
-        nh_watermark_match = re.search(r'Free NH Mem Watermark\s+:\s+(\d+)', text_content)
+        nh_watermark_match = RESOURCE_MONITOR_NH_PATTERN.search(text_content)
         if nh_watermark_match:
             resource_monitor_result.free_nh_mem_watermark = int(nh_watermark_match.group(1))
 
-        filter_watermark_match = re.search(r'Free Filter Mem Watermark\s*:\s*(\d+)', text_content)
+        filter_watermark_match = RESOURCE_MONITOR_FILTER_PATTERN.search(text_content)
         if filter_watermark_match:
             resource_monitor_result.free_filter_mem_watermark = int(filter_watermark_match.group(1))
 
         current_fpc = None
+        append_fpc = resource_monitor_result.fpc_resources.append
 
-        for line in text_content.splitlines():
+        for line in io.StringIO(text_content, newline=None):
             line = line.strip()
-            if not line or 'Slot' in line or 'Free' in line or '*' in line or 'FPC Resource' in line:
+            # Slot and PFE rows both lead with a number, so banner and header
+            # lines drop out on their first character before the token scans
+            if not line[:1].isdigit():
+                continue
+            if 'Slot' in line or 'Free' in line or '*' in line or 'FPC Resource' in line:
                 continue
 
-            parts = line.split()
-
-            if len(parts) >= 2 and parts[0].isdigit() and parts[1].isdigit():
-                if 'PFE' not in line:
-                    slot_num = int(parts[0])
-                    heap_free = int(parts[1])
-                    current_fpc = FpcResourceUsage(
-                        slot_number=slot_num,
-                        heap_free_percent=heap_free
-                    )
-                    resource_monitor_result.fpc_resources.append(current_fpc)
+            # Only the first four columns are read; the fifth piece keeps the
+            # untouched tail so the length checks still see "4 or more"
+            parts = line.split(None, 4)
+            n     = len(parts)
+
+            # The "PFE #" header never reaches here (it fails the leading-digit
+            # test above), so slot rows need no substring scan for "PFE".
+            if n >= 2 and parts[0].isdigit() and parts[1].isdigit():
+                slot_num = int(parts[0])
+                heap_free = int(parts[1])
+                current_fpc = FpcResourceUsage(
+                    slot_number=slot_num,
+                    heap_free_percent=heap_free
+                )
+                append_fpc(current_fpc)
+                append_pfe = current_fpc.pfe_resources.append
 
-            elif current_fpc and len(parts) >= 4 and parts[0].isdigit():
+            elif current_fpc and n >= 4 and parts[0].isdigit():
                 pfe_num = int(parts[0])
                 encap_mem = parts[1]
                 nh_mem = int(parts[2])
@@ -611,7 +674,7 @@ def parse_31_show_system_resource_monitor_fpc(text_content: str) -> Dict[str, An
                     nh_mem_free_percent=nh_mem,
                     fw_mem_free_percent=fw_mem
                 )
-                current_fpc.pfe_resources.append(pfe_resource)
+                append_pfe(pfe_resource)
 
         return resource_monitor_result.to_dict()
     except Exception as e:
@@ -619,31 +682,36 @@ def parse_31_show_system_resource_monitor_fpc(text_content: str) -> Dict[str, An
 
 
 # ────────────────────────────────────────────────────────────────────────────────
+RPD_PROCESS_PATTERN = re.compile(
+    r'^\s*(\d+)\s+(\S+)\s+(\d+)\s+(\d+)\s+(\S+)\s+(\S+)\s+(\S+)\s+(\d+)\s+(\S+)\s+(\S+%)\s+(.+)$',
+    re.MULTILINE | re.ASCII
+)
+
+
+def rpd_process_from_row(row):
+    pid, user, pri, nice, size, res, state, cpu, time, pct, thread_name = row
+    return RpdProcessEntry(
+        pid=int(pid),
+        user=user,
+        pri=int(pri),
+        nice=int(nice),
+        size=size,
+        res=res,
+        state=state,
+        cpu=int(cpu),
+        time=time,
+        pct=pct,
+        thread_name=thread_name.strip()
+    )
+
+
 def parse_show_system_processes_rpd_match(text_content: str) -> Dict[str, Any]:
     cmd = "show system processes extensive | match rpd | no-more"
     try:
         result = ShowSystemProcessesRpd()
-        pattern = re.compile(
-            r'^\s*(\d+)\s+(\S+)\s+(\d+)\s+(\d+)\s+(\S+)\s+(\S+)\s+(\S+)\s+(\d+)\s+(\S+)\s+(\S+%)\s+(.+)$',
-            re.MULTILINE
-        )
-        for match in pattern.finditer(text_content):
-            entry = RpdProcessEntry(
-                pid=int(match.group(1)),
-                user=match.group(2),
-                pri=int(match.group(3)),
-                nice=int(match.group(4)),
-                size=match.group(5),
-                res=match.group(6),
-                state=match.group(7),
-                cpu=int(match.group(8)),
-                time=match.group(9),
-                pct=match.group(10),
-                thread_name=match.group(11).strip()
-            )
-            result.entries.append(entry)
+        result.entries = list(map(rpd_process_from_row, RPD_PROCESS_PATTERN.findall(text_content)))
         result.total_rpd_threads = len(result.entries)
-        return asdict(result)
+        return result.to_dict()
     except Exception as e:
         return {"error": f"Error parsing {cmd}: {str(e)}"}
 
@@ -653,6 +721,7 @@ def parse_show_interfaces_terse(text_content: str) -> Dict[str, Any]:
     cmd = "show interface terse | no-more"
     try:
         result = ShowInterfacesTerse()
+        append_interface = result.interfaces.append
         lines = text_content.strip().splitlines()
 
         for line in lines[1:]:  # skip header
@@ -685,80 +754,101 @@ def parse_show_interfaces_terse(text_content: str) -> Dict[str, Any]:
                     if idx < len(parts):
                         entry.remote = parts[idx]
 
-            result.interfaces.append(entry)
+            append_interface(entry)
 
         result.total_interfaces = len(result.interfaces)
-        return asdict(result)
+        return result.to_dict()
     except Exception as e:
         return {"error": f"Error parsing {cmd}: {str(e)}"}
 
 
 # ────────────────────────────────────────────────────────────────────────────────
+def iter_sections(split_pattern, text_content):
+    # Same pieces as split_pattern.split(text_content) for a pattern without
+    # groups, yielded one at a time instead of materialised as a list
+    start = 0
+    for boundary in split_pattern.finditer(text_content):
+        yield text_content[start:boundary.start()]
+        start = boundary.end()
+    yield text_content[start:]
+
+
+OAM_INTERFACE_PATTERN       = re.compile(
+    r'Interface name:\s+(\S+)\s*,\s*Interface status:\s+(\w+)\s*,\s*Link status:\s+(\w+)', re.ASCII
+)
+OAM_MD_PATTERN              = re.compile(
+    r'Maintenance domain name:\s+(.+?)\s*,\s*Format:\s+(\w+)\s*,\s*Level:\s+(\d+)\s*,\s*MD Index:\s+(\d+)', re.ASCII
+)
+OAM_MA_PATTERN              = re.compile(
+    r'Maintenance association name:\s+(.+?)\s*,\s*Format:\s+(\w+)\s*,\s*MA Index:\s+(\d+)', re.ASCII
+)
+OAM_CC_PATTERN              = re.compile(
+    r'Continuity-check status:\s+(\w+)\s*,\s*Interval:\s+(\S+)\s*,\s*Loss-threshold:\s+(.+)', re.ASCII
+)
+OAM_MEP_PATTERN             = re.compile(
+    r'MEP identifier:\s+(\d+)\s*,\s*Direction:\s+(\w+)\s*,\s*MAC address:\s+([0-9a-f:]+)', re.ASCII
+)
+OAM_MEP_STATUS_PATTERN      = re.compile(r'MEP status:\s+(\w+)', re.ASCII)
+
+
 def parse_35_show_oam_cfm_interfaces(text_content: str) -> Dict[str, Any]:
     cmd = "show oam ethernet connectivity-fault-management interfaces extensive | no-more"
     try:
         oam_cfm_result = ShowOamCfmInterfaces()
-        interface_blocks = re.split(r'\n(?=Interface name:)', text_content)
-
-        for block in interface_blocks:
+        append_interface = oam_cfm_result.interfaces.append
+        # Literal delimiter, so a plain str.split replaces the lookahead regex;
+        # the "Interface name:" prefix is put back on every block after the first
+        parts = text_content.split('\nInterface name:')
+        blocks = [parts[0]] + ['Interface name:' + part for part in parts[1:]]
+        for block in blocks:
             if not block.strip() or 'Interface name:' not in block:
                 continue
 
-            intf_match = re.search(
-                r'Interface name:\s+(\S+)\s*,\s*Interface status:\s+(\w+)\s*,\s*Link status:\s+(\w+)',
-                block
-            )
+            intf_match = OAM_INTERFACE_PATTERN.search(block)
             if not intf_match:
                 continue
 
+            interface_name, interface_status, link_status = intf_match.groups()
             oam_interface = OamCfmInterface(
-                interface_name=intf_match.group(1),
-                interface_status=intf_match.group(2),
-                link_status=intf_match.group(3)
+                interface_name=interface_name,
+                interface_status=interface_status,
+                link_status=link_status
             )
 
-            md_match = re.search(
-                r'Maintenance domain name:\s+(.+?)\s*,\s*Format:\s+(\w+)\s*,\s*Level:\s+(\d+)\s*,\s*MD Index:\s+(\d+)',
-                block
-            )
+            md_match = OAM_MD_PATTERN.search(block)
             if md_match:
-                oam_interface.maintenance_domain_name = md_match.group(1).strip()
-                oam_interface.md_format = md_match.group(2)
-                oam_interface.md_level = int(md_match.group(3))
-                oam_interface.md_index = int(md_match.group(4))
-
-            ma_match = re.search(
-                r'Maintenance association name:\s+(.+?)\s*,\s*Format:\s+(\w+)\s*,\s*MA Index:\s+(\d+)',
-                block
-            )
+                md_name, md_format, md_level, md_index = md_match.groups()
+                oam_interface.maintenance_domain_name = md_name.strip()
+                oam_interface.md_format = md_format
+                oam_interface.md_level = int(md_level)
+                oam_interface.md_index = int(md_index)
+
+            ma_match = OAM_MA_PATTERN.search(block)
             if ma_match:
-                oam_interface.maintenance_association_name = ma_match.group(1).strip()
-                oam_interface.ma_format = ma_match.group(2)
-                oam_interface.ma_index = int(ma_match.group(3))
+                ma_name, ma_format, ma_index = ma_match.groups()
+                oam_interface.maintenance_association_name = ma_name.strip()
+                oam_interface.ma_format = ma_format
+                oam_interface.ma_index = int(ma_index)
 
-            cc_match = re.search(
-                r'Continuity-check status:\s+(\w+)\s*,\s*Interval:\s+(\S+)\s*,\s*Loss-threshold:\s+(.+)',
-                block
-            )
+            cc_match = OAM_CC_PATTERN.search(block)
             if cc_match:
-                oam_interface.continuity_check_status = cc_match.group(1)
-                oam_interface.cc_interval = cc_match.group(2)
-                oam_interface.loss_threshold = cc_match.group(3).strip()
+                cc_status, cc_interval, loss_threshold = cc_match.groups()
+                oam_interface.continuity_check_status = cc_status
+                oam_interface.cc_interval = cc_interval
+                oam_interface.loss_threshold = loss_threshold.strip()
 
-            mep_match = re.search(
-                r'MEP identifier:\s+(\d+)\s*,\s*Direction:\s+(\w+)\s*,\s*MAC address:\s+([0-9a-f:]+)',
-                block
-            )
+            mep_match = OAM_MEP_PATTERN.search(block)
             if mep_match:
-                oam_interface.mep_identifier = int(mep_match.group(1))
-                oam_interface.mep_direction = mep_match.group(2)
-                oam_interface.mac_address = mep_match.group(3)
+                mep_identifier, mep_direction, mac_address = mep_match.groups()
+                oam_interface.mep_identifier = int(mep_identifier)
+                oam_interface.mep_direction = mep_direction
+                oam_interface.mac_address = mac_address
 
-            mep_status_match = re.search(r'MEP status:\s+(\w+)', block)
+            mep_status_match = OAM_MEP_STATUS_PATTERN.search(block)
             if mep_status_match:
                 oam_interface.mep_status = mep_status_match.group(1)
 
-            oam_cfm_result.interfaces.append(oam_interface)
+            append_interface(oam_interface)
 
         return oam_cfm_result.to_dict()
     except Exception as e:
@@ -766,59 +856,58 @@ def parse_35_show_oam_cfm_interfaces(text_content: str) -> Dict[str, Any]:
 
 
 # ────────────────────────────────────────────────────────────────────────────────
+VRRP_NOT_RUNNING_PATTERN = re.compile(r'vrrp subsystem not running', re.IGNORECASE | re.ASCII)
+VRRP_INTERFACE_PATTERN   = re.compile(r'\b(ge-|xe-|et-|ae-|vlan)\S*', re.IGNORECASE | re.ASCII)
+
+
 def parse_show_vrrp_summary(text_content: str) -> Dict[str, Any]:
     cmd = "show vrrp summary | no-more"
     try:
         s = (text_content or "").strip()
-        if re.search(r'vrrp subsystem not running', s, re.IGNORECASE):
+        if VRRP_NOT_RUNNING_PATTERN.search(s):
             return {"vrrp_summary": "None"}
-        if not re.search(r'\b(ge-|xe-|et-|ae-|vlan)\S*', s, re.IGNORECASE):
+        if not VRRP_INTERFACE_PATTERN.search(s):
             return {"vrrp_summary": "None"}
         return {"vrrp_summary": "None"}
     except Exception as e:
         return {"error": f"Error parsing {cmd}: {str(e)}"}
 
+
+BFD_SUMMARY_PATTERN = re.compile(r'(\d+)\s+sessions,\s+(\d+)\s+clients', re.ASCII)
+
+
 def parse_show_bfd_session(text_content: str) -> Dict[str, Any]:
-    cmd = "show bfd session | no-more"
+    cmd = BFD_SPEC.cmd
     try:
-        result = ShowBfdSession()
-
-        pattern = r'(\d+\.\d+\.\d+\.\d+)\s+(\S+)\s+(\S+)\s+([\d.]+)\s+([\d.]+)\s+(\d+)'
-        for match in re.finditer(pattern, text_content):
-            entry = ShowBfdSessionEntry(
-                address=match.group(1),
-                state=match.group(2),
-                interface=match.group(3),
-                detect_time=match.group(4),
-                transmit_interval=match.group(5),
-                multiplier=match.group(6)
-            )
-            result.entries.append(entry)
+        result = run_parser_spec(BFD_SPEC, text_content)
 
-        summary_match = re.search(r'(\d+)\s+sessions,\s+(\d+)\s+clients', text_content)
+        summary_match = BFD_SUMMARY_PATTERN.search(text_content)
         if summary_match:
             result.total_sessions = int(summary_match.group(1))
             result.total_clients  = int(summary_match.group(2))
 
-        return asdict(result)
+        return result.to_dict()
     except Exception as e:
         return {"error": f"Error parsing {cmd}: {str(e)}"}
 
 
+RSVP_NEIGHBOR_TOTAL_PATTERN = re.compile(r'RSVP neighbor:\s+(\d+)\s+learned', re.ASCII)
+
+
 def parse_show_rsvp_neighbor(text_content: str) -> Dict[str, Any]:
     cmd = "show rsvp neighbor | no-more"
     try:
         result = ShowRsvpNeighbor()
 
-        total_match = re.search(r"RSVP neighbor:\s+(\d+)\s+learned", text_content)
+        total_match = RSVP_NEIGHBOR_TOTAL_PATTERN.search(text_content)
         if total_match:
             result.total_neighbors = int(total_match.group(1))
 
-        lines = text_content.split('\n')
-        for line in lines:
+        append_entry = result.entries.append
+        for line in io.StringIO(text_content, newline=None):
             if 'Address' in line or not line.strip() or 'RSVP neighbor' in line:
                 continue
-            fields = line.split()
+            fields = line.split(None, 8)
             if len(fields) >= 8:
                 try:
                     entry = ShowRsvpNeighborEntry(
@@ -830,102 +919,114 @@ def parse_show_rsvp_neighbor(text_content: str) -> Dict[str, Any]:
                         hello_tx_rx=fields[6],
                         msg_rcvd=int(fields[7])
                     )
-                    result.entries.append(entry)
+                    append_entry(entry)
                 except (ValueError, IndexError):
                     continue
 
-        return asdict(result)
+        return result.to_dict()
     except Exception as e:
         return {"error": f"Error parsing {cmd}: {str(e)}"}
 
 
+RSVP_SUMMARY_PATTERN = re.compile(
+    r'(?P<kind>Ingress|Egress|Transit) RSVP:(?:\s+(?P<sessions>\d+)\s+sessions)?'
+    r'|Total\s+(?P<total>\d+)\s+displayed,\s+Up\s+(?P<up>\d+),\s+Down\s+(?P<down>\d+)',
+    re.ASCII
+)
+
+# to, from, state, rt, style (2 cols), label in, label out, lsp name
+SESSION_ROW_PATTERN = re.compile(
+    r'^[^\S\n]*(\d{1,3}(?:\.\d{1,3}){3})\s+(\d{1,3}(?:\.\d{1,3}){3})\s+(\w+)\s+(\d+)\s+(\d+)\s+(\S+)\s+(\S+)\s+(\S+)\s+(.+)$',
+    re.MULTILINE | re.ASCII
+)
+
+
+def session_entry_from_row(entry_cls, row):
+    # Shared by the rsvp session, mpls lsp egress/transit and P2MP
+    # egress/transit branch rows. row is a findall() tuple, so the engine hands
+    # back every column at once: to, from, state, rt, style (2 cols), label
+    # in/out, name. Styles come from a handful of values ("1 FF", "1 SE", ...),
+    # so they are interned: every row shares one string, and pickling the
+    # result back from the parser pool writes each style once.
+    to, from_, state, rt, style_a, style_b, label_in, label_out, lsp_name = row
+    return entry_cls(
+        to=to,
+        from_=from_,
+        state=state,
+        rt=int(rt),
+        style=sys.intern(f"{style_a} {style_b}"),
+        label_in=label_in,
+        label_out=label_out,
+        lsp_name=lsp_name.strip()
+    )
+
+
 def parse_show_rsvp_session(text_content: str) -> Dict[str, Any]:
     cmd = "show rsvp session | no-more"
     try:
         result = ShowRsvpSession()
 
-        ingress_header = re.search(r'Ingress RSVP:\s+(\d+)\s+sessions', text_content)
-        if ingress_header:
-            result.ingress_sessions = int(ingress_header.group(1))
-
-        ingress_total = re.search(
-            r'Total\s+(\d+)\s+displayed,\s+Up\s+(\d+),\s+Down\s+(\d+)',
-            text_content.split('Egress RSVP:')[0] if 'Egress RSVP:' in text_content else text_content
-        )
-        if ingress_total:
-            result.ingress_up   = int(ingress_total.group(2))
-            result.ingress_down = int(ingress_total.group(3))
-
-        ingress_pattern = r'(\d+\.\d+\.\d+\.\d+)\s+(\d+\.\d+\.\d+\.\d+)\s+(\w+)\s+(\d+)\s+(\d+)\s+(\S+)\s+(\S+)\s+(\S+)\s+(.+)$'
-        if 'Ingress RSVP:' in text_content and 'Egress RSVP:' in text_content:
-            ingress_section = text_content.split('Ingress RSVP:')[1].split('Egress RSVP:')[0]
-            for match in re.finditer(ingress_pattern, ingress_section, re.MULTILINE):
-                entry = RsvpSessionIngressEntry(
-                    to=match.group(1),
-                    from_=match.group(2),
-                    state=match.group(3),
-                    rt=int(match.group(4)),
-                    style=f"{match.group(5)} {match.group(6)}",
-                    label_in=match.group(7),
-                    label_out=match.group(8),
-                    lsp_name=match.group(9).strip()
-                )
-                result.ingress_entries.append(entry)
-
-        egress_header = re.search(r'Egress RSVP:\s+(\d+)\s+sessions', text_content)
-        if egress_header:
-            result.egress_sessions = int(egress_header.group(1))
-
-        if 'Egress RSVP:' in text_content:
-            egress_section_text = text_content.split('Egress RSVP:')[1]
-            egress_total = re.search(
-                r'Total\s+(\d+)\s+displayed,\s+Up\s+(\d+),\s+Down\s+(\d+)',
-                egress_section_text.split('Transit RSVP:')[0] if 'Transit RSVP:' in egress_section_text else egress_section_text
-            )
-            if egress_total:
-                result.egress_up   = int(egress_total.group(2))
-                result.egress_down = int(egress_total.group(3))
-
-        egress_pattern = r'(\d+\.\d+\.\d+\.\d+)\s+(\d+\.\d+\.\d+\.\d+)\s+(\w+)\s+(\d+)\s+(\d+)\s+(\S+)\s+(\S+)\s+(\S+)\s+(.+)$'
-        if 'Egress RSVP:' in text_content:
-            egress_section = text_content.split('Egress RSVP:')[1]
-            if 'Transit RSVP:' in egress_section:
-                egress_section = egress_section.split('Transit RSVP:')[0]
-            for match in re.finditer(egress_pattern, egress_section, re.MULTILINE):
-                entry = RsvpSessionEgressEntry(
-                    to=match.group(1),
-                    from_=match.group(2),
-                    state=match.group(3),
-                    rt=int(match.group(4)),
-                    style=f"{match.group(5)} {match.group(6)}",
-                    label_in=match.group(7),
-                    label_out=match.group(8),
-                    lsp_name=match.group(9).strip()
-                )
-                result.egress_entries.append(entry)
+        # One pass for the three "<Kind> RSVP: N sessions" headers and their
+        # "Total N displayed, Up N, Down N" lines; a Total belongs to the
+        # section whose header was seen last (ingress before any header).
+        # The first offset of each header is kept for slicing the rows below.
+        section = "ingress"
+        header_at = {}
+        counted = set()
+        totals_seen = set()
+        for summary in RSVP_SUMMARY_PATTERN.finditer(text_content):
+            if summary.group('kind'):
+                section = summary.group('kind').lower()
+                header_at.setdefault(section, summary.start())
+                if summary.group('sessions') and section not in counted:
+                    setattr(result, f"{section}_sessions", int(summary.group('sessions')))
+                    counted.add(section)
+            elif section not in totals_seen:
+                setattr(result, f"{section}_up", int(summary.group('up')))
+                setattr(result, f"{section}_down", int(summary.group('down')))
+                totals_seen.add(section)
+
+        ingress_at = header_at.get('ingress', -1)
+        egress_at  = header_at.get('egress', -1)
+        transit_at = header_at.get('transit', -1)
+
+        if ingress_at != -1 and egress_at != -1:
+            ingress_section = text_content[ingress_at + len('Ingress RSVP:'):egress_at]
+            result.ingress_entries = list(map(
+                partial(session_entry_from_row, RsvpSessionIngressEntry), SESSION_ROW_PATTERN.findall(ingress_section)
+            ))
+
+        if egress_at != -1:
+            egress_end = transit_at if transit_at > egress_at else len(text_content)
+            egress_section = text_content[egress_at + len('Egress RSVP:'):egress_end]
+            result.egress_entries = list(map(
+                partial(session_entry_from_row, RsvpSessionEgressEntry), SESSION_ROW_PATTERN.findall(egress_section)
+            ))
+
+        if transit_at != -1 and 'transit' not in totals_seen:
+            transit_states      = [e.state for e in result.transit_entries]
+            result.transit_up   = transit_states.count('Up')
+            result.transit_down = transit_states.count('Down')
 
-        transit_header = re.search(r'Transit RSVP:\s+(\d+)\s+sessions', text_content)
-        if transit_header:
-            result.transit_sessions = int(transit_header.group(1))
-
-        if 'Transit RSVP:' in text_content:
-            transit_section_text = text_content.split('Transit RSVP:')[1]
-            transit_total = re.search(
-                r'Total\s+(\d+)\s+displayed,\s+Up\s+(\d+),\s+Down\s+(\d+)',
-                transit_section_text
-            )
-            if transit_total:
-                result.transit_up   = int(transit_total.group(2))
-                result.transit_down = int(transit_total.group(3))
-            else:
-                result.transit_up   = sum(1 for e in result.transit_entries if e.state == 'Up')
-                result.transit_down = sum(1 for e in result.transit_entries if e.state == 'Down')
-
-        return asdict(result)
+        return result.to_dict()
     except Exception as e:
         return {"error": f"Error parsing {cmd}: {str(e)}"}
 
 # ────────────────────────────────────────────────────────────────────────────────
+INET0_HEADER_PATTERN    = re.compile(
+    r'(inet\.0):\s+(\d+)\s+destinations,\s+(\d+)\s+routes\s+\((\d+)\s+active,\s+(\d+)\s+holddown,\s+(\d+)\s+hidden\)',
+    re.ASCII
+)
+INET0_ROUTE_PATTERN     = re.compile(
+    r'^([\d\.\/]+)\s+(\*?)(\[[\w\-]+\/\d+\])\s+([\w\d\s:]+?)(?:,\s+metric\s+(\d+))?$', re.ASCII
+)
+INET0_PROTOCOL_PATTERN  = re.compile(r'\[([\w\-]+)/(\d+)\]', re.ASCII)
+# "> to <addr> via <ifl>" and "> via <ifl>" in one pass; group 1 is None
+# for the via-only form
+INET0_NEXT_HOP_PATTERN  = re.compile(r'>\s+(?:to\s+([\d\.]+)\s+)?via\s+([\w\-\.\/]+)', re.ASCII)
+INET0_LOCAL_VIA_PATTERN = re.compile(r'Local\s+via\s+([\w\-\.\/]+)', re.ASCII)
+
+
 def parse_show_route_table_inet0(text_content: str) -> Dict[str, Any]:
     cmd = "show route table inet.0 | no-more"
     try:
@@ -934,10 +1035,7 @@ def parse_show_route_table_inet0(text_content: str) -> Dict[str, Any]:
             active_routes=0, holddown_routes=0, hidden_routes=0, entries=[]
         )
 
-        header_match = re.search(
-            r'(inet\.0):\s+(\d+)\s+destinations,\s+(\d+)\s+routes\s+\((\d+)\s+active,\s+(\d+)\s+holddown,\s+(\d+)\s+hidden\)',
-            text_content
-        )
+        header_match = INET0_HEADER_PATTERN.search(text_content)
         if header_match:
             result.table_name = header_match.group(1)
             result.total_destinations = int(header_match.group(2))
@@ -946,27 +1044,23 @@ def parse_show_route_table_inet0(text_content: str) -> Dict[str, Any]:
             result.holddown_routes = int(header_match.group(5))
             result.hidden_routes = int(header_match.group(6))
 
-        lines = text_content.split('\n')
+        append_entry = result.entries.append
+        lines = [ln.strip() for ln in text_content.split('\n')]
         i = 0
         while i < len(lines):
-            line = lines[i].strip()
+            line = lines[i]
             if not line or line.startswith('+') or line.startswith('inet.'):
                 i += 1
                 continue
 
-            dest_match = re.match(
-                r'^([\d\.\/]+)\s+(\*?)(\[[\w\-]+\/\d+\])\s+([\w\d\s:]+?)(?:,\s+metric\s+(\d+))?$',
-                line
-            )
+            dest_match = '[' in line and INET0_ROUTE_PATTERN.match(line)
 
             if dest_match:
-                destination = dest_match.group(1)
-                flags = dest_match.group(2)
-                protocol_pref = dest_match.group(3)
-                age = dest_match.group(4).strip()
-                metric = int(dest_match.group(5)) if dest_match.group(5) else 0
+                destination, flags, protocol_pref, age, metric = dest_match.groups()
+                age = age.strip()
+                metric = int(metric) if metric else 0
 
-                protocol_match = re.search(r'\[([\w\-]+)/(\d+)\]', protocol_pref)
+                protocol_match = INET0_PROTOCOL_PATTERN.search(protocol_pref)
                 protocol = protocol_match.group(1) if protocol_match else ""
                 preference = int(protocol_match.group(2)) if protocol_match else 0
 
@@ -974,21 +1068,15 @@ def parse_show_route_table_inet0(text_content: str) -> Dict[str, Any]:
                 interface = ""
 
                 if i + 1 < len(lines):
-                    next_line = lines[i + 1].strip()
+                    next_line = lines[i + 1]
                     if next_line.startswith('>'):
-                        hop_match = re.search(r'>\s+to\s+([\d\.]+)\s+via\s+([\w\-\.\/]+)', next_line)
+                        hop_match = INET0_NEXT_HOP_PATTERN.search(next_line)
                         if hop_match:
-                            next_hop = hop_match.group(1)
+                            next_hop = hop_match.group(1) or ""
                             interface = hop_match.group(2)
                             i += 1
-                        else:
-                            hop_match2 = re.search(r'>\s+via\s+([\w\-\.\/]+)', next_line)
-                            if hop_match2:
-                                interface = hop_match2.group(1)
-                                next_hop = ""
-                                i += 1
                     elif 'Local via' in next_line:
-                        hop_match3 = re.search(r'Local\s+via\s+([\w\-\.\/]+)', next_line)
+                        hop_match3 = INET0_LOCAL_VIA_PATTERN.search(next_line)
                         if hop_match3:
                             interface = hop_match3.group(1)
                             next_hop = "Local"
@@ -1004,25 +1092,32 @@ def parse_show_route_table_inet0(text_content: str) -> Dict[str, Any]:
                     interface=interface,
                     flags=flags
                 )
-                result.entries.append(entry)
+                append_entry(entry)
 
             i += 1
 
-        return asdict(result)
+        return result.to_dict()
     except Exception as e:
         return {"error": f"Error parsing {cmd}: {str(e)}"}
 
 
 # ────────────────────────────────────────────────────────────────────────────────
+INET3_HEADER_PATTERN   = re.compile(
+    r'inet\.3:\s+(\d+)\s+destinations,\s+(\d+)\s+routes\s+\((\d+)\s+active,\s+(\d+)\s+holddown,\s+(\d+)\s+hidden\)',
+    re.ASCII
+)
+INET3_ROUTE_PATTERN    = re.compile(r'^(\S+)\s+\*\[(\S+)/(\d+)\]\s+(.+?),\s+metric\s+(\d+)', re.ASCII)
+INET3_NEXT_HOP_PATTERN = re.compile(
+    r'to\s+(\S+)\s+via\s+(\S+?)(?:,\s+Push\s+(\S+?))?(?:,\s+Push\s+(\S+?))?\s*$', re.ASCII
+)
+
+
 def parse_show_route_table_inet3(text_content: str) -> Dict[str, Any]:
     cmd = "show route table inet.3 | no-more"
     try:
         result = ShowRouteTableInet3()
 
-        header_match = re.search(
-            r'inet\.3:\s+(\d+)\s+destinations,\s+(\d+)\s+routes\s+\((\d+)\s+active,\s+(\d+)\s+holddown,\s+(\d+)\s+hidden\)',
-            text_content
-        )
+        header_match = INET3_HEADER_PATTERN.search(text_content)
         if header_match:
             result.total_destinations = int(header_match.group(1))
             result.total_routes = int(header_match.group(2))
@@ -1030,44 +1125,44 @@ def parse_show_route_table_inet3(text_content: str) -> Dict[str, Any]:
             result.holddown_routes = int(header_match.group(4))
             result.hidden_routes = int(header_match.group(5))
 
+        append_entry = result.entries.append
         lines = text_content.split('\n')
         i = 0
         current_entry = None
 
         while i < len(lines):
             line = lines[i]
+            # Stripped once; the route pattern still runs on the raw line
+            # since it anchors on the destination at column 0
+            stripped_line = line.strip()
 
-            if not line.strip() or line.strip().startswith('+') or line.strip().startswith('inet.3:'):
+            if not stripped_line or stripped_line.startswith(('+', 'inet.3:')):
                 i += 1
                 continue
 
-            route_match = re.match(r'^(\S+)\s+\*\[(\S+)/(\d+)\]\s+(.+?),\s+metric\s+(\d+)', line)
+            route_match = '*[' in line and INET3_ROUTE_PATTERN.match(line)
             if route_match:
                 if current_entry:
-                    result.entries.append(current_entry)
+                    append_entry(current_entry)
+                destination, protocol, preference, age, metric = route_match.groups()
                 current_entry = ShowRouteTableInet3Entry(
-                    destination=route_match.group(1),
-                    protocol=route_match.group(2),
-                    preference=route_match.group(3),
-                    metric=route_match.group(5),
-                    age=route_match.group(4)
+                    destination=destination,
+                    protocol=protocol,
+                    preference=preference,
+                    metric=metric,
+                    age=age
                 )
             elif current_entry:
-                stripped_line = line.strip()
                 is_primary = stripped_line.startswith('>')
                 clean_line = stripped_line.lstrip('>')
 
-                nexthop_match = re.match(
-                    r'(?:to\s+)?(\S+)\s+via\s+(\S+?)(?:,\s+Push\s+(\S+?))?(?:,\s+Push\s+(\S+?))?\s*$',
-                    clean_line.strip()
-                )
-                if nexthop_match and 'to' in clean_line:
-                    to_match = re.match(r'to\s+(\S+)\s+via\s+(\S+?)(?:,\s+Push\s+(\S+?))?(?:,\s+Push\s+(\S+?))?\s*$', clean_line.strip())
+                # Any line the to/via pattern accepts also satisfies the
+                # looser optional-"to" form, so only the former is run.
+                if 'to' in clean_line and 'via' in clean_line:
+                    to_match = INET3_NEXT_HOP_PATTERN.match(clean_line.strip())
                     if to_match:
-                        to_addr = to_match.group(1)
-                        via_iface = to_match.group(2).rstrip(',')
-                        label1 = to_match.group(3)
-                        label2 = to_match.group(4)
+                        to_addr, via_iface, label1, label2 = to_match.groups()
+                        via_iface = via_iface.rstrip(',')
                         if label1 and label2:
                             mpls_label = f"Push {label1}, Push {label2.replace('(top)', '')}"
                         elif label1:
@@ -1080,7 +1175,7 @@ def parse_show_route_table_inet3(text_content: str) -> Dict[str, Any]:
             i += 1
 
         if current_entry:
-            result.entries.append(current_entry)
+            append_entry(current_entry)
 
         return result.to_dict()
     except Exception as e:
@@ -1088,14 +1183,37 @@ def parse_show_route_table_inet3(text_content: str) -> Dict[str, Any]:
 
 
 # ────────────────────────────────────────────────────────────────────────────────
+# Single left-to-right scan over the whole mpls.0 buffer: route lines and every
+# next-hop form are alternates of one pattern, and the named group that matched
+# selects the branch. [^\S\n] keeps each alternate inside its own line.
+MPLS0_LINE_PATTERN = re.compile(
+    r'^(?:'
+    r'(?P<label>\d+(?:\(S=\d+\))?)[^\S\n]+\*\[(?P<protocol>\S+)/(?P<preference>\d+)\][^\S\n]+'
+    r'(?P<age>.+?)(?:,[^\S\n]+metric[^\S\n]+(?P<metric>\d+))?$'
+    r'|[^\S\n]+(?:'
+    r'to table[^\S\n]+(?P<table>\S+)'
+    r'|(?P<receive>Receive)'
+    r'|>[^\S\n]+via[^\S\n]+(?P<lsi>lsi\.\d+)[^\S\n]+\((?P<lsi_lsp>[^)\n]+)\),[^\S\n]+(?P<lsi_action>\w+)'
+    r'|(?![^\n]*via lsi\.)>?[^\S\n]*via[^\S\n]+(?P<vt>vt-[\d/\.]+),[^\S\n]+(?P<vt_action>\w+)'
+    r'|(?![^\n]*via (?:lsi\.|vt-))>[^\S\n]+via[^\S\n]+(?P<ms>ms-[\d/\.]+),[^\S\n]+(?P<ms_action>\w+)'
+    r'|(?![^\n]*via (?:lsi\.|vt-|ms-))>?[^\S\n]*to[^\S\n]+(?P<to>\S+)[^\S\n]+via[^\S\n]+(?P<via>\S+)(?P<rest>.*)'
+    r'))',
+    re.MULTILINE | re.ASCII
+)
+MPLS0_HEADER_PATTERN    = re.compile(
+    r'mpls\.0: (\d+) destinations, (\d+) routes \((\d+) active, (\d+) holddown, (\d+) hidden\)', re.ASCII
+)
+MPLS0_LSP_NAME_PATTERN  = re.compile(r'label-switched-path\s+(.+?)$', re.ASCII)
+MPLS0_SWAP_PUSH_PATTERN = re.compile(r'Swap\s+(\S+),\s+Push\s+(\S+)', re.ASCII)
+MPLS0_SWAP_PATTERN      = re.compile(r'Swap\s+(\S+)', re.ASCII)
+MPLS0_PUSH_PATTERN      = re.compile(r'Push\s+(\S+)', re.ASCII)
+
+
 def parse_show_route_table_mpls0(text_content: str) -> Dict[str, Any]:
     cmd = "show route table mpls.0 | no-more"
     try:
         result = ShowRouteTableMpls0()
-        header_match = re.search(
-            r'mpls\.0: (\d+) destinations, (\d+) routes \((\d+) active, (\d+) holddown, (\d+) hidden\)',
-            text_content
-        )
+        header_match = MPLS0_HEADER_PATTERN.search(text_content)
         if header_match:
             result.total_destinations = int(header_match.group(1))
             result.total_routes = int(header_match.group(2))
@@ -1103,212 +1221,249 @@ def parse_show_route_table_mpls0(text_content: str) -> Dict[str, Any]:
             result.holddown_routes = int(header_match.group(4))
             result.hidden_routes = int(header_match.group(5))
 
-        lines = text_content.split('\n')
-        i = 0
+        append_entry = result.entries.append
         current_entry = None
 
-        while i < len(lines):
-            line = lines[i]
-            route_match = re.match(
-                r'^(\d+(?:\(S=\d+\))?)\s+\*\[(\S+)/(\d+)\]\s+(.+?)(?:,\s+metric\s+(\d+))?$',
-                line
-            )
-            if route_match:
+        # group and the current entry's next_hops.append are bound once
+        # (per line and per label respectively) instead of being looked up
+        # again in every branch
+        for nh in MPLS0_LINE_PATTERN.finditer(text_content):
+            group = nh.group
+            if group('label'):
                 if current_entry:
-                    result.entries.append(current_entry)
+                    append_entry(current_entry)
                 current_entry = ShowRouteTableMpls0Entry(
-                    label=route_match.group(1),
-                    protocol=route_match.group(2),
-                    preference=route_match.group(3),
-                    metric=route_match.group(5) if route_match.group(5) else "",
-                    age=route_match.group(4)
+                    label=group('label'),
+                    protocol=group('protocol'),
+                    preference=group('preference'),
+                    metric=group('metric') if group('metric') else "",
+                    age=group('age')
                 )
-            elif current_entry:
-                table_match = re.match(r'^\s+to table\s+(\S+)', line)
-                if table_match:
-                    current_entry.next_hops.append(ShowRouteTableMpls0NextHop(action="to table " + table_match.group(1)))
-                elif re.match(r'^\s+Receive', line):
-                    current_entry.next_hops.append(ShowRouteTableMpls0NextHop(action="Receive"))
-                elif 'via lsi.' in line:
-                    lsi_match = re.match(r'^\s+>\s+via\s+(lsi\.\d+)\s+\(([^)]+)\),\s+(\w+)', line)
-                    if lsi_match:
-                        current_entry.next_hops.append(ShowRouteTableMpls0NextHop(
-                            via=lsi_match.group(1), lsp_name=lsi_match.group(2), action=lsi_match.group(3)
-                        ))
-                elif 'via vt-' in line:
-                    vt_match = re.match(r'^\s+>?\s*via\s+(vt-[\d/\.]+),\s+(\w+)', line)
-                    if vt_match:
-                        current_entry.next_hops.append(ShowRouteTableMpls0NextHop(via=vt_match.group(1), action=vt_match.group(2)))
-                elif 'via ms-' in line:
-                    ms_match = re.match(r'^\s+>\s+via\s+(ms-[\d/\.]+),\s+(\w+)', line)
-                    if ms_match:
-                        current_entry.next_hops.append(ShowRouteTableMpls0NextHop(via=ms_match.group(1), action=ms_match.group(2)))
-                elif line.strip().startswith('>') or line.strip().startswith('to '):
-                    clean_line = line.strip().lstrip('>')
-                    lsp_match = re.search(r'label-switched-path\s+(.+?)$', clean_line)
-                    lsp_name = lsp_match.group(1) if lsp_match else None
-                    nh_match = re.match(r'^\s*to\s+(\S+)\s+via\s+(\S+)', clean_line)
-                    if nh_match:
-                        to_addr = nh_match.group(1)
-                        via_iface = nh_match.group(2).rstrip(',')
-                        remainder = clean_line[nh_match.end():].strip().lstrip(',').strip()
-                        action = mpls_label = None
-                        if remainder and 'label-switched-path' not in remainder:
-                            if remainder.startswith('Pop'):
-                                action = "Pop"
-                            elif remainder.startswith('Swap'):
-                                sp_match = re.match(r'Swap\s+(\S+),\s+Push\s+(\S+)', remainder)
-                                if sp_match:
-                                    action = f"Swap {sp_match.group(1).rstrip(',')}, Push"
-                                    mpls_label = sp_match.group(2)
-                                else:
-                                    sw_match = re.match(r'Swap\s+(\S+)', remainder)
-                                    if sw_match:
-                                        action, mpls_label = "Swap", sw_match.group(1).rstrip(',')
-                            elif remainder.startswith('Push'):
-                                push_match = re.match(r'Push\s+(\S+)', remainder)
-                                if push_match:
-                                    action, mpls_label = "Push", push_match.group(1)
-                        current_entry.next_hops.append(ShowRouteTableMpls0NextHop(
-                            to=to_addr, via=via_iface, action=action, mpls_label=mpls_label, lsp_name=lsp_name
-                        ))
-            i += 1
+                append_next_hop = current_entry.next_hops.append
+            elif not current_entry:
+                continue
+            elif group('table'):
+                append_next_hop(ShowRouteTableMpls0NextHop(action="to table " + group('table')))
+            elif group('receive'):
+                append_next_hop(ShowRouteTableMpls0NextHop(action="Receive"))
+            elif group('lsi'):
+                append_next_hop(ShowRouteTableMpls0NextHop(
+                    via=group('lsi'), lsp_name=group('lsi_lsp'), action=group('lsi_action')
+                ))
+            elif group('vt'):
+                append_next_hop(ShowRouteTableMpls0NextHop(via=group('vt'), action=group('vt_action')))
+            elif group('ms'):
+                append_next_hop(ShowRouteTableMpls0NextHop(via=group('ms'), action=group('ms_action')))
+            else:
+                rest = group('rest').strip()
+                lsp_match = MPLS0_LSP_NAME_PATTERN.search(rest)
+                lsp_name = lsp_match.group(1) if lsp_match else None
+                via_iface = group('via').rstrip(',')
+                remainder = rest.lstrip(',').strip()
+                action = mpls_label = None
+                if remainder and 'label-switched-path' not in remainder:
+                    if remainder.startswith('Pop'):
+                        action = "Pop"
+                    elif remainder.startswith('Swap'):
+                        sp_match = MPLS0_SWAP_PUSH_PATTERN.match(remainder)
+                        if sp_match:
+                            action = f"Swap {sp_match.group(1).rstrip(',')}, Push"
+                            mpls_label = sp_match.group(2)
+                        else:
+                            sw_match = MPLS0_SWAP_PATTERN.match(remainder)
+                            if sw_match:
+                                action, mpls_label = "Swap", sw_match.group(1).rstrip(',')
+                    elif remainder.startswith('Push'):
+                        push_match = MPLS0_PUSH_PATTERN.match(remainder)
+                        if push_match:
+                            action, mpls_label = "Push", push_match.group(1)
+                append_next_hop(ShowRouteTableMpls0NextHop(
+                    to=group('to'), via=via_iface, action=action, mpls_label=mpls_label, lsp_name=lsp_name
+                ))
 
         if current_entry:
-            result.entries.append(current_entry)
+            append_entry(current_entry)
 
-        return asdict(result)
+        return result.to_dict()
     except Exception as e:
         return {"error": f"Error parsing {cmd}: {str(e)}"}
 
 
 # ────────────────────────────────────────────────────────────────────────────────
+MPLS_INTERFACE_PATTERN = re.compile(r'^(\S+)\s+(Up|Down)\s+(.*)$', re.MULTILINE | re.ASCII)
+
+
 def parse_show_mpls_interface(text_content: str) -> Dict[str, Any]:
     cmd = "show mpls interface | no-more"
     try:
         result = ShowMplsInterface()
-        pattern = r'^(\S+)\s+(Up|Down)\s+(.*)$'
-        for match in re.finditer(pattern, text_content, re.MULTILINE):
-            if match.group(1) == 'Interface':
+        append_entry = result.entries.append
+        for interface, state, administrative_groups in MPLS_INTERFACE_PATTERN.findall(text_content):
+            if interface == 'Interface':
                 continue
             entry = ShowMplsInterfaceEntry(
-                interface=match.group(1),
-                state=match.group(2),
-                administrative_groups=match.group(3).strip()
+                interface=interface,
+                state=state,
+                administrative_groups=administrative_groups.strip()
             )
-            result.entries.append(entry)
-        return asdict(result)
+            append_entry(entry)
+        return result.to_dict()
     except Exception as e:
         return {"error": f"Error parsing {cmd}: {str(e)}"}
 
 
 # ────────────────────────────────────────────────────────────────────────────────
+# Shared by show mpls lsp and show mpls lsp p2mp. Egress and transit rows use
+# SESSION_ROW_PATTERN; ingress rows carry only the P column and the LSP name.
+# P is either "*" or blank, so it is an optional group rather than a second
+# whitespace run next to two others (which backtracks badly on bad rows).
+LSP_HEADER_PATTERN         = re.compile(r'(Ingress|Egress|Transit) LSP:(?:\s+(\d+)\s+sessions)?', re.ASCII)
+LSP_TOTAL_PATTERN          = re.compile(r'Total\s+(\d+)\s+displayed,\s+Up\s+(\d+),\s+Down\s+(\d+)', re.ASCII)
+LSP_INGRESS_ROW_PATTERN    = re.compile(
+    r'^[^\S\n]*(\d{1,3}(?:\.\d{1,3}){3})\s+(\d{1,3}(?:\.\d{1,3}){3})\s+(\w+)\s+(\d+)(?:[^\S\n]+(\*))?[^\S\n]+(\S[^\n]*)$',
+    re.MULTILINE | re.ASCII
+)
+P2MP_NAME_PATTERN          = re.compile(r'(.+?),\s+P2MP branch count:\s+(\d+)', re.ASCII)
+# P2MP branch rows, anchored per line so one finditer covers a whole session
+P2MP_INGRESS_BRANCH_PATTERN = re.compile(
+    r'^(\d{1,3}(?:\.\d{1,3}){3})[^\S\n]+(\d{1,3}(?:\.\d{1,3}){3})[^\S\n]+(\w+)[^\S\n]+(\d+)'
+    r'(?:[^\S\n]+(\*))?[^\S\n]+(\S[^\n]*)$',
+    re.MULTILINE | re.ASCII
+)
+P2MP_BRANCH_PATTERN        = re.compile(
+    r'^(\d{1,3}(?:\.\d{1,3}){3})[^\S\n]+(\d{1,3}(?:\.\d{1,3}){3})[^\S\n]+(\w+)[^\S\n]+(\d+)[^\S\n]+(\d+)'
+    r'[^\S\n]+(\S+)[^\S\n]+(\S+)[^\S\n]+(\S+)[^\S\n]+(.+)$',
+    re.MULTILINE | re.ASCII
+)
+
+
+def locate_lsp_sections(text_content):
+    # One scan for the "<Kind> LSP: N sessions" headers. Returns the offset of
+    # each kind's first header and the first session count seen for it.
+    header_at = {}
+    sessions = {}
+    for header in LSP_HEADER_PATTERN.finditer(text_content):
+        kind = header.group(1)
+        header_at.setdefault(kind, header.start())
+        if header.group(2) and kind not in sessions:
+            sessions[kind] = int(header.group(2))
+    return header_at, sessions
+
+
+def iter_p2mp_sessions(text_content, pos, endpos):
+    # Same pieces as text_content[pos:endpos].split('P2MP name:')[1:], yielded
+    # one at a time without copying the section out first
+    marker = 'P2MP name:'
+    start = text_content.find(marker, pos, endpos)
+    while start != -1:
+        start += len(marker)
+        end = text_content.find(marker, start, endpos)
+        yield text_content[start:end if end != -1 else endpos]
+        start = end
+
+
+def ingress_branch_from_row(row):
+    to, from_, state, rt, p, lsp_name = row
+    return P2MPIngressBranch(
+        to=to, from_=from_, state=state,
+        rt=int(rt), p=p, active_path='',
+        lsp_name=lsp_name.strip()
+    )
+
+
+def egress_branch_from_row(row):
+    return session_entry_from_row(P2MPEgressBranch, row)
+
+
+def transit_branch_from_row(row):
+    return session_entry_from_row(P2MPTransitBranch, row)
+
+
+def p2mp_sessions_between(text_content, pos, endpos, branch_pattern, branch_from_row):
+    sessions = []
+    for session_text in iter_p2mp_sessions(text_content, pos, endpos):
+        header, _, branch_rows = session_text.strip().partition('\n')
+        name_match = P2MP_NAME_PATTERN.match(header)
+        if not name_match:
+            continue
+        session = P2MPSession(p2mp_name=name_match.group(1).strip(), branch_count=int(name_match.group(2)))
+        session.branches = list(map(branch_from_row, branch_pattern.findall(branch_rows)))
+        sessions.append(session)
+    return sessions
+
+
 def parse_show_mpls_lsp(text_content: str) -> Dict[str, Any]:
     cmd = "show mpls lsp | no-more"
     try:
         result = ShowMplsLsp()
 
-        ingress_header = re.search(r'Ingress LSP:\s+(\d+)\s+sessions', text_content)
-        if ingress_header:
-            result.ingress_sessions = int(ingress_header.group(1))
+        # Locate the three section headers once and slice between them.
+        header_at, sessions = locate_lsp_sections(text_content)
+        ingress_at = header_at.get('Ingress', -1)
+        egress_at  = header_at.get('Egress', -1)
+        transit_at = header_at.get('Transit', -1)
+        egress_end = transit_at if transit_at > egress_at else len(text_content)
 
-        ingress_total = re.search(
-            r'Total\s+(\d+)\s+displayed,\s+Up\s+(\d+),\s+Down\s+(\d+)',
-            text_content.split('Egress LSP:')[0] if 'Egress LSP:' in text_content else text_content
-        )
+        if 'Ingress' in sessions:
+            result.ingress_sessions = sessions['Ingress']
+
+        ingress_total = LSP_TOTAL_PATTERN.search(text_content, 0, egress_at if egress_at != -1 else len(text_content))
         if ingress_total:
             result.ingress_up = int(ingress_total.group(2))
             result.ingress_down = int(ingress_total.group(3))
 
-        ingress_pattern = r'(\d+\.\d+\.\d+\.\d+)\s+(\d+\.\d+\.\d+\.\d+)\s+(\w+)\s+(\d+)\s+(\*|\s+)\s+(.+)$'
-
         ingress_section = ""
-        if 'Ingress LSP:' in text_content and 'Egress LSP:' in text_content:
-            ingress_section = text_content.split('Ingress LSP:')[1].split('Egress LSP:')[0]
-        for match in re.finditer(ingress_pattern, ingress_section, re.MULTILINE):
-            entry = MplsLspIngressEntry(
-                to=match.group(1),
-                from_=match.group(2),
-                state=match.group(3),
-                rt=int(match.group(4)),
-                p=match.group(5).strip(),
+        if ingress_at != -1 and egress_at != -1:
+            ingress_section = text_content[ingress_at + len('Ingress LSP:'):egress_at]
+        # findall gives '' for a blank P column
+        result.ingress_entries = [
+            MplsLspIngressEntry(
+                to=to,
+                from_=from_,
+                state=state,
+                rt=int(rt),
+                p=p,
                 active_path='',
-                lsp_name=match.group(6).strip()
+                lsp_name=lsp_name.strip()
             )
-            result.ingress_entries.append(entry)
-
-        egress_header = re.search(r'Egress LSP:\s+(\d+)\s+sessions', text_content)
-        if egress_header:
-            result.egress_sessions = int(egress_header.group(1))
-
-        egress_section_text = ""
-        if 'Egress LSP:' in text_content:
-            egress_section_text = text_content.split('Egress LSP:')[1]
-        egress_total = re.search(
-            r'Total\s+(\d+)\s+displayed,\s+Up\s+(\d+),\s+Down\s+(\d+)',
-            egress_section_text.split('Transit LSP:')[0] if 'Transit LSP:' in egress_section_text else egress_section_text
-        )
-        if egress_total:
-            result.egress_up = int(egress_total.group(2))
-            result.egress_down = int(egress_total.group(3))
+            for to, from_, state, rt, p, lsp_name in LSP_INGRESS_ROW_PATTERN.findall(ingress_section)
+        ]
 
-        egress_pattern = r'(\d+\.\d+\.\d+\.\d+)\s+(\d+\.\d+\.\d+\.\d+)\s+(\w+)\s+(\d+)\s+(\d+)\s+(\S+)\s+(\S+)\s+(\S+)\s+(.+?)$'
+        if 'Egress' in sessions:
+            result.egress_sessions = sessions['Egress']
 
         egress_section = ""
-        if 'Egress LSP:' in text_content:
-            egress_section = text_content.split('Egress LSP:')[1]
-            if 'Transit LSP:' in egress_section:
-                egress_section = egress_section.split('Transit LSP:')[0]
-        for match in re.finditer(egress_pattern, egress_section, re.MULTILINE):
-            entry = MplsLspEgressEntry(
-                to=match.group(1),
-                from_=match.group(2),
-                state=match.group(3),
-                rt=int(match.group(4)),
-                style=f"{match.group(5)} {match.group(6)}",
-                label_in=match.group(7),
-                label_out=match.group(8),
-                lsp_name=match.group(9).strip()
-            )
-            result.egress_entries.append(entry)
+        if egress_at != -1:
+            egress_section = text_content[egress_at + len('Egress LSP:'):egress_end]
+        egress_total = LSP_TOTAL_PATTERN.search(egress_section)
+        if egress_total:
+            result.egress_up = int(egress_total.group(2))
+            result.egress_down = int(egress_total.group(3))
 
-        transit_header = re.search(r'Transit LSP:\s+(\d+)\s+sessions', text_content)
-        if transit_header:
-            result.transit_sessions = int(transit_header.group(1))
+        result.egress_entries = list(map(
+            partial(session_entry_from_row, MplsLspEgressEntry), SESSION_ROW_PATTERN.findall(egress_section)
+        ))
 
-        transit_pattern = r'(\d+\.\d+\.\d+\.\d+)\s+(\d+\.\d+\.\d+\.\d+)\s+(\w+)\s+(\d+)\s+(\d+)\s+(\S+)\s+(\S+)\s+(\S+)\s+(.+?)$'
+        if 'Transit' in sessions:
+            result.transit_sessions = sessions['Transit']
 
         transit_section = ""
-        if 'Transit LSP:' in text_content:
-            transit_section = text_content.split('Transit LSP:')[1]
-        for match in re.finditer(transit_pattern, transit_section, re.MULTILINE):
-            entry = MplsLspTransitEntry(
-                to=match.group(1),
-                from_=match.group(2),
-                state=match.group(3),
-                rt=int(match.group(4)),
-                style=f"{match.group(5)} {match.group(6)}",
-                label_in=match.group(7),
-                label_out=match.group(8),
-                lsp_name=match.group(9).strip()
-            )
-            result.transit_entries.append(entry)
-
-        transit_section_text = ""
-        if 'Transit LSP:' in text_content:
-            transit_section_text = text_content.split('Transit LSP:')[1]
-        transit_total = re.search(
-            r'Total\s+(\d+)\s+displayed,\s+Up\s+(\d+),\s+Down\s+(\d+)',
-            transit_section_text
-        )
+        if transit_at != -1:
+            transit_section = text_content[transit_at + len('Transit LSP:'):]
+        result.transit_entries = list(map(
+            partial(session_entry_from_row, MplsLspTransitEntry), SESSION_ROW_PATTERN.findall(transit_section)
+        ))
+
+        transit_total = LSP_TOTAL_PATTERN.search(transit_section)
         if transit_total:
             result.transit_up = int(transit_total.group(2))
             result.transit_down = int(transit_total.group(3))
         else:
-            result.transit_up = sum(1 for e in result.transit_entries if e.state == 'Up')
-            result.transit_down = sum(1 for e in result.transit_entries if e.state == 'Down')
+            transit_states      = [e.state for e in result.transit_entries]
+            result.transit_up   = transit_states.count('Up')
+            result.transit_down = transit_states.count('Down')
 
-        return asdict(result)
+        return result.to_dict()
     except Exception as e:
         return {"error": f"Error parsing {cmd}: {str(e)}"}
 
@@ -1319,106 +1474,48 @@ def parse_show_mpls_lsp_p2mp(text_content: str) -> Dict[str, Any]:
     try:
         result = ShowMplsLspP2MP()
 
-        ingress_header = re.search(r'Ingress LSP:\s+(\d+)\s+sessions', text_content)
-        if ingress_header:
-            result.ingress_lsp.total_sessions = int(ingress_header.group(1))
-
-        if 'Ingress LSP:' in text_content and 'Egress LSP:' in text_content:
-            ingress_section = text_content.split('Ingress LSP:')[1].split('Egress LSP:')[0]
-            ingress_total = re.search(r'Total\s+(\d+)\s+displayed,\s+Up\s+(\d+),\s+Down\s+(\d+)', ingress_section)
-            if ingress_total:
-                result.ingress_lsp.sessions_displayed = int(ingress_total.group(1))
-                result.ingress_lsp.sessions_up = int(ingress_total.group(2))
-                result.ingress_lsp.sessions_down = int(ingress_total.group(3))
-
-            for session_text in re.split(r'P2MP name:', ingress_section)[1:]:
-                lines = session_text.strip().split('\n')
-                if not lines:
-                    continue
-                name_match = re.match(r'(.+?),\s+P2MP branch count:\s+(\d+)', lines[0])
-                if not name_match:
-                    continue
-                session = P2MPSession(p2mp_name=name_match.group(1).strip(), branch_count=int(name_match.group(2)))
-                branch_pattern = r'(\d+\.\d+\.\d+\.\d+)\s+(\d+\.\d+\.\d+\.\d+)\s+(\w+)\s+(\d+)\s+(\*|\s+)\s+(.+)$'
-                for line in lines[1:]:
-                    if line.strip().startswith('To'):
-                        continue
-                    match = re.match(branch_pattern, line)
-                    if match:
-                        session.branches.append(P2MPIngressBranch(
-                            to=match.group(1), from_=match.group(2), state=match.group(3),
-                            rt=int(match.group(4)), p=match.group(5).strip(), active_path='',
-                            lsp_name=match.group(6).strip()
-                        ))
-                result.ingress_lsp.sessions.append(session)
-
-        egress_header = re.search(r'Egress LSP:\s+(\d+)\s+sessions', text_content)
-        if egress_header:
-            result.egress_lsp.total_sessions = int(egress_header.group(1))
-
-        if 'Egress LSP:' in text_content:
-            egress_section = text_content.split('Egress LSP:')[1]
-            if 'Transit LSP:' in egress_section:
-                egress_section = egress_section.split('Transit LSP:')[0]
-            egress_total = re.search(r'Total\s+(\d+)\s+displayed,\s+Up\s+(\d+),\s+Down\s+(\d+)', egress_section)
-            if egress_total:
-                result.egress_lsp.sessions_displayed = int(egress_total.group(1))
-                result.egress_lsp.sessions_up = int(egress_total.group(2))
-                result.egress_lsp.sessions_down = int(egress_total.group(3))
-
-            branch_pattern = r'(\d+\.\d+\.\d+\.\d+)\s+(\d+\.\d+\.\d+\.\d+)\s+(\w+)\s+(\d+)\s+(\d+)\s+(\S+)\s+(\S+)\s+(\S+)\s+(.+?)$'
-            for session_text in re.split(r'P2MP name:', egress_section)[1:]:
-                lines = session_text.strip().split('\n')
-                if not lines:
-                    continue
-                name_match = re.match(r'(.+?),\s+P2MP branch count:\s+(\d+)', lines[0])
-                if not name_match:
-                    continue
-                session = P2MPSession(p2mp_name=name_match.group(1).strip(), branch_count=int(name_match.group(2)))
-                for line in lines[1:]:
-                    if line.strip().startswith('To'):
-                        continue
-                    match = re.match(branch_pattern, line)
-                    if match:
-                        session.branches.append(P2MPEgressBranch(
-                            to=match.group(1), from_=match.group(2), state=match.group(3),
-                            rt=int(match.group(4)), style=f"{match.group(5)} {match.group(6)}",
-                            label_in=match.group(7), label_out=match.group(8), lsp_name=match.group(9).strip()
-                        ))
-                result.egress_lsp.sessions.append(session)
-
-        transit_header = re.search(r'Transit LSP:\s+(\d+)\s+sessions', text_content)
-        if transit_header:
-            result.transit_lsp.total_sessions = int(transit_header.group(1))
-
-        if 'Transit LSP:' in text_content:
-            transit_section = text_content.split('Transit LSP:')[1]
-            branch_pattern = r'(\d+\.\d+\.\d+\.\d+)\s+(\d+\.\d+\.\d+\.\d+)\s+(\w+)\s+(\d+)\s+(\d+)\s+(\S+)\s+(\S+)\s+(\S+)\s+(.+?)$'
-            for session_text in re.split(r'P2MP name:', transit_section)[1:]:
-                lines = session_text.strip().split('\n')
-                if not lines:
-                    continue
-                name_match = re.match(r'(.+?),\s+P2MP branch count:\s+(\d+)', lines[0])
-                if not name_match:
-                    continue
-                session = P2MPSession(p2mp_name=name_match.group(1).strip(), branch_count=int(name_match.group(2)))
-                for line in lines[1:]:
-                    if line.strip().startswith('To'):
-                        continue
-                    match = re.match(branch_pattern, line)
-                    if match:
-                        session.branches.append(P2MPTransitBranch(
-                            to=match.group(1), from_=match.group(2), state=match.group(3),
-                            rt=int(match.group(4)), style=f"{match.group(5)} {match.group(6)}",
-                            label_in=match.group(7), label_out=match.group(8), lsp_name=match.group(9).strip()
-                        ))
-                result.transit_lsp.sessions.append(session)
+        # Sections are walked in place between the header offsets, so the
+        # text is never copied out section by section.
+        header_at, sessions = locate_lsp_sections(text_content)
+        ingress_at = header_at.get('Ingress', -1)
+        egress_at  = header_at.get('Egress', -1)
+        transit_at = header_at.get('Transit', -1)
+        egress_end = transit_at if transit_at > egress_at else len(text_content)
+
+        # kind, section, section start, section end, branch row pattern, branch builder
+        sections = []
+        if ingress_at != -1 and egress_at != -1:
+            sections.append(('Ingress', result.ingress_lsp, ingress_at + len('Ingress LSP:'), egress_at,
+                             P2MP_INGRESS_BRANCH_PATTERN, ingress_branch_from_row))
+        if egress_at != -1:
+            sections.append(('Egress', result.egress_lsp, egress_at + len('Egress LSP:'), egress_end,
+                             P2MP_BRANCH_PATTERN, egress_branch_from_row))
+        if transit_at != -1:
+            sections.append(('Transit', result.transit_lsp, transit_at + len('Transit LSP:'), len(text_content),
+                             P2MP_BRANCH_PATTERN, transit_branch_from_row))
+
+        for kind in ('Ingress', 'Egress', 'Transit'):
+            if kind in sessions:
+                getattr(result, f"{kind.lower()}_lsp").total_sessions = sessions[kind]
+
+        for kind, lsp, pos, endpos, branch_pattern, branch_from_row in sections:
+            lsp.sessions = p2mp_sessions_between(text_content, pos, endpos, branch_pattern, branch_from_row)
+
+            if kind == 'Transit':
+                # Transit has no Total line; counts come from the branch states
+                transit_states         = [b.state for s in lsp.sessions for b in s.branches]
+                lsp.sessions_displayed = len(transit_states)
+                lsp.sessions_up        = transit_states.count('Up')
+                lsp.sessions_down      = transit_states.count('Down')
+                continue
 
-            result.transit_lsp.sessions_displayed = sum(len(s.branches) for s in result.transit_lsp.sessions)
-            result.transit_lsp.sessions_up = sum(1 for s in result.transit_lsp.sessions for b in s.branches if b.state == 'Up')
-            result.transit_lsp.sessions_down = sum(1 for s in result.transit_lsp.sessions for b in s.branches if b.state == 'Down')
+            total = LSP_TOTAL_PATTERN.search(text_content, pos, endpos)
+            if total:
+                lsp.sessions_displayed = int(total.group(1))
+                lsp.sessions_up = int(total.group(2))
+                lsp.sessions_down = int(total.group(3))
 
-        return asdict(result)
+        return result.to_dict()
     except Exception as e:
         return {"error": f"Error parsing {cmd}: {str(e)}"}
 
@@ -1442,17 +1539,53 @@ def parse_show_bgp_neighbor(text_content: str) -> Dict[str, Any]:
 
 
 # ────────────────────────────────────────────────────────────────────────────────
+ISIS_SECTION_SPLIT_PATTERN   = re.compile(r'\n(?=[A-Z0-9]+\n\s+Interface:)', re.ASCII)
+ISIS_SYSTEM_PATTERN          = re.compile(r'^([A-Z0-9]+)', re.ASCII)
+ISIS_INTERFACE_PATTERN       = re.compile(r'Interface:\s+(\S+),', re.ASCII)
+ISIS_LEVEL_PATTERN           = re.compile(r'Level:\s+(\d+)', re.ASCII)
+ISIS_STATE_PATTERN           = re.compile(r'State:\s+(\w+)', re.ASCII)
+ISIS_EXPIRES_PATTERN         = re.compile(r'Expires in\s+(\d+\s+secs)', re.ASCII)
+ISIS_PRIORITY_PATTERN        = re.compile(r'Priority:\s+(\d+)', re.ASCII)
+ISIS_TRANSITIONS_PATTERN     = re.compile(r'Up/Down transitions:\s+(\d+)', re.ASCII)
+ISIS_LAST_TRANSITION_PATTERN = re.compile(r'Last transition:\s+(.+?)(?:\n|$)', re.ASCII)
+ISIS_CIRCUIT_TYPE_PATTERN    = re.compile(r'Circuit type:\s+(\d+)', re.ASCII)
+ISIS_SPEAKS_PATTERN          = re.compile(r'Speaks:\s+(.+?)(?:\n)', re.ASCII)
+ISIS_TOPOLOGIES_PATTERN      = re.compile(r'Topologies:\s+(.+)', re.ASCII)
+ISIS_RESTART_PATTERN         = re.compile(r'Restart capable:\s+(\w+)', re.ASCII)
+ISIS_ADJ_ADV_PATTERN         = re.compile(r'Adjacency advertisement:\s+(.+)', re.ASCII)
+ISIS_IP_PATTERN              = re.compile(r'IP addresses:\s+(.+)', re.ASCII)
+ISIS_ADJ_SID_PATTERN         = re.compile(r'Level\s+(\d+)\s+(IPv[46])\s+(\w+)\s+Adj-SID:\s+(\d+),\s+Flags:\s+(.+)', re.ASCII)
+ISIS_TRANSITION_LOG_PATTERN  = re.compile(r'Transition log:\s*\n\s+(When\s+State\s+Event\s+Down reason)\s*\n((?:\s+\S.*\n?)+)', re.ASCII)
+ISIS_TRANSITION_LINE_PATTERN = re.compile(r'\s+(\w{3}\s+\w{3}\s+\d{1,2}\s+\d+:\d+:\d+)\s+(\w+)\s+(.+)', re.ASCII)
+COLUMN_GAP_PATTERN           = re.compile(r'\s{2,}', re.ASCII)
+
+# Scalar fields of an adjacency block: entry attribute, pattern, converter.
+ISIS_FIELDS = (
+    ('interface',               ISIS_INTERFACE_PATTERN,       None),
+    ('level',                   ISIS_LEVEL_PATTERN,           None),
+    ('state',                   ISIS_STATE_PATTERN,           None),
+    ('expires_in',              ISIS_EXPIRES_PATTERN,         None),
+    ('priority',                ISIS_PRIORITY_PATTERN,        None),
+    ('up_down_transitions',     ISIS_TRANSITIONS_PATTERN,     int),
+    ('last_transition',         ISIS_LAST_TRANSITION_PATTERN, None),
+    ('circuit_type',            ISIS_CIRCUIT_TYPE_PATTERN,    None),
+    ('speaks',                  ISIS_SPEAKS_PATTERN,          str.strip),
+    ('topologies',              ISIS_TOPOLOGIES_PATTERN,      str.strip),
+    ('restart_capable',         ISIS_RESTART_PATTERN,         None),
+    ('adjacency_advertisement', ISIS_ADJ_ADV_PATTERN,         str.strip),
+    ('ip_addresses',            ISIS_IP_PATTERN,              lambda value: [value.strip()]),
+)
+
+
 def parse_show_isis_adjacency_extensive(text_content: str) -> Dict[str, Any]:
     cmd = "show isis adjacency extensive | no-more"
     try:
         result = ShowIsisAdjacencyExtensive()
-        adjacency_sections = re.split(r'\n(?=[A-Z0-9]+\n\s+Interface:)', text_content)
-
-        for section in adjacency_sections:
+        for section in iter_sections(ISIS_SECTION_SPLIT_PATTERN, text_content):
             if not section.strip():
                 continue
 
-            system_match = re.match(r'^([A-Z0-9]+)', section)
+            system_match = ISIS_SYSTEM_PATTERN.match(section)
             if not system_match:
                 continue
 
@@ -1464,80 +1597,31 @@ def parse_show_isis_adjacency_extensive(text_content: str) -> Dict[str, Any]:
                 restart_capable="", adjacency_advertisement=""
             )
 
-            interface_match = re.search(r'Interface:\s+(\S+),', section)
-            if interface_match:
-                entry.interface = interface_match.group(1)
-
-            level_match = re.search(r'Level:\s+(\d+)', section)
-            if level_match:
-                entry.level = level_match.group(1)
-
-            state_match = re.search(r'State:\s+(\w+)', section)
-            if state_match:
-                entry.state = state_match.group(1)
-
-            expires_match = re.search(r'Expires in\s+(\d+\s+secs)', section)
-            if expires_match:
-                entry.expires_in = expires_match.group(1)
-
-            priority_match = re.search(r'Priority:\s+(\d+)', section)
-            if priority_match:
-                entry.priority = priority_match.group(1)
-
-            transitions_match = re.search(r'Up/Down transitions:\s+(\d+)', section)
-            if transitions_match:
-                entry.up_down_transitions = int(transitions_match.group(1))
-
-            last_trans_match = re.search(r'Last transition:\s+(.+?)(?:\n|$)', section)
-            if last_trans_match:
-                entry.last_transition = last_trans_match.group(1)
-
-            circuit_type_match = re.search(r'Circuit type:\s+(\d+)', section)
-            if circuit_type_match:
-                entry.circuit_type = circuit_type_match.group(1)
-
-            speaks_match = re.search(r'Speaks:\s+(.+?)(?:\n)', section)
-            if speaks_match:
-                entry.speaks = speaks_match.group(1).strip()
-
-            topologies_match = re.search(r'Topologies:\s+(.+)', section)
-            if topologies_match:
-                entry.topologies = topologies_match.group(1).strip()
-
-            restart_match = re.search(r'Restart capable:\s+(\w+)', section)
-            if restart_match:
-                entry.restart_capable = restart_match.group(1)
-
-            adj_adv_match = re.search(r'Adjacency advertisement:\s+(.+)', section)
-            if adj_adv_match:
-                entry.adjacency_advertisement = adj_adv_match.group(1).strip()
-
-            ip_match = re.search(r'IP addresses:\s+(.+)', section)
-            if ip_match:
-                entry.ip_addresses = [ip_match.group(1).strip()]
-
-            adj_sid_pattern = r'Level\s+(\d+)\s+(IPv[46])\s+(\w+)\s+Adj-SID:\s+(\d+),\s+Flags:\s+(.+)'
-            for adj_match in re.finditer(adj_sid_pattern, section):
-                entry.adj_sids.append({
-                    'level': adj_match.group(1),
-                    'ip_version': adj_match.group(2),
-                    'protection': adj_match.group(3),
-                    'sid': adj_match.group(4),
-                    'flags': adj_match.group(5).strip()
-                })
-
-            transition_log_match = re.search(
-                r'Transition log:\s*\n\s+(When\s+State\s+Event\s+Down reason)\s*\n((?:\s+\S.*\n?)+)',
-                section
-            )
+            for attr, pattern, convert in ISIS_FIELDS:
+                field_match = pattern.search(section)
+                if field_match:
+                    value = field_match.group(1)
+                    setattr(entry, attr, convert(value) if convert else value)
+
+            if 'Adj-SID:' in section:
+                for adj_match in ISIS_ADJ_SID_PATTERN.finditer(section):
+                    entry.adj_sids.append({
+                        'level': adj_match.group(1),
+                        'ip_version': adj_match.group(2),
+                        'protection': adj_match.group(3),
+                        'sid': adj_match.group(4),
+                        'flags': adj_match.group(5).strip()
+                    })
+
+            transition_log_match = 'Transition log:' in section and ISIS_TRANSITION_LOG_PATTERN.search(section)
             if transition_log_match:
                 for line in transition_log_match.group(2).strip().split('\n'):
                     if not line.strip():
                         continue
-                    match = re.match(r'\s+(\w{3}\s+\w{3}\s+\d{1,2}\s+\d+:\d+:\d+)\s+(\w+)\s+(.+)', line)
+                    match = ISIS_TRANSITION_LINE_PATTERN.match(line)
                     if match:
                         rest = match.group(3).strip()
-                        parts = re.split(r'\s{2,}', rest, maxsplit=1)
+                        parts = COLUMN_GAP_PATTERN.split(rest, maxsplit=1)
                         entry.transition_log.append(ShowIsisAdjacencyTransition(
                             when=match.group(1),
                             state=match.group(2),
@@ -1547,72 +1631,82 @@ def parse_show_isis_adjacency_extensive(text_content: str) -> Dict[str, Any]:
 
             result.entries.append(entry)
 
-        return asdict(result)
+        return result.to_dict()
     except Exception as e:
         return {"error": f"Error parsing {cmd}: {str(e)}"}
 
 
 # ────────────────────────────────────────────────────────────────────────────────
+ROUTE_SUMMARY_AS_PATTERN           = re.compile(r'Autonomous system number:\s+(\d+)', re.ASCII)
+ROUTE_SUMMARY_ROUTER_ID_PATTERN    = re.compile(r'Router ID:\s+(\S+)', re.ASCII)
+HIGHWATER_RIB_DESTINATIONS_PATTERN = re.compile(r'RIB unique destination routes:\s+(.+)', re.ASCII)
+HIGHWATER_RIB_ROUTES_PATTERN       = re.compile(r'RIB routes\s+:\s+(.+)', re.ASCII)
+HIGHWATER_FIB_ROUTES_PATTERN       = re.compile(r'FIB routes\s+:\s+(.+)', re.ASCII)
+HIGHWATER_VRF_PATTERN              = re.compile(r'VRF type routing instances\s+:\s+(.+)', re.ASCII)
+ROUTE_SUMMARY_TABLE_PATTERN        = re.compile(r'^(\S+(?:\.\S+)?): (\d+) destinations, (\d+) routes \((\d+) active, (\d+) holddown, (\d+) hidden\)', re.ASCII)
+ROUTE_SUMMARY_PROTOCOL_PATTERN     = re.compile(r'^\s+(\S+):\s+(\d+) routes,\s+(\d+) active', re.ASCII)
+
+
 def parse_show_route_summary(text_content: str) -> Dict[str, Any]:
     cmd = "show route summary | no-more"
     try:
         result = ShowRouteSummary()
 
-        as_match = re.search(r'Autonomous system number:\s+(\d+)', text_content)
+        as_match = ROUTE_SUMMARY_AS_PATTERN.search(text_content)
         if as_match:
             result.autonomous_system = as_match.group(1)
 
-        router_id_match = re.search(r'Router ID:\s+(\S+)', text_content)
+        router_id_match = ROUTE_SUMMARY_ROUTER_ID_PATTERN.search(text_content)
         if router_id_match:
             result.router_id = router_id_match.group(1)
 
         highwater = ShowRouteSummaryHighwater()
-        hw_match = re.search(r'RIB unique destination routes:\s+(.+)', text_content)
+        hw_match = HIGHWATER_RIB_DESTINATIONS_PATTERN.search(text_content)
         if hw_match:
             highwater.rib_unique_destination_routes = hw_match.group(1).strip()
 
-        hw_routes_match = re.search(r'RIB routes\s+:\s+(.+)', text_content)
+        hw_routes_match = HIGHWATER_RIB_ROUTES_PATTERN.search(text_content)
         if hw_routes_match:
             highwater.rib_routes = hw_routes_match.group(1).strip()
 
-        hw_fib_match = re.search(r'FIB routes\s+:\s+(.+)', text_content)
+        hw_fib_match = HIGHWATER_FIB_ROUTES_PATTERN.search(text_content)
         if hw_fib_match:
             highwater.fib_routes = hw_fib_match.group(1).strip()
 
-        hw_vrf_match = re.search(r'VRF type routing instances\s+:\s+(.+)', text_content)
+        hw_vrf_match = HIGHWATER_VRF_PATTERN.search(text_content)
         if hw_vrf_match:
             highwater.vrf_type_routing_instances = hw_vrf_match.group(1).strip()
 
         result.highwater = highwater
 
-        table_pattern = r'^(\S+(?:\.\S+)?): (\d+) destinations, (\d+) routes \((\d+) active, (\d+) holddown, (\d+) hidden\)'
-        protocol_pattern = r'^\s+(\S+):\s+(\d+) routes,\s+(\d+) active'
-
-        tables_section = text_content.split('Highwater Mark')[1] if 'Highwater Mark' in text_content else text_content
+        highwater_at   = text_content.find('Highwater Mark')
+        tables_section = text_content[highwater_at + len('Highwater Mark'):] if highwater_at != -1 else text_content
 
         current_table = None
         for line in tables_section.split('\n'):
-            table_match = re.match(table_pattern, line.strip())
+            table_match = 'destinations,' in line and ROUTE_SUMMARY_TABLE_PATTERN.match(line.strip())
             if table_match:
+                table_name, destinations, routes, active, holddown, hidden = table_match.groups()
                 current_table = ShowRouteSummaryTable(
-                    table_name=table_match.group(1),
-                    destinations=int(table_match.group(2)),
-                    routes=int(table_match.group(3)),
-                    active=int(table_match.group(4)),
-                    holddown=int(table_match.group(5)),
-                    hidden=int(table_match.group(6))
+                    table_name=table_name,
+                    destinations=int(destinations),
+                    routes=int(routes),
+                    active=int(active),
+                    holddown=int(holddown),
+                    hidden=int(hidden)
                 )
                 result.tables.append(current_table)
-            elif current_table:
-                protocol_match = re.match(protocol_pattern, line)
+            elif current_table and ' routes,' in line:
+                protocol_match = ROUTE_SUMMARY_PROTOCOL_PATTERN.match(line)
                 if protocol_match:
+                    protocol, routes, active = protocol_match.groups()
                     current_table.protocols.append(ShowRouteSummaryProtocol(
-                        protocol=protocol_match.group(1),
-                        routes=int(protocol_match.group(2)),
-                        active=int(protocol_match.group(3))
+                        protocol=protocol,
+                        routes=int(routes),
+                        active=int(active)
                     ))
 
-        return asdict(result)
+        return result.to_dict()
     except Exception as e:
         return {"error": f"Error parsing {cmd}: {str(e)}"}
 
@@ -1625,23 +1719,26 @@ def parse_show_rsvp_session_match_DN(text_content: str) -> Dict[str, Any]:
     except Exception as e:
         return {"error": f"Error parsing {cmd}: {str(e)}"}
 # ────────────────────────────────────────────────────────────────────────────────
+LSP_DOWN_ROW_PATTERN = re.compile(
+    r'^(\d{1,3}(?:\.\d{1,3}){3})\s+(\S+)\s+(Dn)\s+(\d+)\s+(\S+)\s+(.+)$',
+    re.MULTILINE | re.ASCII
+)
+
+
 def parse_show_mpls_lsp_unidirectional_no_more(text_content: str) -> Dict[str, Any]:
     cmd = "show mpls lsp unidirectional | match Dn | no-more"
     try:
-        down_lsps = []
-        pattern = re.compile(
-            r'^(\d+\.\d+\.\d+\.\d+)\s+(\S+)\s+(Dn)\s+(\d+)\s+(\S+)\s+(.+)$',
-            re.MULTILINE
-        )
-        for match in pattern.finditer(text_content):
-            down_lsps.append({
-                "to":       match.group(1),
-                "from":     match.group(2),
-                "state":    match.group(3),
-                "rt":       int(match.group(4)),
-                "style":    match.group(5),
-                "lsp_name": match.group(6).strip(),
-            })
+        down_lsps = [
+            {
+                "to":       to,
+                "from":     from_,
+                "state":    state,
+                "rt":       int(rt),
+                "style":    style,
+                "lsp_name": lsp_name.strip(),
+            }
+            for to, from_, state, rt, style, lsp_name in LSP_DOWN_ROW_PATTERN.findall(text_content)
+        ]
         return {
             "total_down": len(down_lsps),
             "down_lsps":  down_lsps,
@@ -1649,23 +1746,27 @@ def parse_show_mpls_lsp_unidirectional_no_more(text_content: str) -> Dict[str, A
     except Exception as e:
         return {"error": f"Error parsing {cmd}: {str(e)}"}
 # ────────────────────────────────────────────────────────────────────────────────
+# Rows start with the neighbor's dotted quad, so the header and banner lines
+# never match; [^\S\n] keeps each row on its own line
+LDP_NEIGHBOR_PATTERN = re.compile(
+    r'^[^\S\n]*(\d{1,3}(?:\.\d{1,3}){3})[^\S\n]+(\S+)[^\S\n]+(\S+)[^\S\n]+(\d+)[^\S\n]*$',
+    re.MULTILINE | re.ASCII
+)
+
+
 def parse_36_show_ldp_neighbor(text_content: str) -> Dict[str, Any]:
     cmd = "show ldp neighbor | no-more"
     try:
         ldp_neighbor_result = ShowLdpNeighbor()
-        neighbor_pattern = r'^(\d+\.\d+\.\d+\.\d+)\s+(\S+)\s+(\S+)\s+(\d+)$'
-
-        for line in text_content.splitlines():
-            if 'Address' in line or not line.strip():
-                continue
-            match = re.match(neighbor_pattern, line.strip())
-            if match:
-                ldp_neighbor_result.neighbors.append(LdpNeighbor(
-                    address=match.group(1),
-                    interface=match.group(2),
-                    label_space_id=match.group(3),
-                    hold_time=int(match.group(4))
-                ))
+        ldp_neighbor_result.neighbors = [
+            LdpNeighbor(
+                address=address,
+                interface=interface,
+                label_space_id=label_space_id,
+                hold_time=int(hold_time)
+            )
+            for address, interface, label_space_id, hold_time in LDP_NEIGHBOR_PATTERN.findall(text_content)
+        ]
 
         return ldp_neighbor_result.to_dict()
     except Exception as e:
@@ -1673,14 +1774,17 @@ def parse_36_show_ldp_neighbor(text_content: str) -> Dict[str, Any]:
 
 
 # ────────────────────────────────────────────────────────────────────────────────
+CONNECTIONS_NONE_PATTERN = re.compile(r'No matching connections found', re.IGNORECASE | re.ASCII)
+
+
 def parse_37_show_connections(text_content: str) -> Dict[str, Any]:
     cmd = "show connections | no-more"
     try:
         s = (text_content or "").strip()
-        if re.search(r'No matching connections found', s, re.IGNORECASE):
+        if CONNECTIONS_NONE_PATTERN.search(s):
             return {"connections": "None"}
         has_row = False
-        for line in s.splitlines():
+        for line in io.StringIO(s, newline=None):
             line = line.strip()
             if not line or "connection" in line.lower():
                 continue
@@ -1695,34 +1799,35 @@ def parse_37_show_connections(text_content: str) -> Dict[str, Any]:
 
 
 # ────────────────────────────────────────────────────────────────────────────────
+LOG_MESSAGE_PATTERN = re.compile(
+    r'^(\w+\s+\d+\s+\d{2}:\d{2}:\d{2}\.\d{3})\s+(\S+)\s+(\S+)\[(\d+)\]:\s+(.+)$',
+    re.MULTILINE | re.ASCII
+)
+
+
 def parse_show_log_messages_last_200(text_content: str) -> Dict[str, Any]:
     cmd = "show log messages | last 200 | no-more"
     try:
         result = RecentLogMessages()
-        lines = [line.strip() for line in text_content.strip().splitlines() if line.strip()]
+        lines = [line for line in map(str.strip, text_content.splitlines()) if line]
         result.recent_lines = lines[:5]
 
-        error_pattern = re.compile(
-            r'^(\w+\s+\d+\s+\d{2}:\d{2}:\d{2}\.\d{3})\s+(\S+)\s+(\S+)\[(\d+)\]:\s+(.+)$',
-            re.MULTILINE
-        )
         keywords = [
             "BGP_CONNECT_FAILED", "JTASK_IO_CONNECT_FAILED",
             "NOTIFICATION sent", "Connection Rejected", "Unconfigured Peer", "rpd["
         ]
 
-        for match in error_pattern.finditer(text_content):
-            msg = match.group(5)
+        for timestamp, hostname, process, pid, msg in LOG_MESSAGE_PATTERN.findall(text_content):
             if any(kw in msg for kw in keywords):
                 result.error_events.append(LogMessageEntry(
-                    timestamp=match.group(1),
-                    hostname=match.group(2),
-                    process=match.group(3),
-                    pid=int(match.group(4)),
+                    timestamp=timestamp,
+                    hostname=hostname,
+                    process=process,
+                    pid=int(pid),
                     message=msg.strip()
                 ))
 
         result.total_errors_found = len(result.error_events)
-        return asdict(result)
+        return result.to_dict()
     except Exception as e:
         return {"error": f"Error parsing {cmd}: {str(e)}"}
\ No newline at end of file
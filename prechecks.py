@@ -1,7 +1,26 @@
 import re
+from fnmatch import fnmatchcase
 from lib.utilities import *
 
 
+STORAGE_VAR_PATTERN  = re.compile(r"^/dev/gpt/var\s+\S+\s+\S+\s+(\S+)", re.M)
+STORAGE_SIZE_PATTERN = re.compile(r"^([\d.]+)\s*([GMTK]?)B?$", re.IGNORECASE)
+STORAGE_UNIT_TO_GB   = {"T": 1024, "G": 1, "M": 1 / 1024, "K": 1 / 1048576, "": 1}
+CHECKSUM_MD5_PATTERN = re.compile(r"\.tgz\)\s*=\s*(\S+)")
+CLEANUP_BATCH_SIZE   = 64
+# cleanup_files entries reach the router shell unquoted so globs expand: only
+# path and glob characters, and no leading "-" that rm/ls would take as a flag
+CLEANUP_PATH_PATTERN = re.compile(r"^[\w./*?\[\]][\w./*?\[\]-]*$")
+CLEANUP_MARKER       = "__cleanup_rm__"
+
+
+def _listed_paths(ls_output: str, patterns: list) -> list:
+    # Lines of "ls -d" output naming a path one of the requested entries
+    # matches; its "ls: <path>: No such file" errors and any echo are skipped
+    return [line.strip() for line in ls_output.splitlines()
+            if any(fnmatchcase(line.strip(), p) for p in patterns)]
+
+
 # ─────────────────────────────────────────────────────────────────────────────
 # PreCheck class
 # ─────────────────────────────────────────────────────────────────────────────
@@ -24,26 +43,29 @@ class PreCheck:
         self.min_disk_gb     = device.get("min_disk_gb")
         # accepted_vendors comes from the YAML, stored on dev by run_device_pipeline
         self.accepted_vendors = device.get("accepted_vendors", [])
+        # Checked once here; every step re-tests this flag instead of the list
+        self.vendor_supported = self.vendor in self.accepted_vendors
 
     # ─────────────────────────────────────────────────────────────────────────
     def checkStorage(self, conn, min_disk_gb, logger):
         try:
             logger.info(f"[{self.host}] checkStorage — vendor: {self.vendor}")
 
+            # Read fresh every time: the cleanup below changes the answer, and a
+            # single /var row is cheaper to pull with one regex than via TextFSM
             storage_output = conn.send_command("show system storage", expect_string=r'.*>')
 
-            match = re.search(r"^/dev/gpt/var\s+\S+\s+\S+\s+(\S+)", storage_output, re.M)
+            match = STORAGE_VAR_PATTERN.search(storage_output)
             if not match:
                 raise ValueError(f"[{self.host}] Could not parse storage output")
 
             raw        = match.group(1).rstrip("%")
-            size_match = re.match(r"^([\d.]+)\s*([GMTK]?)B?$", raw, re.IGNORECASE)
+            size_match = STORAGE_SIZE_PATTERN.match(raw)
             if not size_match:
                 raise ValueError(f"[{self.host}] Unrecognised storage value: '{raw}'")
             size_val   = float(size_match.group(1))
             size_unit  = size_match.group(2).upper()
-            unit_to_gb = {"T": 1024, "G": 1, "M": 1 / 1024, "K": 1 / 1048576, "": 1}
-            avail_space = size_val * unit_to_gb.get(size_unit, 1)
+            avail_space = size_val * STORAGE_UNIT_TO_GB.get(size_unit, 1)
             logger.info(f"[{self.host}] checkStorage — {avail_space:.2f} GB available")
 
             # Enough space
@@ -61,26 +83,50 @@ class PreCheck:
             logger.warning(f"[{self.host}] checkStorage — low space, running cleanup")
 
             files_to_delete = self.device.get("cleanup_files", [])
+            rejected_files  = [f for f in files_to_delete if not CLEANUP_PATH_PATTERN.match(str(f))]
+            files_to_delete = [f for f in files_to_delete if CLEANUP_PATH_PATTERN.match(str(f))]
+            if rejected_files:
+                logger.error(f"[{self.host}] checkStorage — refusing unsafe cleanup_files entries: {rejected_files}")
             if not files_to_delete:
                 msg = f"[{self.host}] checkStorage — cleanup_files empty, cannot free space"
                 logger.error(msg)
                 return {
                     "status":        "failed",
                     "deleted_files": [],
-                    "exception":     "cleanup_files empty",
+                    "exception":     ("no safe cleanup_files entries" if rejected_files
+                                      else "cleanup_files empty"),
                     "sufficient":    False,
                 }
 
+            # One shell command per batch instead of one "file delete" round trip
+            # per file. Paths go in unquoted (checked above) so the globs in
+            # cleanup_files (e.g. juniper_mx204_2026-*) still expand; ls -d before
+            # and after the rm shows which files existed and which are now gone.
             deleted_files = []
-            for f in files_to_delete:
-                logger.info(f"[{self.host}] checkStorage — deleting {f}")
-                conn.send_command(f"file delete {f}")
-                deleted_files.append(f)
+            for start in range(0, len(files_to_delete), CLEANUP_BATCH_SIZE):
+                batch = files_to_delete[start:start + CLEANUP_BATCH_SIZE]
+                logger.info(f"[{self.host}] checkStorage — deleting {batch}")
+                paths  = " ".join(batch)
+                output = conn.send_command(
+                    f'start shell command "ls -d {paths}; echo {CLEANUP_MARKER}; '
+                    f'rm -f {paths}; ls -d {paths}"'
+                )
+                if CLEANUP_MARKER not in output:
+                    logger.error(f"[{self.host}] checkStorage — cleanup command gave no usable output:\n{output}")
+                    continue
+                before, _, after = output.rpartition(CLEANUP_MARKER)
+                remaining = set(_listed_paths(after, batch))
+                for path in _listed_paths(before, batch):
+                    if path in remaining:
+                        logger.warning(f"[{self.host}] checkStorage — could not delete {path}")
+                    else:
+                        deleted_files.append(path)
 
             result = {
                 "status":        "low_space_cleaned",
                 "deleted_files": deleted_files,
-                "exception":     "",
+                "exception":     (f"refused unsafe cleanup_files entries: {rejected_files}"
+                                  if rejected_files else ""),
                 "sufficient":    False,
             }
             logger.info(f"[{self.host}] checkStorage — cleanup done: {result}")
@@ -92,21 +138,28 @@ class PreCheck:
             raise
 
     # ─────────────────────────────────────────────────────────────────────────
-    def preBackupDisk(self, conn, logger):
+    def preBackupDisk(self, conn, logger, vmhost_output=""):
         try:
             logger.info(f"[{self.host}] preBackupDisk — vendor: {self.vendor}")
 
-            if self.vendor not in self.accepted_vendors:
+            if not self.vendor_supported:
                 raise ValueError(f"[{self.host}] preBackupDisk — unsupported vendor: {self.vendor}")
 
             if self.vendor == "juniper":
-                output = conn.send_command("show vmhost version", read_timeout=300)
+                # Reuse the show-command collection when it already holds
+                # "show vmhost version"; only fall back to the device otherwise
+                output = vmhost_output or conn.send_command("show vmhost version", read_timeout=300)
 
                 if "set b" in output and "set p" in output:
                     logger.info(f"[{self.host}] preBackupDisk — dual disk, taking snapshot")
+                    # Return as soon as the confirmation (or the prompt) shows up
+                    # instead of waiting out send_command_timing's idle delay
                     cmd    = "request vmhost snapshot"
-                    output = conn.send_command_timing(cmd)
-                    if cmd in output or "yes,no" in output.lower():
+                    output = conn.send_command(cmd, expect_string=r"\[yes,no\]|>", read_timeout=30)
+                    if "yes,no" in output.lower():
+                        # The snapshot runs in the foreground and the prompt only
+                        # comes back when it finishes, so this returns on completion;
+                        # read_timeout is just the ceiling
                         output += conn.send_command("yes", expect_string=r".*>", max_loops=3, read_timeout=900)
                     logger.info(f"[{self.host}] preBackupDisk — snapshot complete")
                     return {
@@ -136,7 +189,7 @@ class PreCheck:
         try:
             logger.info(f"[{self.host}] preBackup — vendor: {self.vendor}")
 
-            if self.vendor not in self.accepted_vendors:
+            if not self.vendor_supported:
                 raise ValueError(f"[{self.host}] preBackup — unsupported vendor: {self.vendor}")
 
             if self.vendor == "juniper":
@@ -169,7 +222,6 @@ class PreCheck:
 
                 for cmd in log_commands:
                     logger.info(f"[{self.host}] preBackup — waiting for command to complete: {cmd}")
-                    print(f"[preBackup] sending: {cmd}")
 
                     output = conn.send_command(
                         cmd,
@@ -181,7 +233,7 @@ class PreCheck:
                 logger.info(f"[{self.host}] preBackup — logs archived, SCP to remote server")
                 src  = f"/var/tmp/{filename}.tgz"
                 dest = f"{self.remote_server}:/var/tmp/{filename}.tgz"
-                if self.scpFile(conn, src, dest, logger):
+                if self.scpFile(conn, src, dest, logger, compress=False):
                     pre_device_log = True
                 else:
                     return {
@@ -221,16 +273,22 @@ class PreCheck:
             }
 
     # ─────────────────────────────────────────────────────────────────────────
-    def scpFile(self, conn, src, dest, logger):
+    def scpFile(self, conn, src, dest, logger, compress=True):
         try:
             logger.info(f"[{self.host}] scpFile — {src} → {dest}")
 
+            # -C only pays off for plain text; on .tgz archives and images it
+            # burns CPU on both ends recompressing data that will not shrink
+            scp_opts = "-C " if compress else ""
             cmd = [
                 "start shell", "\n",
-                f"scp -C {src} {dest}", "\n",
+                f"scp {scp_opts}{src} {dest}", "\n",
                 self.remote_password, "\n",
                 "exit", "\n",
             ]
+            # Timing-based on purpose: the password prompt wording varies by
+            # server, and scp's progress meter prints "%" - the Junos shell
+            # prompt character - so no expect_string can tell done from busy
             output = conn.send_multiline_timing(cmd, read_timeout=1800)
             if "No such file or directory" in output:
                 logger.error(f"[{self.host}] scpFile — no such file: {src}")
@@ -252,13 +310,13 @@ class PreCheck:
         try:
             logger.info(f"[{self.host}] transferImage — {target_image}, vendor: {self.vendor}")
 
-            if self.vendor not in self.accepted_vendors:
+            if not self.vendor_supported:
                 raise ValueError(f"[{self.host}] transferImage — unsupported vendor: {self.vendor}")
 
             if self.vendor == "juniper":
                 src  = f"{self.remote_server}:{image_path}/{target_image}"
                 dest = "/var/tmp/"
-                if not self.scpFile(conn, src, dest, logger):
+                if not self.scpFile(conn, src, dest, logger, compress=False):
                     return {
                         "status":      "failed",
                         "exception":   f"SCP transfer failed for {target_image}",
@@ -286,7 +344,7 @@ class PreCheck:
         try:
             logger.info(f"[{self.host}] verifyChecksum — image: {image}, vendor: {self.vendor}")
 
-            if self.vendor not in self.accepted_vendors:
+            if not self.vendor_supported:
                 raise ValueError(f"[{self.host}] verifyChecksum — unsupported vendor: {self.vendor}")
 
             if self.vendor == "juniper":
@@ -301,7 +359,9 @@ class PreCheck:
                     read_timeout=300
                 )
 
-                match = re.search(r"\.tgz\)\s*=\s*(\S+)", output)
+                # The reference MD5 comes from imageDetails in deviceDetails.yaml,
+                # not a sidecar on the device, so the comparison stays host-side
+                match = CHECKSUM_MD5_PATTERN.search(output)
                 if not match:
                     return {
                         "status":    "failed",
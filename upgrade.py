@@ -1,6 +1,5 @@
 # upgrade.py
 import re
-import os
 import time
 import logging
 import subprocess
@@ -9,7 +8,15 @@ from datetime import datetime
 from netmiko import ConnectHandler
 from netmiko.exceptions import NetmikoTimeoutException, NetmikoAuthenticationException
 from paramiko.ssh_exception import SSHException
-from lib.utilities import device_results, disconnect
+from lib.utilities import device_results, disconnect, tune_transport, make_session_log_path, SSH_KEEPALIVE_SECS
+
+
+UPGRADE_JUNOS_VERSION_PATTERN = re.compile(r"Junos:\s*(?P<version>\S+)", re.IGNORECASE)
+UPGRADE_CISCO_VERSION_PATTERN = re.compile(r"Cisco:\s*(?P<version>\S+)", re.IGNORECASE)
+UPGRADE_VERSION_PATTERNS      = {
+    "juniper": UPGRADE_JUNOS_VERSION_PATTERN,
+    "cisco":   UPGRADE_CISCO_VERSION_PATTERN,
+}
 
 
 # ─────────────────────────────────────────────────────────────────────────────
@@ -23,6 +30,10 @@ class Upgrade:
         self.device          = device
         self.host            = device.get("host")
         self.vendor          = device.get("vendor")
+        self.model           = device.get("model", "unknown")
+        self.device_type     = device.get("device_type")
+        self.username        = device.get("username")
+        self.password        = device.get("password")
         self.accepted_vendor = accepted_vendors
 
     # ─────────────────────────────────────────────────────────────────────────
@@ -32,26 +43,24 @@ class Upgrade:
         try:
             logger.info(f"{self.host}: [Upgrade.connect] Connecting to device")
             logger.debug(
-                f"{self.host}: [Upgrade.connect] device_type={self.device.get('device_type')}, "
-                f"username={self.device.get('username')}"
+                f"{self.host}: [Upgrade.connect] device_type={self.device_type}, "
+                f"username={self.username}"
             )
 
-            session_log_dir = os.path.join(os.getcwd(), "outputs")
-            os.makedirs(session_log_dir, exist_ok=True)
-            session_log_file = (
-                f"{self.vendor}_{self.device.get('model', 'unknown')}_"
-                f"{datetime.now().strftime('%Y-%m-%d_%H-%M-%S')}_upgrade.log"
+            session_log_path = make_session_log_path(
+                self.vendor, self.model, suffix="_upgrade"
             )
-            session_log_path = os.path.join(session_log_dir, session_log_file)
             logger.debug(f"{self.host}: [Upgrade.connect] Session log → {session_log_path}")
 
             conn = ConnectHandler(
-                device_type = self.device.get("device_type"),
+                device_type = self.device_type,
                 host        = self.host,
-                username    = self.device.get("username"),
-                password    = self.device.get("password"),
+                username    = self.username,
+                password    = self.password,
                 session_log = session_log_path,
+                keepalive   = SSH_KEEPALIVE_SECS,
             )
+            tune_transport(conn)
 
             # Store into device_results so the rest of the pipeline sees it
             device_results[self.device_key]["conn"]                            = conn
@@ -189,7 +198,7 @@ class Upgrade:
                 cmd    = f"request vmhost software add /var/tmp/{target_image} no-validate"
                 logger.debug(f"{self.host}: [imageUpgrade] Sending: {cmd} (read_timeout=900s)")
                 output = conn.send_command(cmd, read_timeout=900)
-                print(f"[imageUpgrade] install output: {output}")
+                logger.debug(f"{self.host}: [imageUpgrade] install output: {output}")
 
                 if not output:
                     msg = f"{target_image} is not installed. Please check imageUpgrade()"
@@ -210,12 +219,10 @@ class Upgrade:
             if reboot_system:
                 logger.info(f"{self.host}: Device rebooted, waiting for SSH to come back")
                 conn, output = self.reconnect_and_verify(hop_index, logger)
-                print(f"[imageUpgrade] post-reboot output: {output}")
+                logger.debug(f"{self.host}: [imageUpgrade] post-reboot output: {output}")
 
-                if self.vendor == "juniper":
-                    version_pattern = re.search(r"Junos:\s*(?P<version>\S+)", output, re.IGNORECASE)
-                if self.vendor == "cisco":
-                    version_pattern = re.search(r"Cisco:\s*(?P<version>\S+)", output, re.IGNORECASE)
+                pattern         = UPGRADE_VERSION_PATTERNS.get(self.vendor)
+                version_pattern = pattern.search(output) if pattern else None
 
                 if version_pattern:
                     new_version = version_pattern.group("version")
@@ -308,7 +315,7 @@ class Upgrade:
             logger.info(f"{self.host}: Rebooting the system...")
             print(f"[systemReboot] Running {command}...")
             output = conn.send_multiline_timing(command)
-            print(f"[systemReboot] reboot output: {output}")
+            logger.debug(f"{self.host}: [systemReboot] reboot output: {output}")
 
             logger.info(f"{self.host}: Waiting for device to reboot... (900s)")
             print(f"[systemReboot] sleeping 900s...")
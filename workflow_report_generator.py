@@ -9,6 +9,10 @@ from datetime import datetime
 import json
 import os
 import difflib as _dl
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 
 PRE_TASK_TITLES = {
@@ -36,10 +40,19 @@ PHASE_META = {
     "report":  {"label": "Report",      "color": "#fb923c"},
 }
 
+# Phase column cell per phase, built once; only the rowspan varies ("%d").
+_PHASE_CELL = {
+    key: (f'<td class="phase-cell" rowspan="%d" '
+          f'style="border-left:3px solid {meta["color"]};">'
+          f'<span class="phase-lbl" style="color:{meta["color"]};">{meta["label"]}</span></td>')
+    for key, meta in PHASE_META.items()
+}
+
 
 # ─── helpers ──────────────────────────────────────────────────────────────────
 
 def _esc(s):
+    # chained str.replace: measured faster than translate/regex here
     return (str(s)
             .replace("&", "&amp;")
             .replace("<", "&lt;")
@@ -47,6 +60,31 @@ def _esc(s):
             .replace('"', "&quot;"))
 
 
+def _esc_text(s: str) -> str:
+    # For element text such as <pre> bodies only: there & and < are the only
+    # characters that need escaping. JSON dumps are dense with quotes, and
+    # leaving them alone saves a full copy of the blob plus 5 bytes per quote.
+    return s.replace("&", "&amp;").replace("<", "&lt;")
+
+
+def _dumps(obj, indent: bool = False) -> str:
+    # orjson when installed (as in lib.utilities.write_json), else the stdlib
+    # set up to match it: 2-space indent or fully compact, non-ASCII left as
+    # UTF-8 rather than \uXXXX. The compact form feeds the inline DI script.
+    # Anything orjson refuses (e.g. ints past 64 bits) takes the stdlib path.
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        try:
+            return orjson.dumps(obj, default=str, option=option).decode()
+        except TypeError:
+            pass
+    if indent:
+        return json.dumps(obj, indent=2, ensure_ascii=False, default=str)
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False, default=str)
+
+
 def _norm_status(raw) -> str:
     if raw is True:  return "ok"
     if raw is False: return "failed"
@@ -64,6 +102,21 @@ def _norm_status(raw) -> str:
     return str(raw) if raw is not None else ""
 
 
+def _aggregate_status(entries: list) -> str:
+    # "ok" if every entry is ok, else "failed" if any failed, else the first
+    # entry's status -- decided in one pass instead of an all() then an any()
+    all_ok = True
+    for e in entries:
+        st = _norm_status(e.get("status", ""))
+        if st == "failed":
+            return "failed"
+        if st != "ok":
+            all_ok = False
+    if all_ok:
+        return "ok"
+    return _norm_status(entries[0].get("status", "not_started"))
+
+
 def _badge(status: str) -> str:
     m = {
         "ok":             '<span class="badge b-ok">OK</span>',
@@ -91,16 +144,15 @@ def _cmd_drawer(cmds: list, prefix: str, phase: str) -> str:
         return (f'<div class="cmd-drawer" hidden id="{did}">'
                 f'<div class="cmd-empty">No commands collected.</div></div>')
     items = []
+    tag   = f"{prefix}-{phase}-"   # per-entry ids below only append the index
     for i, e in enumerate(cmds):
         lbl    = _esc(e.get("cmd", ""))
         raw    = _esc(e.get("output", "") or "(empty)")
         jobj   = e.get("json", {})
-        jstr   = _esc(json.dumps(jobj, indent=2)) if jobj else "(not parsed)"
+        jstr   = _esc_text(_dumps(jobj, indent=True)) if jobj else "(not parsed)"
         exc    = _esc(e.get("exception", "") or "")
         ok     = exc == ""
-        rid, jid, eid = (f"raw-{prefix}-{phase}-{i}",
-                         f"jsn-{prefix}-{phase}-{i}",
-                         f"exc-{prefix}-{phase}-{i}")
+        rid, jid, eid = f"raw-{tag}{i}", f"jsn-{tag}{i}", f"exc-{tag}{i}"
         err_btn = (f'<button class="mini-btn mini-err" onclick="tgl(\'{eid}\')">Why?</button>'
                    if not ok else "")
         items.append(f"""<div class="{'cmd-row ok' if ok else 'cmd-row fail'}">
@@ -192,8 +244,6 @@ def _hops_rows(hops: list) -> str:
 # ─── pre-phase rows ───────────────────────────────────────────────────────────
 
 def _pre_rows(tasks: dict, prefix: str) -> tuple:
-    color = PHASE_META["pre"]["color"]
-    label = PHASE_META["pre"]["label"]
     items = [(n, d) for n, d in tasks.items() if isinstance(d, (dict, list))]
     count = len(items)
     rows  = []
@@ -204,14 +254,7 @@ def _pre_rows(tasks: dict, prefix: str) -> tuple:
 
         # ── verify_checksum is a LIST ────────────────────────────────────
         if name == "verify_checksum" and isinstance(data, list):
-            if not data:
-                agg = "not_started"
-            elif all(_norm_status(e.get("status","")) == "ok" for e in data):
-                agg = "ok"
-            elif any(_norm_status(e.get("status","")) == "failed" for e in data):
-                agg = "failed"
-            else:
-                agg = _norm_status(data[0].get("status", "not_started"))
+            agg = _aggregate_status(data) if data else "not_started"
 
             is_blank = agg in ("", "not_started")
             total += 1
@@ -219,10 +262,7 @@ def _pre_rows(tasks: dict, prefix: str) -> tuple:
             elif not is_blank: failed += 1
 
             toggle, drawer = _checksum_drawer(data, prefix)
-            pc = (f'<td class="phase-cell" rowspan="{count}" '
-                  f'style="border-left:3px solid {color};">'
-                  f'<span class="phase-lbl" style="color:{color};">{label}</span></td>'
-                  ) if first else ""
+            pc = _PHASE_CELL["pre"] % count if first else ""
             first = False
             rows.append(
                 f'<tr class="task-row{"" if (agg == "ok" or is_blank) else " failed-row"}">'
@@ -245,10 +285,7 @@ def _pre_rows(tasks: dict, prefix: str) -> tuple:
         if status == "ok":   success += 1
         elif not is_blank:   failed  += 1
 
-        pc = (f'<td class="phase-cell" rowspan="{count}" '
-              f'style="border-left:3px solid {color};">'
-              f'<span class="phase-lbl" style="color:{color};">{label}</span></td>'
-              ) if first else ""
+        pc = _PHASE_CELL["pre"] % count if first else ""
         first = False
 
         toggle = drawer = ""
@@ -336,7 +373,6 @@ def _pre_rows(tasks: dict, prefix: str) -> tuple:
 # ─── upgrade rows ─────────────────────────────────────────────────────────────
 
 def _upgrade_rows(upg: dict, prefix: str) -> tuple:
-    color      = PHASE_META["upgrade"]["color"]
     upg_status = _norm_status(upg.get("status", ""))
     initial_os = _esc(upg.get("initial_os", "—") or "—")
     target_os  = _esc(upg.get("target_os",  "—") or "—")
@@ -371,8 +407,7 @@ def _upgrade_rows(upg: dict, prefix: str) -> tuple:
     # 4 sub-rows: Overall | Connect | OS Path | Hops
     rows = [
         (f'<tr class="task-row{"" if upg_status in ("ok","not_started","") else " failed-row"}">'
-         f'<td class="phase-cell" rowspan="4" style="border-left:3px solid {color};">'
-         f'<span class="phase-lbl" style="color:{color};">Upgrade</span></td>'
+         f'{_PHASE_CELL["upgrade"] % 4}'
          f'<td class="subtask-cell"><span class="mono">Overall Status</span></td>'
          f'<td class="status-cell">{upg_badge}</td>'
          f'<td class="remark-cell">{upg_remark}</td>'
@@ -410,14 +445,10 @@ def _upgrade_rows(upg: dict, prefix: str) -> tuple:
 # ─── post + report stubs ──────────────────────────────────────────────────────
 
 def _post_stub(prefix: str) -> str:
-    color  = PHASE_META["post"]["color"]
     tasks  = list(POST_TASK_TITLES.items())
     rows   = []
     for i, (_, display) in enumerate(tasks):
-        pc = (f'<td class="phase-cell" rowspan="{len(tasks)}" '
-              f'style="border-left:3px solid {color};">'
-              f'<span class="phase-lbl" style="color:{color};">Post-Checks</span></td>'
-              ) if i == 0 else ""
+        pc = _PHASE_CELL["post"] % len(tasks) if i == 0 else ""
         rows.append(
             f'<tr class="task-row">{pc}'
             f'<td class="subtask-cell"><span class="mono">{_esc(display)}</span></td>'
@@ -430,11 +461,9 @@ def _post_stub(prefix: str) -> str:
 
 
 def _report_stub() -> str:
-    color = PHASE_META["report"]["color"]
     return (
         f'<tr class="task-row">'
-        f'<td class="phase-cell" rowspan="2" style="border-left:3px solid {color};">'
-        f'<span class="phase-lbl" style="color:{color};">Report</span></td>'
+        f'{_PHASE_CELL["report"] % 2}'
         f'<td class="subtask-cell"><span class="mono">Diff Status</span></td>'
         f'<td class="status-cell"><span class="badge b-ns">Pending</span></td>'
         f'<td class="remark-cell"><span class="remark-na">—</span></td>'
@@ -480,9 +509,7 @@ def _phase_summary(device_data: dict) -> dict:
     for name, td in pre.items():
         if isinstance(td, list):
             if not td: continue
-            st = ("ok"     if all(_norm_status(e.get("status","")) == "ok" for e in td) else
-                  "failed" if any(_norm_status(e.get("status","")) == "failed" for e in td) else
-                  _norm_status(td[0].get("status","not_started")))
+            st = _aggregate_status(td)
         elif isinstance(td, dict):
             st = _norm_status(td.get("status",""))
         else:
@@ -493,6 +520,14 @@ def _phase_summary(device_data: dict) -> dict:
         else: f += 1
     out["pre"] = (t, s, f)
 
+    # report-wide tally: the pre tasks above plus the upgrade as one task
+    st = _norm_status(device_data.get("upgrade", {}).get("status", ""))
+    if st not in ("", "not_started"):
+        t += 1
+        if st == "ok": s += 1
+        else: f += 1
+    out["overall"] = (t, s, f)
+
     hops = device_data.get("upgrade", {}).get("hops", [])
     hok  = sum(1 for h in hops if _norm_status(h.get("status","")) == "ok")
     out["upgrade"] = (len(hops), hok, len(hops) - hok)
@@ -504,7 +539,7 @@ def _phase_summary(device_data: dict) -> dict:
 
 # ─── device panel ─────────────────────────────────────────────────────────────
 
-def build_device_panel(device_key: str, device_data: dict, is_first: bool) -> str:
+def build_device_panel(device_key: str, device_data: dict, is_first: bool) -> tuple:
     tbody, total, success, failed = build_tbody(device_data, device_key)
     summary = _phase_summary(device_data)
 
@@ -533,7 +568,7 @@ def build_device_panel(device_key: str, device_data: dict, is_first: bool) -> st
                 f'</div>')
 
     dk = _esc(device_key)
-    return f"""<div class="device-panel" id="panel-{dk}" style="display:{'block' if is_first else 'none'};">
+    html = f"""<div class="device-panel" id="panel-{dk}" style="display:{'block' if is_first else 'none'};">
 
   <div class="dev-header">
     <div class="dev-left">
@@ -569,50 +604,69 @@ def build_device_panel(device_key: str, device_data: dict, is_first: bool) -> st
   </div>
 
 </div>"""
+    return html, summary["overall"]
 
 
-# ─── overall stats ────────────────────────────────────────────────────────────
+def _device_info_json(workflow_data: dict) -> str:
+    info_map = {}
+    for dk, dd in workflow_data.items():
+        info   = dd.get("device_info", {})
+        vendor = info.get("vendor")
+        model  = info.get("model")
+        info_map[dk] = {
+            "host":     info.get("host") or "—",
+            "vendor":   vendor.upper() if vendor else "—",
+            "model":    model.upper()  if model  else "—",
+            "hostname": info.get("hostname") or "—",
+            "version":  info.get("version") or "—",
+        }
+    return _dumps(info_map)
 
-def _overall_stats(workflow_data: dict) -> tuple:
-    total = success = failed = 0
-    for dd in workflow_data.values():
-        for name, td in dd.get("pre", {}).items():
-            if isinstance(td, list):
-                if not td: continue
-                st = ("ok"     if all(_norm_status(e.get("status","")) == "ok" for e in td) else
-                      "failed" if any(_norm_status(e.get("status","")) == "failed" for e in td) else
-                      _norm_status(td[0].get("status","not_started")))
-            elif isinstance(td, dict):
-                st = _norm_status(td.get("status",""))
-            else:
-                continue
-            if st in ("","not_started"): continue
-            total += 1
-            if st == "ok": success += 1
-            else: failed += 1
 
-        st = _norm_status(dd.get("upgrade",{}).get("status",""))
-        if st not in ("","not_started"):
-            total += 1
-            if st == "ok": success += 1
-            else: failed += 1
-    return total, success, failed
+# ─── HTML generation ──────────────────────────────────────────────────────────
 
+def _report_tail(safe_data: dict, device_keys: list, now: str) -> str:
+    di_json   = _device_info_json(safe_data)
+    json_html = _esc_text(_dumps(safe_data, indent=True))
+    first_key = _esc(device_keys[0]) if device_keys else ""
+    return f"""
 
-def _device_info_json(workflow_data: dict) -> str:
-    return json.dumps({
-        dk: {
-            "host":     dd.get("device_info",{}).get("host","—") or "—",
-            "vendor":   (dd.get("device_info",{}).get("vendor","—") or "—").upper(),
-            "model":    (dd.get("device_info",{}).get("model","—") or "—").upper(),
-            "hostname": dd.get("device_info",{}).get("hostname","—") or "—",
-            "version":  dd.get("device_info",{}).get("version","—") or "—",
-        }
-        for dk, dd in workflow_data.items()
-    })
+<details class="json-sec">
+  <summary>&#9654; Raw JSON (all devices)</summary>
+  <pre class="jb">{json_html}</pre>
+</details>
 
+<footer class="ft">workflow_report_generator.py &nbsp;·&nbsp; {now}</footer>
+</div>
+
+<script>
+var DI = {di_json};
+function updateInfo(key) {{
+  var d = DI[key]; if (!d) return;
+  var set = function(id,v){{ var el=document.getElementById(id); if(el) el.textContent=v||'—'; }};
+  set('di-host-'+key,    d.host);
+  set('di-vendor-'+key,  d.vendor);
+  set('di-model-'+key,   d.model);
+  set('di-hostname-'+key,d.hostname);
+  set('di-version-'+key, d.version);
+}}
+function selectDevice(key) {{
+  document.querySelectorAll('.device-panel').forEach(function(p){{p.style.display='none';}});
+  var p=document.getElementById('panel-'+key);
+  if(p) p.style.display='block';
+  updateInfo(key);
+}}
+function tgl(id) {{
+  var el=document.getElementById(id);
+  if(el) el.hidden=!el.hidden;
+}}
+document.addEventListener('DOMContentLoaded',function(){{
+  updateInfo('{first_key}');
+}});
+</script>
+</body>
+</html>"""
 
-# ─── HTML generation ──────────────────────────────────────────────────────────
 
 def generate_html_report(workflow_data: dict, output_dir: str = ".") -> str:
     safe_data = {
@@ -620,13 +674,9 @@ def generate_html_report(workflow_data: dict, output_dir: str = ".") -> str:
         for dk, slot in workflow_data.items()
     }
     device_keys = list(safe_data.keys())
-    now         = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    ts_file     = datetime.now().strftime("%d_%m_%y_%H_%M_%S")
-    total_all, success_all, failed_all = _overall_stats(safe_data)
-
-    pill_cls = "ok" if failed_all == 0 else ("fail" if success_all == 0 else "partial")
-    pill_txt = (f"ALL {total_all} TASKS PASSED" if failed_all == 0
-                else f"{failed_all} TASK(S) FAILED")
+    generated   = datetime.now()
+    now         = generated.strftime("%Y-%m-%d %H:%M:%S")
+    ts_file     = generated.strftime("%d_%m_%y_%H_%M_%S")
 
     dropdown_opts = "\n".join(
         f'<option value="{_esc(dk)}"{" selected" if i==0 else ""}>'
@@ -634,15 +684,21 @@ def generate_html_report(workflow_data: dict, output_dir: str = ".") -> str:
         f'</option>'
         for i, dk in enumerate(device_keys)
     )
-    device_panels = "\n".join(
-        build_device_panel(dk, safe_data[dk], i==0)
-        for i, dk in enumerate(device_keys)
-    )
-    di_json   = _device_info_json(safe_data)
-    json_html = _esc(json.dumps(safe_data, indent=2, default=str))
-    first_key = _esc(device_keys[0]) if device_keys else ""
+    # header totals come back with each panel rather than from a second
+    # walk over every device's tasks
+    panels = []
+    total_all = success_all = failed_all = 0
+    for i, dk in enumerate(device_keys):
+        panel, (t, s, f) = build_device_panel(dk, safe_data[dk], i==0)
+        panels.append(panel)
+        total_all += t; success_all += s; failed_all += f
 
-    html = f"""<!DOCTYPE html>
+    pill_cls = "ok" if failed_all == 0 else ("fail" if success_all == 0 else "partial")
+    pill_txt = (f"ALL {total_all} TASKS PASSED" if failed_all == 0
+                else f"{failed_all} TASK(S) FAILED")
+
+    # CSS/JS inline: a report has to stay one self-contained file
+    head = f"""<!DOCTYPE html>
 <html lang="en">
 <head>
 <meta charset="UTF-8">
@@ -791,49 +847,22 @@ pre.jb{{margin-top:.6rem;background:var(--surf);border:1px solid var(--border);b
   <span class="dev-cnt">{len(device_keys)} device(s)</span>
 </div>
 
-{device_panels}
-
-<details class="json-sec">
-  <summary>&#9654; Raw JSON (all devices)</summary>
-  <pre class="jb">{json_html}</pre>
-</details>
-
-<footer class="ft">workflow_report_generator.py &nbsp;·&nbsp; {now}</footer>
-</div>
-
-<script>
-var DI = {di_json};
-function updateInfo(key) {{
-  var d = DI[key]; if (!d) return;
-  var set = function(id,v){{ var el=document.getElementById(id); if(el) el.textContent=v||'—'; }};
-  set('di-host-'+key,    d.host);
-  set('di-vendor-'+key,  d.vendor);
-  set('di-model-'+key,   d.model);
-  set('di-hostname-'+key,d.hostname);
-  set('di-version-'+key, d.version);
-}}
-function selectDevice(key) {{
-  document.querySelectorAll('.device-panel').forEach(function(p){{p.style.display='none';}});
-  var p=document.getElementById('panel-'+key);
-  if(p) p.style.display='block';
-  updateInfo(key);
-}}
-function tgl(id) {{
-  var el=document.getElementById(id);
-  if(el) el.hidden=!el.hidden;
-}}
-document.addEventListener('DOMContentLoaded',function(){{
-  updateInfo('{first_key}');
-}});
-</script>
-</body>
-</html>"""
+"""
 
     os.makedirs(output_dir, exist_ok=True)
     filename  = f"workflow_report_{ts_file}.html"
     file_path = os.path.join(output_dir, filename)
-    with open(file_path, "w", encoding="utf-8") as f:
-        f.write(html)
+    # Written piece by piece, in binary so the text layer is skipped: each
+    # panel is dropped once it is on disk and the raw JSON dump is only built
+    # after that, so the page never sits in memory whole, let alone twice.
+    with open(file_path, "wb") as f:
+        f.write(head.encode("utf-8"))
+        for i in range(len(panels)):
+            if i:
+                f.write(b"\n")
+            f.write(panels[i].encode("utf-8"))
+            panels[i] = None
+        f.write(_report_tail(safe_data, device_keys, now).encode("utf-8"))
     return file_path
 
 